@@ -0,0 +1,46 @@
+"""Measures how many query builders can be created per second.
+
+Run from the root of the repository:
+
+    python benchmarks/builder_creation.py
+"""
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from src.masoniteorm.models import Model  # noqa: E402
+from src.masoniteorm.query import QueryBuilder  # noqa: E402
+
+NUMBER = 20000
+REPEAT = 5
+
+
+class User(Model):
+    __connection__ = "dev"
+
+
+def measure(name, statement):
+    best = min(timeit.repeat(statement, number=NUMBER, repeat=REPEAT))
+    print(
+        f"  {name:<24} {NUMBER / best:>10,.0f} builders/s  {best / NUMBER * 1e6:>6.2f} us"
+    )
+
+
+if __name__ == "__main__":
+    builder = (
+        QueryBuilder(table="users")
+        .select("id", "name")
+        .where("active", 1)
+        .where_in("id", [1, 2, 3])
+        .order_by("name")
+    )
+
+    print("builder creation:")
+    measure("QueryBuilder()", lambda: QueryBuilder(table="users"))
+    measure("Model.where()", lambda: User.where("id", 1))
+    measure("builder.new()", builder.new)
+    measure("builder.new_from_builder()", builder.new_from_builder)
+    measure("builder.clone()", builder.clone)
@@ -0,0 +1,55 @@
+"""Measures how the cost of compiling large statements grows with their size.
+
+Run from the root of the repository:
+
+    python benchmarks/grammar_compile.py
+
+The time per row should stay about the same as the statements grow. A time per
+row growing with the size of the statement means compiling is no longer linear.
+"""
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from src.masoniteorm.connections import MySQLConnection  # noqa: E402
+from src.masoniteorm.query import QueryBuilder  # noqa: E402
+from src.masoniteorm.query.grammars import MySQLGrammar  # noqa: E402
+
+SIZES = (2500, 5000, 10000, 20000, 40000)
+REPEAT = 5
+
+
+def builder():
+    return QueryBuilder(
+        grammar=MySQLGrammar, connection_class=MySQLConnection, table="users"
+    )
+
+
+def bulk_insert(size):
+    rows = [
+        {"name": f"user {i}", "email": f"user{i}@example.com", "age": i}
+        for i in range(size)
+    ]
+    return lambda: builder().bulk_create(rows, query=True).to_native()
+
+
+def where_in(size):
+    ids = list(range(size))
+    return lambda: builder().where_in("id", ids).to_native()
+
+
+def measure(name, make_statement):
+    print(f"{name}:")
+    for size in SIZES:
+        best = min(timeit.repeat(make_statement(size), number=1, repeat=REPEAT))
+        print(
+            f"  {size:>6} rows  {best * 1000:>8.2f} ms  {best / size * 1e6:>6.2f} us/row"
+        )
+
+
+if __name__ == "__main__":
+    measure("bulk insert", bulk_insert)
+    measure("where in", where_in)
@@ -0,0 +1,84 @@
+"""Measures how many rows per second Model.hydrate turns into models.
+
+The rows are read once from a temporary SQLite database so only hydration is timed.
+Run from the root of the repository:
+
+    python benchmarks/model_hydrate.py
+"""
+
+import os
+import sqlite3
+import sys
+import tempfile
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from src.masoniteorm.connections import SQLiteConnection  # noqa: E402
+from src.masoniteorm.models import Model  # noqa: E402
+from src.masoniteorm.query import QueryBuilder  # noqa: E402
+
+ROWS = 10000
+REPEAT = 5
+
+
+class User(Model):
+    __dates__ = ["verified_at"]
+    __casts__ = {"is_admin": "bool", "age": "int"}
+
+
+def make_fixture():
+    database = os.path.join(tempfile.mkdtemp(), "hydrate.sqlite3")
+    connection = sqlite3.connect(database)
+    connection.execute(
+        "CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT, email TEXT, age INTEGER, "
+        "is_admin INTEGER, verified_at TEXT, created_at TEXT, updated_at TEXT)"
+    )
+    connection.executemany(
+        "INSERT INTO users VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+        [
+            (
+                i,
+                f"user-{i}",
+                f"user-{i}@example.com",
+                20 + i % 50,
+                i % 2,
+                "2020-01-01 10:00:00",
+                "2020-01-01 10:00:00",
+                "2020-01-02 10:00:00",
+            )
+            for i in range(1, ROWS + 1)
+        ],
+    )
+    connection.commit()
+    connection.close()
+
+    details = {
+        "default": "hydrate",
+        "hydrate": {"driver": "sqlite", "database": database},
+    }
+    rows = QueryBuilder(
+        connection="hydrate", table="users", connection_details=details
+    ).get()
+    SQLiteConnection.close_thread_connections()
+    return rows
+
+
+def measure(name, statement):
+    best = min(timeit.repeat(statement, number=1, repeat=REPEAT))
+    print(f"  {name:<24} {ROWS / best:>10,.0f} rows/s  {best / ROWS * 1e6:>6.2f} us")
+
+
+if __name__ == "__main__":
+    rows = make_fixture()
+
+    print(f"model hydration ({ROWS:,} rows):")
+    measure("Model.hydrate(rows)", lambda: User.hydrate(rows))
+    measure(
+        "hydrate + read columns",
+        lambda: [(user.name, user.age, user.is_admin) for user in User.hydrate(rows)],
+    )
+    measure(
+        "hydrate + serialize",
+        lambda: [user.serialize() for user in User.hydrate(rows)],
+    )
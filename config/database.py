@@ -67,6 +67,12 @@ DATABASES = {
         'prefix': '',
         'log_queries': True
     },
+    'async_dev': {
+        'driver': 'aiosqlite',
+        'database': 'orm.sqlite3',
+        'prefix': '',
+        'log_queries': True
+    },
     'mssql': {
         'driver': 'mssql',
         'host': os.getenv('MSSQL_DATABASE_HOST'),
@@ -0,0 +1,351 @@
+import asyncio
+import inspect
+import weakref
+
+from ..exceptions import ConnectionPoolExhausted
+
+
+async def _maybe_await(result):
+    if inspect.isawaitable(result):
+        return await result
+
+    return result
+
+
+class AsyncConnectionPool:
+    """A bounded pool of asyncio driver connections.
+
+    This is the asyncio counterpart of ConnectionPool. Driver connections are bound to
+    the event loop that opened them so pools are registered per event loop and per
+    connection name. Waiting for a free connection suspends the task instead of
+    blocking the thread.
+    """
+
+    # Maps an event loop to the pools registered on it by connection name
+    _pools = weakref.WeakKeyDictionary()
+
+    def __init__(
+        self,
+        factory,
+        min_size=0,
+        max_size=10,
+        timeout=30,
+        max_lifetime=None,
+        idle_timeout=None,
+        pre_ping=True,
+        ping=None,
+        reset=None,
+        close=None,
+    ):
+        """AsyncConnectionPool initializer
+
+        Arguments:
+            factory {callable} -- Coroutine function that opens a new driver connection.
+
+        Keyword Arguments:
+            min_size {int} -- Connections kept open even when idle. (default: {0})
+            max_size {int} -- Maximum number of open connections. (default: {10})
+            timeout {int|float} -- Seconds to wait for a free connection on checkout. (default: {30})
+            max_lifetime {int|float} -- Seconds after which a connection is recycled. (default: {None})
+            idle_timeout {int|float} -- Seconds after which idle connections above min_size are closed. (default: {None})
+            pre_ping {bool} -- Whether to health check connections on checkout. (default: {True})
+            ping {callable} -- Raises if the given connection is no longer usable. (default: {None})
+            reset {callable} -- Resets the session state of a connection being returned. (default: {None})
+            close {callable} -- Closes a connection. (default: {None})
+        """
+        if max_size < 1:
+            raise ValueError("The connection pool 'max' size must be at least 1")
+
+        self.factory = factory
+        self.min_size = min(min_size, max_size)
+        self.max_size = max_size
+        self.timeout = timeout
+        self.max_lifetime = max_lifetime
+        self.idle_timeout = idle_timeout
+        self.pre_ping = pre_ping
+        self._ping = ping
+        self._reset = reset
+        self._close = close or (lambda connection: connection.close())
+
+        self._loop = asyncio.get_event_loop()
+        self._condition = asyncio.Condition()
+        # Idle connections stored as [connection, created_at, last_used_at]
+        self._idle = []
+        # Checked out connections mapped by id to their created_at time
+        self._checked_out = {}
+        self._size = 0
+
+        self._waiting = 0
+        self._checkouts = 0
+        self._timeouts = 0
+        self._discarded = 0
+
+    @classmethod
+    def from_config(cls, factory, config, ping=None, reset=None, close=None):
+        """Creates a pool from the 'pool' dictionary of a connection entry in DATABASES."""
+        return cls(
+            factory,
+            min_size=int(config.get("min", 0)),
+            max_size=int(config.get("max", 10)),
+            timeout=config.get("timeout", 30),
+            max_lifetime=config.get("max_lifetime"),
+            idle_timeout=config.get("idle_timeout"),
+            pre_ping=config.get("pre_ping", True),
+            ping=ping,
+            reset=reset,
+            close=close,
+        )
+
+    @classmethod
+    def get_pool(cls, name):
+        return cls._pools.get(asyncio.get_event_loop(), {}).get(name)
+
+    @classmethod
+    def register(cls, name, make_pool):
+        """Gets the pool registered to a connection name on the running event loop,
+        creating it if it does not exist yet.
+
+        Arguments:
+            name {string} -- The connection name.
+            make_pool {callable} -- Called to build the pool the first time it is requested.
+
+        Returns:
+            AsyncConnectionPool
+        """
+        pools = cls._pools.setdefault(asyncio.get_event_loop(), {})
+        if name not in pools:
+            pools[name] = make_pool()
+
+        return pools[name]
+
+    @classmethod
+    async def close_all(cls):
+        """Closes every pool registered on the running event loop."""
+        pools = cls._pools.pop(asyncio.get_event_loop(), {})
+        for pool in pools.values():
+            await pool.close()
+
+    def _now(self):
+        return self._loop.time()
+
+    async def fill(self):
+        """Opens connections until the pool holds at least min_size connections."""
+        while True:
+            async with self._condition:
+                if self._size >= self.min_size:
+                    return self
+                self._size += 1
+
+            try:
+                connection = await self.factory()
+            except Exception:
+                await self._discard_slot()
+                raise
+
+            now = self._now()
+            async with self._condition:
+                self._idle.append([connection, now, now])
+                self._condition.notify()
+
+    async def acquire(self, timeout=None):
+        """Checks out a connection, waiting for one to be released if the pool is exhausted.
+
+        Keyword Arguments:
+            timeout {int|float} -- Overrides the pool checkout timeout. (default: {None})
+
+        Raises:
+            ConnectionPoolExhausted: Raised when no connection becomes available in time.
+
+        Returns:
+            A driver connection.
+        """
+        if self._size < self.min_size:
+            await self.fill()
+
+        timeout = self.timeout if timeout is None else timeout
+        deadline = None if timeout is None else self._now() + timeout
+
+        while True:
+            entry = None
+            async with self._condition:
+                expired = self._reap()
+                while entry is None:
+                    if self._idle:
+                        entry = self._idle.pop()
+                    elif self._size < self.max_size:
+                        self._size += 1
+                        break
+                    else:
+                        remaining = None if deadline is None else deadline - self._now()
+                        if remaining is not None and remaining <= 0:
+                            self._timeouts += 1
+                            raise ConnectionPoolExhausted(
+                                f"Could not acquire a connection within {timeout} seconds. "
+                                f"All {self.max_size} connections are in use."
+                            )
+                        self._waiting += 1
+                        try:
+                            await asyncio.wait_for(self._condition.wait(), remaining)
+                        except asyncio.TimeoutError:
+                            pass
+                        finally:
+                            self._waiting -= 1
+                        expired += self._reap()
+
+            for connection in expired:
+                await self._close_quietly(connection)
+
+            if entry is None:
+                return await self._open()
+
+            connection, created_at, last_used_at = entry
+            if self._is_expired(created_at) or not await self._is_healthy(connection):
+                await self._close_quietly(connection)
+                await self._discard_slot()
+                # Failed pings count against the checkout timeout as well
+                if deadline is not None and self._now() >= deadline:
+                    async with self._condition:
+                        self._timeouts += 1
+                    raise ConnectionPoolExhausted(
+                        f"Could not acquire a connection within {timeout} seconds. "
+                        f"All {self.max_size} connections are in use."
+                    )
+                continue
+
+            async with self._condition:
+                self._checked_out[id(connection)] = created_at
+                self._checkouts += 1
+
+            return connection
+
+    async def release(self, connection):
+        """Returns a checked out connection to the pool.
+
+        Arguments:
+            connection -- A driver connection previously returned by 'acquire'.
+        """
+        async with self._condition:
+            created_at = self._checked_out.pop(id(connection), None)
+
+        if created_at is None:
+            return
+
+        if self._is_expired(created_at) or not await self._reset_connection(connection):
+            await self._close_quietly(connection)
+            await self._discard_slot()
+            return
+
+        async with self._condition:
+            self._idle.append([connection, created_at, self._now()])
+            self._condition.notify()
+
+    async def close(self):
+        """Closes every idle connection. Checked out connections are closed when released."""
+        async with self._condition:
+            idle = [entry[0] for entry in self._idle]
+            self._idle = []
+            self._size -= len(idle)
+            self.max_lifetime = 0
+
+        for connection in idle:
+            await self._close_quietly(connection)
+
+    def stats(self):
+        """Returns a snapshot of the pool usage.
+
+        Returns:
+            dict
+        """
+        return {
+            "size": self._size,
+            "idle": len(self._idle),
+            "checked_out": len(self._checked_out),
+            "waiting": self._waiting,
+            "min": self.min_size,
+            "max": self.max_size,
+            "checkouts": self._checkouts,
+            "timeouts": self._timeouts,
+            "discarded": self._discarded,
+        }
+
+    async def _open(self):
+        try:
+            connection = await self.factory()
+        except Exception:
+            await self._discard_slot()
+            raise
+
+        async with self._condition:
+            self._checked_out[id(connection)] = self._now()
+            self._checkouts += 1
+
+        return connection
+
+    def _reap(self):
+        """Removes idle connections that have outlived idle_timeout or max_lifetime.
+
+        Must be called while holding the pool condition. Returns the removed
+        connections so they can be closed once the condition is released.
+        """
+        if not self._idle or (self.idle_timeout is None and self.max_lifetime is None):
+            return []
+
+        now = self._now()
+        kept = []
+        expired = []
+        for entry in self._idle:
+            connection, created_at, last_used_at = entry
+            idle_too_long = (
+                self.idle_timeout is not None
+                and now - last_used_at > self.idle_timeout
+                and self._size > self.min_size
+            )
+            if idle_too_long or self._is_expired(created_at, now):
+                expired.append(connection)
+                self._size -= 1
+                self._discarded += 1
+            else:
+                kept.append(entry)
+
+        self._idle = kept
+        return expired
+
+    async def _discard_slot(self):
+        async with self._condition:
+            self._size -= 1
+            self._discarded += 1
+            self._condition.notify()
+
+    def _is_expired(self, created_at, now=None):
+        if self.max_lifetime is None:
+            return False
+
+        return (now or self._now()) - created_at >= self.max_lifetime
+
+    async def _is_healthy(self, connection):
+        if not self.pre_ping or not self._ping:
+            return True
+
+        try:
+            await _maybe_await(self._ping(connection))
+        except Exception:
+            return False
+
+        return True
+
+    async def _reset_connection(self, connection):
+        if not self._reset:
+            return True
+
+        try:
+            await _maybe_await(self._reset(connection))
+        except Exception:
+            return False
+
+        return True
+
+    async def _close_quietly(self, connection):
+        try:
+            await _maybe_await(self._close(connection))
+        except Exception:
+            pass
@@ -0,0 +1,120 @@
+from ..exceptions import DriverNotFound
+from .BaseAsyncConnection import BaseAsyncConnection
+from ..query.grammars import MySQLGrammar
+from ..schema.platforms import MySQLPlatform
+from ..query.processors import MySQLPostProcessor
+
+
+class AsyncMySQLConnection(BaseAsyncConnection):
+    """Asyncio MySQL Connection class backed by aiomysql."""
+
+    name = "aiomysql"
+    placeholder = "%s"
+
+    @classmethod
+    def get_default_query_grammar(cls):
+        return MySQLGrammar
+
+    @classmethod
+    def get_default_platform(cls):
+        return MySQLPlatform
+
+    @classmethod
+    def get_default_post_processor(cls):
+        return MySQLPostProcessor
+
+    async def create_connection(self):
+        """Opens a new aiomysql connection"""
+        try:
+            import aiomysql
+        except ModuleNotFoundError:
+            raise DriverNotFound(
+                "You must have the 'aiomysql' package installed to make an async connection to MySQL. Please install it using 'pip install aiomysql'"
+            )
+
+        return await aiomysql.connect(
+            cursorclass=aiomysql.DictCursor,
+            autocommit=True,
+            host=self.host,
+            user=self.user,
+            password=self.password,
+            port=self.port or 3306,
+            db=self.database,
+            **self.options
+        )
+
+    async def disconnect(self, connection):
+        connection.close()
+
+    async def ping_connection(self, connection):
+        await connection.ping(reconnect=False)
+
+    async def begin(self):
+        """Transaction"""
+        if not self.open:
+            await self.make_connection()
+
+        self.transaction_level += 1
+        if self.get_transaction_level() > 1:
+            await self.execute(
+                self.savepoint_format.format(name=self.get_savepoint_name()), ()
+            )
+        else:
+            await self._connection.begin()
+
+        return self
+
+    async def commit(self):
+        """Transaction"""
+        if self.get_transaction_level() > 1:
+            await self.execute(
+                self.release_savepoint_format.format(name=self.get_savepoint_name()),
+                (),
+            )
+        else:
+            await self._connection.commit()
+
+        self.transaction_level -= 1
+        if self.get_transaction_level() <= 0:
+            await self.close_connection()
+
+        return self
+
+    async def rollback(self):
+        """Transaction"""
+        if self.get_transaction_level() > 1:
+            await self.execute(
+                self.rollback_to_savepoint_format.format(
+                    name=self.get_savepoint_name()
+                ),
+                (),
+            )
+        else:
+            await self._connection.rollback()
+
+        self.transaction_level -= 1
+        if self.get_transaction_level() <= 0:
+            await self.close_connection()
+
+        return self
+
+    async def execute(self, query, bindings=(), results="*"):
+        async with self._connection.cursor() as cursor:
+            self._cursor = cursor
+            await cursor.execute(query, bindings or None)
+            if results == 1:
+                return await cursor.fetchone()
+
+            return list(await cursor.fetchall())
+
+    async def stream(self, query, bindings=(), amount=1000):
+        import aiomysql
+
+        # An unbuffered cursor keeps the result on the server until it is fetched
+        async with self._connection.cursor(aiomysql.SSDictCursor) as cursor:
+            self._cursor = cursor
+            await cursor.execute(query, bindings or None)
+            rows = await cursor.fetchmany(amount)
+            while rows:
+                yield list(rows)
+                rows = await cursor.fetchmany(amount)
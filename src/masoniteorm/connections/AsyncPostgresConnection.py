@@ -0,0 +1,89 @@
+from ..exceptions import DriverNotFound
+from .BaseAsyncConnection import BaseAsyncConnection
+from ..query.grammars import PostgresGrammar
+from ..schema.platforms import PostgresPlatform
+from ..query.processors import PostgresPostProcessor
+
+
+class AsyncPostgresConnection(BaseAsyncConnection):
+    """Asyncio Postgres Connection class backed by asyncpg."""
+
+    name = "asyncpg"
+
+    # asyncpg placeholders are numbered so they are written in 'prepare_query'
+    placeholder = None
+
+    @classmethod
+    def get_default_query_grammar(cls):
+        return PostgresGrammar
+
+    @classmethod
+    def get_default_platform(cls):
+        return PostgresPlatform
+
+    @classmethod
+    def get_default_post_processor(cls):
+        return PostgresPostProcessor
+
+    async def create_connection(self):
+        """Opens a new asyncpg connection"""
+        try:
+            import asyncpg
+        except ModuleNotFoundError:
+            raise DriverNotFound(
+                "You must have the 'asyncpg' package installed to make an async connection to Postgres. Please install it using 'pip install asyncpg'"
+            )
+
+        return await asyncpg.connect(
+            host=self.host,
+            port=self.port,
+            user=self.user,
+            password=self.password,
+            database=self.database,
+            **self.options,
+        )
+
+    async def ping_connection(self, connection):
+        await connection.execute("SELECT 1")
+
+    async def reset_connection(self, connection):
+        """Rolls back anything left open so a pooled connection is never handed out idle in transaction"""
+        if connection.is_closed():
+            raise ConnectionError("The connection is closed")
+
+        if connection.is_in_transaction():
+            await connection.execute("ROLLBACK")
+
+    def prepare_query(self, query):
+        """asyncpg uses numbered placeholders ($1, $2, ...) instead of qmarks"""
+        parts = query.split("'?'")
+        sql = [parts[0]]
+        for number, part in enumerate(parts[1:], start=1):
+            sql.append(f"${number}")
+            sql.append(part)
+
+        return "".join(sql)
+
+    async def execute(self, query, bindings=(), results="*"):
+        if results == 1:
+            row = await self._connection.fetchrow(query, *bindings)
+            return dict(row) if row else None
+
+        return [dict(row) for row in await self._connection.fetch(query, *bindings)]
+
+    async def stream(self, query, bindings=(), amount=1000):
+        # asyncpg cursors are server side and must run inside a transaction
+        transaction = None
+        if not self._connection.is_in_transaction():
+            transaction = self._connection.transaction()
+            await transaction.start()
+
+        try:
+            cursor = await self._connection.cursor(query, *bindings)
+            rows = await cursor.fetch(amount)
+            while rows:
+                yield [dict(row) for row in rows]
+                rows = await cursor.fetch(amount)
+        finally:
+            if transaction:
+                await transaction.rollback()
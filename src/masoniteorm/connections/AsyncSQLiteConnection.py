@@ -0,0 +1,65 @@
+from ..exceptions import DriverNotFound
+from .BaseAsyncConnection import BaseAsyncConnection
+from ..query.grammars import SQLiteGrammar
+from ..schema.platforms import SQLitePlatform
+from ..query.processors import SQLitePostProcessor
+
+
+class AsyncSQLiteConnection(BaseAsyncConnection):
+    """Asyncio SQLite Connection class backed by aiosqlite."""
+
+    name = "aiosqlite"
+
+    @classmethod
+    def get_default_query_grammar(cls):
+        return SQLiteGrammar
+
+    @classmethod
+    def get_default_platform(cls):
+        return SQLitePlatform
+
+    @classmethod
+    def get_default_post_processor(cls):
+        return SQLitePostProcessor
+
+    async def create_connection(self):
+        """Opens a new aiosqlite connection and applies the configured PRAGMAs"""
+        try:
+            import aiosqlite
+        except ModuleNotFoundError:
+            raise DriverNotFound(
+                "You must have the 'aiosqlite' package installed to make an async connection to SQLite. Please install it using 'pip install aiosqlite'"
+            )
+
+        connection = await aiosqlite.connect(self.database, isolation_level=None)
+        connection.row_factory = aiosqlite.Row
+
+        for pragma, value in self.options.get("pragmas", {}).items():
+            await connection.execute(f"PRAGMA {pragma} = {value}")
+
+        return connection
+
+    async def ping_connection(self, connection):
+        await connection.execute("SELECT 1")
+
+    async def reset_connection(self, connection):
+        if connection.in_transaction:
+            await connection.rollback()
+
+    async def execute(self, query, bindings=(), results="*"):
+        self._cursor = await self._connection.execute(query, bindings)
+        if results == 1:
+            row = await self._cursor.fetchone()
+            return dict(row) if row else None
+
+        return [dict(row) for row in await self._cursor.fetchall()]
+
+    async def stream(self, query, bindings=(), amount=1000):
+        self._cursor = await self._connection.execute(query, bindings)
+        try:
+            rows = await self._cursor.fetchmany(amount)
+            while rows:
+                yield [dict(row) for row in rows]
+                rows = await self._cursor.fetchmany(amount)
+        finally:
+            await self._cursor.close()
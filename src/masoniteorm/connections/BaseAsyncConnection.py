@@ -0,0 +1,248 @@
+from timeit import default_timer as timer
+
+from .BaseConnection import BaseConnection
+from .AsyncConnectionPool import AsyncConnectionPool, _maybe_await
+from ..exceptions import QueryException
+
+
+class BaseAsyncConnection(BaseConnection):
+    """Base class for connections backed by an asyncio database driver.
+
+    Async connections compile their SQL with the same grammars as their synchronous
+    counterparts. Opening, querying and transactions are coroutines and the driver
+    specific parts are implemented in 'create_connection', 'execute' and 'stream'.
+    """
+
+    is_async = True
+
+    def __init__(
+        self,
+        host=None,
+        database=None,
+        user=None,
+        port=None,
+        password=None,
+        prefix=None,
+        options=None,
+        full_details=None,
+        name=None,
+    ):
+        self.host = host
+        if str(port).isdigit():
+            self.port = int(port)
+        else:
+            self.port = port
+        self.database = database
+        self.user = user
+        self.password = password
+        self.prefix = prefix
+        self.full_details = full_details or {}
+        self.options = options or {}
+        self._connection = None
+        self._cursor = None
+        self.transaction_level = 0
+        self.open = 0
+        if name:
+            self.name = name
+
+    def get_pool(self):
+        """Gets the pool shared by every connection with this name on the running event loop.
+
+        Returns:
+            masoniteorm.connections.AsyncConnectionPool|None
+        """
+        config = self.full_details.get("pool")
+        if not config:
+            return None
+
+        return AsyncConnectionPool.register(
+            self.get_pool_name(),
+            lambda: AsyncConnectionPool.from_config(
+                self.create_connection,
+                config,
+                ping=self.ping_connection,
+                reset=self.reset_connection,
+                close=self.disconnect,
+            ),
+        )
+
+    async def make_connection(self):
+        """This sets the connection on the connection class"""
+        if self._dry:
+            return self
+
+        self._pool = self.get_pool()
+        if self._pool:
+            self._connection = await self._pool.acquire()
+        else:
+            self._connection = await self.create_connection()
+
+        self.open = 1
+
+        return self
+
+    async def create_connection(self):
+        """Opens a new driver connection."""
+        raise NotImplementedError(
+            f"'{self.__class__.__name__}' must implement the 'create_connection' method"
+        )
+
+    async def disconnect(self, connection):
+        """Closes a driver connection."""
+        await _maybe_await(connection.close())
+
+    async def close_connection(self):
+        """Closes the driver connection or returns it to the pool when pooling is enabled."""
+        if self._pool:
+            await self._pool.release(self._connection)
+        elif self._connection:
+            await self.disconnect(self._connection)
+
+        self._connection = None
+        self.open = 0
+
+    async def begin(self):
+        """Transaction"""
+        if not self.open:
+            await self.make_connection()
+
+        self.transaction_level += 1
+        if self.get_transaction_level() > 1:
+            await self.execute(
+                self.savepoint_format.format(name=self.get_savepoint_name()), ()
+            )
+        else:
+            await self.execute("BEGIN", ())
+
+        return self
+
+    async def commit(self):
+        """Transaction"""
+        if self.get_transaction_level() > 1:
+            await self.execute(
+                self.release_savepoint_format.format(name=self.get_savepoint_name()),
+                (),
+            )
+        else:
+            await self.execute("COMMIT", ())
+
+        self.transaction_level -= 1
+        if self.get_transaction_level() <= 0:
+            await self.close_connection()
+
+        return self
+
+    async def rollback(self):
+        """Transaction"""
+        if self.get_transaction_level() > 1:
+            await self.execute(
+                self.rollback_to_savepoint_format.format(
+                    name=self.get_savepoint_name()
+                ),
+                (),
+            )
+        else:
+            await self.execute("ROLLBACK", ())
+
+        self.transaction_level -= 1
+        if self.get_transaction_level() <= 0:
+            await self.close_connection()
+
+        return self
+
+    def get_transaction_level(self):
+        """Transaction"""
+        return self.transaction_level
+
+    def get_cursor(self):
+        return self._cursor
+
+    def get_database_name(self):
+        return self.database
+
+    async def execute(self, query, bindings=(), results="*"):
+        """Runs a query on the driver connection.
+
+        Returns:
+            dict|list|None -- A single row or None when results is 1, otherwise a list of rows.
+        """
+        raise NotImplementedError(
+            f"'{self.__class__.__name__}' must implement the 'execute' method"
+        )
+
+    async def stream(self, query, bindings=(), amount=1000):
+        """Async generator yielding lists of at most 'amount' rows."""
+        raise NotImplementedError(
+            f"'{self.__class__.__name__}' must implement the 'stream' method"
+        )
+        yield
+
+    async def bulk_load(self, query, rows, batch_size=10000):
+        raise NotImplementedError(
+            f"'{self.__class__.__name__}' does not support bulk loading"
+        )
+
+    async def query(self, query, bindings=(), results="*"):
+        """Make the actual query that will reach the database and come back with a result.
+
+        Arguments:
+            query {string} -- A string query. This could be a qmarked string or a regular query.
+            bindings {tuple} -- A tuple of bindings
+
+        Keyword Arguments:
+            results {str|1} -- If the results is equal to an asterisks it will fetch all rows
+                    else it will return a single record. (default: {"*"})
+
+        Returns:
+            dict|list|None -- Returns a dictionary, a list of dictionaries or None when no row was found
+        """
+        if self._dry:
+            return {}
+
+        if not self.open:
+            await self.make_connection()
+
+        try:
+            if isinstance(query, list):
+                for q in query:
+                    await self.execute(self.prepare_query(q), ())
+                return
+
+            query = self.prepare_query(query)
+            start = timer()
+            result = await self.execute(query, tuple(bindings), results=results)
+            self.log_statement(query, bindings, start)
+            return result
+        except Exception as e:
+            raise QueryException(str(e)) from e
+        finally:
+            if self.get_transaction_level() <= 0:
+                await self.close_connection()
+
+    async def select_tuples(self, query, bindings=()):
+        """Runs a select and returns its rows as tuples in column order.
+
+        Returns:
+            list -- A list of tuples.
+        """
+        rows = await self.query(query, bindings)
+        return [tuple(row.values()) for row in rows or []]
+
+    async def cursor(self, query, bindings=(), amount=1000):
+        """Async generator that streams a query result in lists of at most 'amount' rows."""
+        if not self.open:
+            await self.make_connection()
+
+        try:
+            query = self.prepare_query(query)
+            start = timer()
+            async for rows in self.stream(query, tuple(bindings), amount):
+                yield rows
+            self.log_statement(query, bindings, start)
+        finally:
+            if self.get_transaction_level() <= 0:
+                await self.close_connection()
+
+    def log_statement(self, query, bindings, start):
+        if self.full_details.get("log_queries", False):
+            self.log(query, bindings, query_time="{:.2f}".format(timer() - start))
@@ -1,6 +1,11 @@
+import itertools
+import json
 import logging
 from timeit import default_timer as timer
 from .ConnectionResolver import ConnectionResolver
+from .ConnectionPool import ConnectionPool
+from .NativeQuery import NativeQuery
+from ..exceptions import QueryException
 
 
 class BaseConnection:
@@ -8,11 +13,36 @@ class BaseConnection:
     _connection = None
     _cursor = None
     _dry = False
+    _pool = None
+    is_async = False
+
+    # The driver placeholder that replaces the grammar's qmark placeholders.
+    # Grammars write it directly when compiling queries for this connection.
+    placeholder = "?"
+
+    # The most bound parameters a single statement may have. None means there is no limit.
+    max_parameters = None
+
+    # The largest statement in bytes the server accepts. None means there is no limit.
+    max_statement_size = None
+
+    # Statements used for transactions nested in an open transaction
+    savepoint_format = "SAVEPOINT {name}"
+    release_savepoint_format = "RELEASE SAVEPOINT {name}"
+    rollback_to_savepoint_format = "ROLLBACK TO SAVEPOINT {name}"
 
     def dry(self):
         self._dry = True
         return self
 
+    @classmethod
+    def get_max_parameters(cls):
+        return cls.max_parameters
+
+    @classmethod
+    def get_max_statement_size(cls):
+        return cls.max_statement_size
+
     def log(
         self, query, bindings, query_time=0, logger="masoniteorm.connections.queries"
     ):
@@ -41,11 +71,119 @@ class BaseConnection:
         if self.full_details and self.full_details.get("log_queries", False):
             self.log(query, bindings, query_time=end)
 
+    def get_savepoint_name(self):
+        """Gets the name of the savepoint of the current transaction level"""
+        return f"masoniteorm_savepoint_{self.get_transaction_level()}"
+
+    def create_savepoint(self):
+        """Opens a savepoint for the current transaction level"""
+        self.run_savepoint_statement(self.savepoint_format)
+
+    def release_savepoint(self):
+        """Keeps the changes made since the savepoint of the current transaction level"""
+        if self.release_savepoint_format:
+            self.run_savepoint_statement(self.release_savepoint_format)
+
+    def rollback_to_savepoint(self):
+        """Undoes the changes made since the savepoint of the current transaction level"""
+        self.run_savepoint_statement(self.rollback_to_savepoint_format)
+
+    def run_savepoint_statement(self, statement):
+        query = statement.format(name=self.get_savepoint_name())
+        start = timer()
+        cursor = self._connection.cursor()
+        try:
+            cursor.execute(query)
+        finally:
+            cursor.close()
+
+        if self.full_details and self.full_details.get("log_queries", False):
+            self.log(query, (), query_time="{:.2f}".format(timer() - start))
+
     def has_global_connection(self):
-        return self.name in ConnectionResolver().get_global_connections()
+        return self.name in ConnectionResolver.get_global_connections()
 
     def get_global_connection(self):
-        return ConnectionResolver().get_global_connections()[self.name]
+        return ConnectionResolver.get_global_connections()[self.name]
+
+    def get_open_connection(self):
+        """Opens the driver connection when it is not open yet.
+
+        Returns:
+            BaseConnection -- The connection to run statements on. While a global transaction is
+                open on this connection name 'make_connection' hands back the connection holding
+                it, so statements have to run on that one to join the transaction.
+        """
+        if self.open:
+            return self
+
+        return self.make_connection() or self
+
+    def get_pool(self):
+        """Gets the pool shared by every connection with this name.
+
+        Pooling is enabled by adding a 'pool' dictionary to the connection entry in DATABASES.
+
+        Returns:
+            masoniteorm.connections.ConnectionPool|None
+        """
+        config = self.full_details.get("pool")
+        if not config:
+            return None
+
+        return ConnectionPool.register(
+            self.get_pool_name(),
+            lambda: ConnectionPool.from_config(
+                self.create_connection,
+                config,
+                ping=self.ping_connection,
+                reset=self.reset_connection,
+            ),
+        )
+
+    def get_pool_name(self):
+        """Pools are shared by connection name. Read and write hosts of a connection each get their own pool."""
+        route = self.full_details.get("route")
+        if route:
+            return f"{self.name}.{route}"
+
+        return self.name
+
+    def get_pool_stats(self):
+        """Gets usage statistics of the pool for this connection name.
+
+        Returns:
+            dict -- Empty when pooling is not enabled.
+        """
+        pool = self.get_pool()
+        if not pool:
+            return {}
+
+        return pool.stats()
+
+    def create_connection(self):
+        """Opens a new raw driver connection."""
+        raise NotImplementedError(
+            f"'{self.__class__.__name__}' does not support connection pooling"
+        )
+
+    def ping_connection(self, connection):
+        """Health check run on pooled connections before they are checked out."""
+        pass
+
+    def reset_connection(self, connection):
+        """Resets the session state of a pooled connection before it is returned to the pool."""
+        pass
+
+    def close_connection(self):
+        """Closes the driver connection or returns it to the pool when pooling is enabled."""
+        if self._pool:
+            self._pool.release(self._connection)
+            self._connection = None
+        elif self._connection:
+            self._connection.close()
+
+        self.open = 0
 
     def enable_query_log(self):
         self.full_details["log_queries"] = True
@@ -60,14 +198,186 @@ class BaseConnection:
         self._cursor = self._connection.cursor()
         return self
 
+    def prepare_query(self, query):
+        """Swaps the grammar's qmark placeholders for the driver placeholder."""
+        if isinstance(query, NativeQuery):
+            return query
+
+        return query.replace("'?'", self.placeholder)
+
+    def get_tuple_cursor(self):
+        """Gets a cursor that returns rows as tuples instead of dictionaries."""
+        return self._connection.cursor()
+
+    def select_tuples(self, query, bindings=()):
+        """Runs a select and returns its rows as tuples in column order.
+
+        Skips building a dictionary per row, which is the bulk of the work for wide results.
+
+        Arguments:
+            query {string} -- A qmarked query.
+            bindings {tuple} -- A tuple of bindings.
+
+        Returns:
+            list -- A list of tuples.
+        """
+        if self._dry:
+            return []
+
+        connection = self.get_open_connection()
+        if connection is not self:
+            return connection.select_tuples(query, bindings)
+
+        try:
+            self._cursor = self.get_tuple_cursor()
+            self.statement(self.prepare_query(query), bindings)
+            return [tuple(row) for row in self._cursor.fetchall()]
+        except Exception as e:
+            raise QueryException(str(e)) from e
+        finally:
+            if self._cursor:
+                self._cursor.close()
+            if self.get_transaction_level() <= 0:
+                self.close_connection()
+
+    def get_streaming_cursor(self):
+        """Gets a cursor that fetches rows from the database as they are consumed
+        instead of buffering the whole result on the client."""
+        return self._connection.cursor()
+
     def select_many(self, query, bindings, amount):
-        self.set_cursor()
-        self.statement(query)
-        if not self.open:
-            self.make_connection()
+        """Streams the results of a query in lists of at most 'amount' rows.
 
-        result = self.format_cursor_results(self._cursor.fetchmany(amount))
-        while result:
-            yield result
+        Arguments:
+            query {string} -- A qmarked query.
+            bindings {tuple} -- A tuple of bindings.
+            amount {int} -- The number of rows fetched per round trip.
+
+        Yields:
+            list -- A list of at most 'amount' rows.
+        """
+        if self._dry:
+            return
+
+        connection = self.get_open_connection()
+        if connection is not self:
+            yield from connection.select_many(query, bindings, amount)
+            return
+
+        try:
+            self._cursor = self.get_streaming_cursor()
+            self.statement(self.prepare_query(query), bindings)
 
             result = self.format_cursor_results(self._cursor.fetchmany(amount))
+            while result:
+                yield result
+
+                result = self.format_cursor_results(self._cursor.fetchmany(amount))
+        except Exception as e:
+            raise QueryException(str(e)) from e
+        finally:
+            if self._cursor:
+                self._cursor.close()
+            if self.get_transaction_level() <= 0:
+                self.close_connection()
+
+    def bulk_load(self, query, rows, batch_size=10000):
+        """Loads rows into a table with the fastest method the driver supports.
+
+        By default the statement is run with 'executemany' in batches inside one transaction.
+
+        Arguments:
+            query {string} -- The statement compiled by the grammar's 'bulk_load' method.
+            rows {iterable} -- An iterable of tuples in column order.
+
+        Keyword Arguments:
+            batch_size {int} -- The number of rows sent per 'executemany' call. (default: {10000})
+
+        Returns:
+            int -- The number of rows loaded.
+        """
+        connection = self.get_open_connection()
+        if connection is not self:
+            return connection.bulk_load(query, rows, batch_size)
+
+        query = self.prepare_query(query)
+        owns_transaction = self.get_transaction_level() <= 0
+        if owns_transaction:
+            self.begin()
+
+        count = 0
+        start = timer()
+        try:
+            self._cursor = self.get_bulk_load_cursor()
+            rows = iter(rows)
+            while True:
+                batch = list(itertools.islice(rows, batch_size))
+                if not batch:
+                    break
+
+                self._cursor.executemany(query, batch)
+                count += len(batch)
+
+            if owns_transaction:
+                self.commit()
+        except Exception as e:
+            if owns_transaction:
+                self.rollback()
+            raise QueryException(str(e)) from e
+
+        self.log_bulk_load(query, count, start)
+        return count
+
+    def get_bulk_load_cursor(self):
+        return self._connection.cursor()
+
+    def log_bulk_load(self, query, count, start):
+        if self.full_details.get("log_queries", False):
+            self.log(
+                query, (f"{count} rows",), query_time="{:.2f}".format(timer() - start)
+            )
+
+    def encode_bulk_load_row(self, row):
+        """Encodes a row as a line of the tab separated text format read by COPY and LOAD DATA.
+
+        Arguments:
+            row {tuple} -- The values of the row in column order.
+
+        Returns:
+            string
+        """
+        return "\t".join(self._encode_bulk_load_value(value) for value in row) + "\n"
+
+    def _encode_bulk_load_value(self, value):
+        if value is None:
+            return "\\N"
+
+        if isinstance(value, bool):
+            return "1" if value else "0"
+
+        if isinstance(value, (bytes, bytearray, memoryview)):
+            return self.encode_bulk_load_bytes(bytes(value))
+
+        if isinstance(value, (dict, list)):
+            value = json.dumps(value)
+
+        return (
+            str(value)
+            .replace("\\", "\\\\")
+            .replace("\t", "\\t")
+            .replace("\n", "\\n")
+            .replace("\r", "\\r")
+        )
+
+    def encode_bulk_load_bytes(self, value):
+        """Encodes a binary value for the bulk load format of the driver.
+
+        Arguments:
+            value {bytes} -- The binary value.
+
+        Returns:
+            string
+        """
+        raise QueryException(
+            f"'{self.__class__.__name__}' cannot bulk load binary values. Insert them with 'bulk_create' instead."
+        )
@@ -5,6 +5,9 @@ class ConnectionFactory:
         #
     }
 
+    # Connection classes already resolved, by factory class and the key given to 'make'
+    _resolved = {}
+
     @classmethod
     def register(cls, key, connection):
         """Registers new connections
@@ -17,8 +20,27 @@ class ConnectionFactory:
             cls
         """
         cls._connections.update({key: connection})
+        cls.forget_resolved()
+        return cls
+
+    @classmethod
+    def forget_resolved(cls):
+        """Clears the connection classes cached by 'make' so they are resolved again."""
+        ConnectionFactory._resolved.clear()
         return cls
 
+    @classmethod
+    def is_async(cls, key):
+        """Checks if the connection registered to a driver name uses an asyncio driver
+
+        Arguments:
+            key {string} -- The driver name
+
+        Returns:
+            bool
+        """
+        return getattr(cls._connections.get(key), "is_async", False)
+
     def make(self, key):
         """Makes already registered connections
 
@@ -31,19 +53,21 @@ class ConnectionFactory:
         Returns:
             masoniteorm.connection.BaseConnection -- Returns an instance of a BaseConnection class.
         """
-
-        from config.database import ConnectionResolver
-
-        connections = ConnectionResolver().get_connection_details()
+        connection = self._resolved.get((self.__class__, key))
+        if connection:
+            return connection
 
         if key == "default":
+            from config.database import ConnectionResolver
+
+            connections = ConnectionResolver().get_connection_details()
             connection_details = connections.get(connections.get("default"))
             connection = self._connections.get(connection_details.get("driver"))
         else:
-            connection_details = connections.get(key)
             connection = self._connections.get(key)
 
         if connection:
+            self._resolved[(self.__class__, key)] = connection
             return connection
 
         raise Exception(
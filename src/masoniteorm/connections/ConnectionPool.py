@@ -0,0 +1,365 @@
+import threading
+from collections import deque
+from time import monotonic
+
+from ..exceptions import ConnectionPoolExhausted
+
+
+class ConnectionPool:
+    """A bounded, thread safe pool of raw driver connections.
+
+    Pools are registered once per connection name and shared by every connection
+    class (and therefore every query builder) using that name. Connection classes
+    borrow a raw driver connection with 'acquire' and hand it back with 'release'
+    instead of opening and closing a new connection for every query.
+    """
+
+    _pools = {}
+    _registry_lock = threading.Lock()
+
+    def __init__(
+        self,
+        factory,
+        min_size=0,
+        max_size=10,
+        timeout=30,
+        max_lifetime=None,
+        idle_timeout=None,
+        pre_ping=True,
+        ping=None,
+        reset=None,
+        close=None,
+    ):
+        """ConnectionPool initializer
+
+        Arguments:
+            factory {callable} -- Creates and returns a new raw driver connection.
+
+        Keyword Arguments:
+            min_size {int} -- Connections kept open even when idle. (default: {0})
+            max_size {int} -- Maximum number of open connections. (default: {10})
+            timeout {int|float} -- Seconds to wait for a free connection on checkout. (default: {30})
+            max_lifetime {int|float} -- Seconds after which a connection is recycled. (default: {None})
+            idle_timeout {int|float} -- Seconds after which idle connections above min_size are closed. (default: {None})
+            pre_ping {bool} -- Whether to health check connections on checkout. (default: {True})
+            ping {callable} -- Raises if the given connection is no longer usable. (default: {None})
+            reset {callable} -- Resets the session state of a connection being returned. (default: {None})
+            close {callable} -- Closes a connection. (default: {None})
+        """
+        if max_size < 1:
+            raise ValueError("The connection pool 'max' size must be at least 1")
+
+        self.factory = factory
+        self.min_size = min(min_size, max_size)
+        self.max_size = max_size
+        self.timeout = timeout
+        self.max_lifetime = max_lifetime
+        self.idle_timeout = idle_timeout
+        self.pre_ping = pre_ping
+        self._ping = ping
+        self._reset = reset
+        self._close = close or (lambda connection: connection.close())
+
+        self._condition = threading.Condition()
+        # Idle connections stored as [connection, created_at, last_used_at]
+        self._idle = deque()
+        # Checked out connections mapped by id to their created_at time
+        self._checked_out = {}
+        self._size = 0
+
+        self._waiting = 0
+        self._checkouts = 0
+        self._timeouts = 0
+        self._discarded = 0
+
+        self.fill()
+
+    @classmethod
+    def from_config(cls, factory, config, ping=None, reset=None, close=None):
+        """Creates a pool from the 'pool' dictionary of a connection entry in DATABASES."""
+        return cls(
+            factory,
+            min_size=int(config.get("min", 0)),
+            max_size=int(config.get("max", 10)),
+            timeout=config.get("timeout", 30),
+            max_lifetime=config.get("max_lifetime"),
+            idle_timeout=config.get("idle_timeout"),
+            pre_ping=config.get("pre_ping", True),
+            ping=ping,
+            reset=reset,
+            close=close,
+        )
+
+    @classmethod
+    def get_pool(cls, name):
+        return cls._pools.get(name)
+
+    @classmethod
+    def register(cls, name, make_pool):
+        """Gets the pool registered to a connection name, creating it if it does not exist yet.
+
+        Arguments:
+            name {string} -- The connection name.
+            make_pool {callable} -- Called to build the pool the first time it is requested.
+
+        Returns:
+            ConnectionPool
+        """
+        pool = cls._pools.get(name)
+        if pool is not None:
+            return pool
+
+        with cls._registry_lock:
+            if name not in cls._pools:
+                cls._pools[name] = make_pool()
+
+            return cls._pools[name]
+
+    @classmethod
+    def close_all(cls):
+        """Closes every registered pool and removes them from the registry."""
+        with cls._registry_lock:
+            pools = list(cls._pools.values())
+            cls._pools.clear()
+
+        for pool in pools:
+            pool.close()
+
+    def fill(self):
+        """Opens connections until the pool holds at least min_size connections."""
+        while True:
+            with self._condition:
+                if self._size >= self.min_size:
+                    return self
+                self._size += 1
+
+            try:
+                connection = self.factory()
+            except Exception:
+                self._discard_slot()
+                raise
+
+            now = monotonic()
+            with self._condition:
+                self._idle.append([connection, now, now])
+                self._condition.notify()
+
+    def acquire(self, timeout=None):
+        """Checks out a connection, waiting for one to be released if the pool is exhausted.
+
+        Keyword Arguments:
+            timeout {int|float} -- Overrides the pool checkout timeout. (default: {None})
+
+        Raises:
+            ConnectionPoolExhausted: Raised when no connection becomes available in time.
+
+        Returns:
+            A raw driver connection.
+        """
+        timeout = self.timeout if timeout is None else timeout
+        deadline = None if timeout is None else monotonic() + timeout
+
+        while True:
+            entry = None
+            expired = []
+            try:
+                with self._condition:
+                    expired += self._reap()
+                    while entry is None:
+                        if self._idle:
+                            entry = self._idle.pop()
+                        elif self._size < self.max_size:
+                            self._size += 1
+                            break
+                        else:
+                            remaining = (
+                                None if deadline is None else deadline - monotonic()
+                            )
+                            if remaining is not None and remaining <= 0:
+                                self._timeouts += 1
+                                raise self._exhausted(timeout)
+                            self._waiting += 1
+                            try:
+                                self._condition.wait(remaining)
+                            finally:
+                                self._waiting -= 1
+                            expired += self._reap()
+            finally:
+                self._close_reaped(expired)
+
+            if entry is None:
+                return self._open()
+
+            connection, created_at, last_used_at = entry
+            if self._is_expired(created_at) or not self._is_healthy(connection):
+                self._close_quietly(connection)
+                self._discard_slot()
+                # Failed pings count against the checkout timeout as well
+                if deadline is not None and monotonic() >= deadline:
+                    with self._condition:
+                        self._timeouts += 1
+                    raise self._exhausted(timeout)
+                continue
+
+            with self._condition:
+                self._checked_out[id(connection)] = created_at
+                self._checkouts += 1
+
+            return connection
+
+    def release(self, connection):
+        """Returns a checked out connection to the pool.
+
+        Arguments:
+            connection -- A raw driver connection previously returned by 'acquire'.
+        """
+        with self._condition:
+            created_at = self._checked_out.pop(id(connection), None)
+
+        if created_at is None:
+            # Not one of ours (or already released)
+            return
+
+        if self._is_expired(created_at) or not self._reset_connection(connection):
+            self._close_quietly(connection)
+            self._discard_slot()
+            return
+
+        with self._condition:
+            self._idle.append([connection, created_at, monotonic()])
+            self._condition.notify()
+
+    def close(self):
+        """Closes every idle connection. Checked out connections are closed when released."""
+        with self._condition:
+            idle = [entry[0] for entry in self._idle]
+            self._idle.clear()
+            self._size -= len(idle)
+            self.max_lifetime = 0
+
+        for connection in idle:
+            self._close_quietly(connection)
+
+    def stats(self):
+        """Returns a snapshot of the pool usage.
+
+        Returns:
+            dict
+        """
+        with self._condition:
+            return {
+                "size": self._size,
+                "idle": len(self._idle),
+                "checked_out": len(self._checked_out),
+                "waiting": self._waiting,
+                "min": self.min_size,
+                "max": self.max_size,
+                "checkouts": self._checkouts,
+                "timeouts": self._timeouts,
+                "discarded": self._discarded,
+            }
+
+    def _open(self):
+        try:
+            connection = self.factory()
+        except Exception:
+            self._discard_slot()
+            raise
+
+        with self._condition:
+            self._checked_out[id(connection)] = monotonic()
+            self._checkouts += 1
+
+        return connection
+
+    def _exhausted(self, timeout):
+        return ConnectionPoolExhausted(
+            f"Could not acquire a connection within {timeout} seconds. "
+            f"All {self.max_size} connections are in use."
+        )
+
+    def _reap(self):
+        """Takes idle connections that have outlived idle_timeout or max_lifetime out of the pool.
+
+        Must be called while holding the pool condition. Closing can be slow so the
+        connections are returned to be closed by '_close_reaped' once it is released.
+
+        Returns:
+            list -- The connections taken out of the pool.
+        """
+        if not self._idle or (self.idle_timeout is None and self.max_lifetime is None):
+            return []
+
+        now = monotonic()
+        expired = []
+        kept = deque()
+        for entry in self._idle:
+            connection, created_at, last_used_at = entry
+            idle_too_long = (
+                self.idle_timeout is not None
+                and now - last_used_at > self.idle_timeout
+                and self._size > self.min_size
+            )
+            if idle_too_long or self._is_expired(created_at, now):
+                expired.append(connection)
+                self._size -= 1
+                self._discarded += 1
+            else:
+                kept.append(entry)
+
+        self._idle = kept
+        return expired
+
+    def _close_reaped(self, connections):
+        """Closes reaped connections and opens new ones if the pool fell under min_size."""
+        if not connections:
+            return
+
+        for connection in connections:
+            self._close_quietly(connection)
+
+        try:
+            self.fill()
+        except Exception:
+            # The next checkout opens its own connection and reports the error
+            pass
+
+    def _discard_slot(self):
+        with self._condition:
+            self._size -= 1
+            self._discarded += 1
+            self._condition.notify()
+
+    def _is_expired(self, created_at, now=None):
+        if self.max_lifetime is None:
+            return False
+
+        return (now or monotonic()) - created_at >= self.max_lifetime
+
+    def _is_healthy(self, connection):
+        if not self.pre_ping or not self._ping:
+            return True
+
+        try:
+            self._ping(connection)
+        except Exception:
+            return False
+
+        return True
+
+    def _reset_connection(self, connection):
+        if not self._reset:
+            return True
+
+        try:
+            self._reset(connection)
+        except Exception:
+            return False
+
+        return True
+
+    def _close_quietly(self, connection):
+        try:
+            self._close(connection)
+        except Exception:
+            pass
@@ -1,40 +1,198 @@
+import inspect
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from contextlib import contextmanager
 
+from ..exceptions import QueryException
+
+try:
+    from contextvars import ContextVar
+except ImportError:
+    # Python 3.6
+    from .ThreadLocalVar import ThreadLocalVar as ContextVar
+
+# Maps connection names to the connection holding the global transaction opened in the
+# current context. Threads and asyncio tasks each see their own transactions. On Python
+# 3.6 only threads do.
+_transactions = ContextVar("masoniteorm_transactions", default={})
+
 
 class ConnectionResolver:
 
     _connection_details = {}
-    _connections = {}
 
-    def __init__(self):
-        from ..connections import (
-            SQLiteConnection,
-            PostgresConnection,
-            MySQLConnection,
-            MSSQLConnection,
-        )
+    # Whether the built in drivers have been registered on the connection factory
+    _drivers_registered = False
+
+    # Thread pool running gathered queries. Each worker borrows its own connection
+    # so the connection pools should allow at least this many connections.
+    _max_workers = 8
+    _executor = None
+    _executor_lock = threading.Lock()
 
+    def __init__(self):
         from ..connections import ConnectionFactory
 
         self.connection_factory = ConnectionFactory()
 
-        self.register(SQLiteConnection)
-        self.register(PostgresConnection)
-        self.register(MySQLConnection)
-        self.register(MSSQLConnection)
+        # Registered once so resolvers made later do not override custom drivers
+        if not ConnectionResolver._drivers_registered:
+            from ..connections import (
+                SQLiteConnection,
+                PostgresConnection,
+                MySQLConnection,
+                MSSQLConnection,
+                AsyncSQLiteConnection,
+                AsyncPostgresConnection,
+                AsyncMySQLConnection,
+            )
+
+            self.register(SQLiteConnection)
+            self.register(PostgresConnection)
+            self.register(MySQLConnection)
+            self.register(MSSQLConnection)
+            self.register(AsyncSQLiteConnection)
+            self.register(AsyncPostgresConnection)
+            self.register(AsyncMySQLConnection)
+            ConnectionResolver._drivers_registered = True
 
     def set_connection_details(self, connection_details):
         self.__class__._connection_details = connection_details
+        self.connection_factory.forget_resolved()
         return self
 
     def get_connection_details(self):
         return self._connection_details
 
-    def get_global_connections(self):
-        return self._connections
+    def set_max_workers(self, max_workers):
+        """Sets the number of queries 'gather' runs at the same time.
+
+        Arguments:
+            max_workers {int} -- The size of the thread pool.
+
+        Returns:
+            self
+        """
+        with self._executor_lock:
+            executor = self.__class__._executor
+            self.__class__._max_workers = max_workers
+            self.__class__._executor = None
+
+        if executor:
+            executor.shutdown(wait=False)
+
+        return self
+
+    @classmethod
+    def get_executor(cls):
+        """Gets the bounded thread pool running gathered queries, creating it on first use.
+
+        Returns:
+            concurrent.futures.ThreadPoolExecutor
+        """
+        with cls._executor_lock:
+            if cls._executor is None:
+                cls._executor = ThreadPoolExecutor(
+                    max_workers=cls._max_workers, thread_name_prefix="masoniteorm"
+                )
+
+            return cls._executor
+
+    def gather(self, *queries, timeout=None):
+        """Runs independent queries at the same time and returns their results in order.
+
+        Query builders run 'get'. Any other terminal method can be gathered by passing
+        a future from 'builder.get_async_future(method)' or a callable:
+
+            users, total, latest = DB.gather(
+                User.where("active", 1),
+                User.get_async_future("count"),
+                lambda: Post.order_by("id", "desc").first(),
+            )
+
+        Queries on an asyncio connection are awaited with asyncio.gather instead:
+
+            users, total = await asyncio.gather(
+                User.where("active", 1).get(), User.count()
+            )
 
-    def remove_global_connection(self, name=None):
-        self._connections.pop(name)
+        Gathered queries run on other threads which cannot see the writes of an open
+        global transaction, so they cannot be gathered inside one.
+
+        Arguments:
+            queries {QueryBuilder|Future|callable} -- The queries to run.
+
+        Keyword Arguments:
+            timeout {int|float} -- Seconds to wait for all the results. (default: {None})
+
+        Raises:
+            TypeError: Raised when a query runs on an asyncio connection.
+            QueryException: Raised inside a global transaction.
+
+        Returns:
+            list -- The results as the builder methods would return them.
+        """
+        from ..query import AsyncQueryBuilder
+
+        for query in queries:
+            if isinstance(query, AsyncQueryBuilder) or inspect.isawaitable(query):
+                raise TypeError(
+                    "Queries on an asyncio connection cannot be gathered on threads. Await them with asyncio.gather instead."
+                )
+
+        self.ensure_outside_transaction()
+
+        futures = []
+        for query in queries:
+            if isinstance(query, Future):
+                futures.append(query)
+            elif hasattr(query, "get_async_future"):
+                futures.append(query.get_async_future())
+            else:
+                futures.append(self.get_executor().submit(query))
+
+        try:
+            return [future.result(timeout=timeout) for future in futures]
+        except BaseException:
+            # Queries that have not started yet are not worth running anymore
+            for future in futures:
+                future.cancel()
+            raise
+
+    @classmethod
+    def ensure_outside_transaction(cls):
+        """Raises when a global transaction is open in the current thread or asyncio task.
+
+        Raises:
+            QueryException
+        """
+        if cls.get_global_connections():
+            raise QueryException(
+                "Queries cannot run on other threads inside a transaction because they would not see its uncommitted writes."
+            )
+
+    @classmethod
+    def get_global_connections(cls):
+        """Gets the connections holding a global transaction in the current thread or asyncio task.
+
+        Returns:
+            dict
+        """
+        return _transactions.get()
+
+    @classmethod
+    def set_global_connection(cls, name, connection):
+        # The registry is copied on write so transactions never leak into other contexts
+        connections = dict(_transactions.get())
+        connections[name] = connection
+        _transactions.set(connections)
+
+    @classmethod
+    def remove_global_connection(cls, name=None):
+        connections = dict(_transactions.get())
+        connection = connections.pop(name)
+        _transactions.set(connections)
+        return connection
 
     def register(self, connection):
         self.connection_factory.register(connection.name, connection)
@@ -43,16 +201,25 @@ class ConnectionResolver:
         if name is None:
             name = self.get_connection_details()["default"]
 
+        # A transaction opened inside another one is nested in it with a savepoint
+        if name in self.get_global_connections():
+            return self.get_global_connections()[name].begin()
+
         driver = self.get_connection_details()[name].get("driver")
 
+        if self.connection_factory.is_async(driver):
+            raise TypeError(
+                f"Connection '{name}' uses an asyncio driver. Open its transactions with 'await builder.begin()' or 'await builder.run_in_transaction(callback)' instead."
+            )
+
         connection = (
             self.connection_factory.make(driver)(
-                **self.get_connection_information(name)
+                **self.get_connection_information(name), name=name
             )
             .make_connection()
             .begin()
         )
-        self.__class__._connections.update({name: connection})
+        self.set_global_connection(name, connection)
 
         return connection
 
@@ -60,7 +227,8 @@ class ConnectionResolver:
         if name is None:
             name = self.get_connection_details()["default"]
         connection = self.get_global_connections()[name]
-        self.remove_global_connection(name)
+        if connection.get_transaction_level() <= 1:
+            self.remove_global_connection(name)
         connection.commit()
 
     def rollback(self, name=None):
@@ -68,7 +236,8 @@ class ConnectionResolver:
             name = self.get_connection_details()["default"]
 
         connection = self.get_global_connections()[name]
-        self.remove_global_connection(name)
+        if connection.get_transaction_level() <= 1:
+            self.remove_global_connection(name)
         connection.rollback()
 
     @contextmanager
@@ -87,16 +256,21 @@ class ConnectionResolver:
             raise
 
     def get_connection_information(self, name):
-        details = self.get_connection_details()
+        from .ConnectionRouter import ConnectionRouter
+
+        # Global transactions always run on the primary
+        details = ConnectionRouter.get_write_details(
+            self.get_connection_details().get(name, {})
+        )
         return {
-            "host": details.get(name, {}).get("host"),
-            "database": details.get(name, {}).get("database"),
-            "user": details.get(name, {}).get("user"),
-            "port": details.get(name, {}).get("port"),
-            "password": details.get(name, {}).get("password"),
-            "prefix": details.get(name, {}).get("prefix"),
-            "options": details.get(name, {}).get("options", {}),
-            "full_details": details.get(name, {}),
+            "host": details.get("host"),
+            "database": details.get("database"),
+            "user": details.get("user"),
+            "port": details.get("port"),
+            "password": details.get("password"),
+            "prefix": details.get("prefix"),
+            "options": details.get("options", {}),
+            "full_details": details,
         }
 
     def get_schema_builder(self, connection="default"):
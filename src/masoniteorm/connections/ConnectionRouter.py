@@ -0,0 +1,149 @@
+import itertools
+import threading
+import time
+
+from .ConnectionPool import ConnectionPool
+from .AsyncConnectionPool import AsyncConnectionPool
+
+try:
+    from contextvars import ContextVar
+except ImportError:
+    # Python 3.6
+    from .ThreadLocalVar import ThreadLocalVar as ContextVar
+
+# Maps connection names to the time of the last write made in the current context
+_last_writes = ContextVar("masoniteorm_last_writes", default={})
+
+
+class ConnectionRouter:
+    """Routes queries on a connection configured with 'read' and 'write' hosts.
+
+    Keys in the 'read' and 'write' entries override the shared keys of the connection:
+
+        'mysql': {
+            'driver': 'mysql',
+            'user': 'root',
+            'database': 'orm',
+            'read': [
+                {'host': 'replica-1'},
+                {'host': 'replica-2'},
+            ],
+            'write': {'host': 'primary'},
+            'read_strategy': 'round_robin',
+            'sticky': 5,
+        }
+
+    'read_strategy' is either 'round_robin' or 'least_loaded'. 'least_loaded' picks the replica
+    whose connection pool has the fewest connections in use. 'sticky' is the number of seconds
+    reads are sent to the primary after a write made in the same context.
+    """
+
+    # Round robin counters by connection name
+    _counters = {}
+    _lock = threading.Lock()
+
+    def __init__(self, name, details, is_async=False):
+        """ConnectionRouter initializer
+
+        Arguments:
+            name {string} -- The connection name.
+            details {dict} -- The connection entry in DATABASES.
+
+        Keyword Arguments:
+            is_async {bool} -- Whether the connection uses an asyncio driver. (default: {False})
+        """
+        self.name = name
+        self.details = details
+        self.is_async = is_async
+
+        read = details.get("read") or []
+        self.reads = [read] if isinstance(read, dict) else list(read)
+
+    @classmethod
+    def make(cls, name, details, is_async=False):
+        """Gets a router for a connection entry or None if the entry has no read hosts."""
+        if not details or not details.get("read"):
+            return None
+
+        return cls(name, details, is_async=is_async)
+
+    @staticmethod
+    def get_write_details(details):
+        """Gets the connection entry of the primary.
+
+        Entries without a 'write' host are returned as they are.
+
+        Returns:
+            dict
+        """
+        if not details or ("read" not in details and "write" not in details):
+            return details
+
+        return ConnectionRouter._merge(details, details.get("write") or {}, "write")
+
+    def write_details(self):
+        return self.get_write_details(self.details)
+
+    def read_details(self):
+        """Picks a replica and gets its connection entry.
+
+        Returns:
+            dict
+        """
+        index = self._pick()
+        return self._merge(self.details, self.reads[index], f"read.{index}")
+
+    def record_write(self):
+        """Records a write so reads in the same context stick to the primary."""
+        if not self.details.get("sticky"):
+            return
+
+        writes = dict(_last_writes.get())
+        writes[self.name] = time.monotonic()
+        _last_writes.set(writes)
+
+    def is_sticky(self):
+        """Whether reads should go to the primary because of a recent write in this context."""
+        window = self.details.get("sticky")
+        last_write = _last_writes.get().get(self.name)
+        if not window or last_write is None:
+            return False
+
+        return time.monotonic() - last_write < window
+
+    @classmethod
+    def forget_writes(cls):
+        """Lets reads in the current context go back to the replicas straight away."""
+        _last_writes.set({})
+
+    def _pick(self):
+        with self._lock:
+            counter = self._counters.setdefault(self.name, itertools.count())
+            start = next(counter)
+
+        # Rotate the replicas so ties are broken in round robin order
+        order = [
+            (start + offset) % len(self.reads) for offset in range(len(self.reads))
+        ]
+        if self.details.get("read_strategy", "round_robin") != "least_loaded":
+            return order[0]
+
+        return min(order, key=self._get_load)
+
+    def _get_load(self, index):
+        pool_class = AsyncConnectionPool if self.is_async else ConnectionPool
+        pool = pool_class.get_pool(f"{self.name}.read.{index}")
+        if not pool:
+            return 0
+
+        stats = pool.stats()
+        return stats["checked_out"] + stats["waiting"]
+
+    @staticmethod
+    def _merge(details, overrides, route):
+        merged = {
+            key: value for key, value in details.items() if key not in ("read", "write")
+        }
+        merged.update(overrides)
+        merged["route"] = route
+        return merged
@@ -13,6 +13,13 @@ class MSSQLConnection(BaseConnection):
     """MSSQL Connection class."""
 
     name = "mssql"
+    # SQL Server rejects statements with more than 2100 parameters
+    max_parameters = 2000
+
+    savepoint_format = "SAVE TRANSACTION {name}"
+    # SQL Server releases savepoints when the transaction ends
+    release_savepoint_format = None
+    rollback_to_savepoint_format = "ROLLBACK TRANSACTION {name}"
 
     def __init__(
         self,
@@ -86,7 +93,9 @@ class MSSQLConnection(BaseConnection):
 
     def commit(self):
         """Transaction"""
-        if self.get_transaction_level() == 1:
+        if self.get_transaction_level() > 1:
+            self.release_savepoint()
+        elif self.get_transaction_level() == 1:
             self._connection.commit()
             self._connection.autocommit = True
 
@@ -94,13 +103,19 @@ class MSSQLConnection(BaseConnection):
 
     def begin(self):
         """MSSQL Transaction"""
-        self._connection.autocommit = False
         self.transaction_level += 1
+        if self.get_transaction_level() > 1:
+            self.create_savepoint()
+        else:
+            self._connection.autocommit = False
+
         return self
 
     def rollback(self):
         """Transaction"""
-        if self.get_transaction_level() == 1:
+        if self.get_transaction_level() > 1:
+            self.rollback_to_savepoint()
+        elif self.get_transaction_level() == 1:
             self._connection.rollback()
             self._connection.autocommit = True
 
@@ -113,6 +128,12 @@ class MSSQLConnection(BaseConnection):
     def get_cursor(self):
         return self._cursor
 
+    def get_bulk_load_cursor(self):
+        """Sends every parameter set of an 'executemany' call in a single round trip"""
+        cursor = self._connection.cursor()
+        cursor.fast_executemany = True
+        return cursor
+
     def query(self, query, bindings=(), results="*"):
         """Make the actual query that will reach the database and come back with a result.
 
@@ -128,16 +149,18 @@ class MSSQLConnection(BaseConnection):
             dict|None -- Returns a dictionary of results or None
         """
 
+        connection = self.get_open_connection()
+        if connection is not self:
+            return connection.query(query, bindings, results)
+
         try:
-            if not self.open:
-                self.make_connection()
             self._cursor = self._connection.cursor()
             with self._cursor as cursor:
                 if isinstance(query, list) and not self._dry:
                     for q in query:
                         self.statement(q, ())
                     return
-                query = query.replace("'?'", "?")
+                query = self.prepare_query(query)
                 self.statement(query, bindings)
                 if results == 1:
                     if not cursor.description:
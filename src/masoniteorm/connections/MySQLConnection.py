@@ -1,3 +1,7 @@
+import os
+import tempfile
+from timeit import default_timer as timer
+
 from ..exceptions import DriverNotFound
 from .BaseConnection import BaseConnection
 from ..query.grammars import MySQLGrammar
@@ -5,13 +9,16 @@ from ..schema.platforms import MySQLPlatform
 from ..query.processors import MySQLPostProcessor
 from ..exceptions import QueryException
 
-CONNECTION_POOL = []
-
 
 class MySQLConnection(BaseConnection):
     """MYSQL Connection class."""
 
     name = "mysql"
+    max_parameters = 65535
+    # pymysql interpolates bindings into the statement so it has to fit in max_allowed_packet.
+    # This is the smallest server default (4MB). Leave some room for the SQL around the values.
+    max_statement_size = 3 * 1024 * 1024
+    placeholder = "%s"
     _dry = False
 
     def __init__(
@@ -48,6 +55,21 @@ class MySQLConnection(BaseConnection):
         if self._dry:
             return
 
+        if self.has_global_connection():
+            return self.get_global_connection()
+
+        self._pool = self.get_pool()
+        if self._pool:
+            self._connection = self._pool.acquire()
+        else:
+            self._connection = self.create_connection()
+
+        self.open = 1
+
+        return self
+
+    def create_connection(self):
+        """Opens a new pymysql connection"""
         try:
             import pymysql
         except ModuleNotFoundError:
@@ -55,10 +77,7 @@ class MySQLConnection(BaseConnection):
                 "You must have the 'pymysql' package installed to make a connection to MySQL. Please install it using 'pip install pymysql'"
             )
 
-        if self.has_global_connection():
-            return self.get_global_connection()
-
-        self._connection = pymysql.connect(
+        return pymysql.connect(
             cursorclass=pymysql.cursors.DictCursor,
             autocommit=True,
             host=self.host,
@@ -68,9 +87,20 @@ class MySQLConnection(BaseConnection):
             db=self.database,
             **self.options
         )
-        self.open = 1
 
-        return self
+    def ping_connection(self, connection):
+        connection.ping(reconnect=False)
+
+    def get_tuple_cursor(self):
+        import pymysql
+
+        return self._connection.cursor(pymysql.cursors.Cursor)
+
+    def get_streaming_cursor(self):
+        """Unbuffered cursor that reads rows off the socket as they are fetched"""
+        import pymysql
+
+        return self._connection.cursor(pymysql.cursors.SSDictCursor)
 
     def reconnect(self):
         self._connection.connect()
@@ -93,8 +123,14 @@ class MySQLConnection(BaseConnection):
 
     def commit(self):
         """Transaction"""
-        self._connection.commit()
+        if self.get_transaction_level() > 1:
+            self.release_savepoint()
+        else:
+            self._connection.commit()
+
         self.transaction_level -= 1
+        if self.get_transaction_level() <= 0:
+            self.close_connection()
 
     def dry(self):
         """Transaction"""
@@ -103,14 +139,28 @@ class MySQLConnection(BaseConnection):
 
     def begin(self):
         """Mysql Transaction"""
-        self._connection.begin()
+        connection = self.get_open_connection()
+        if connection is not self:
+            return connection.begin()
+
         self.transaction_level += 1
+        if self.get_transaction_level() > 1:
+            self.create_savepoint()
+        else:
+            self._connection.begin()
+
         return self
 
     def rollback(self):
         """Transaction"""
-        self._connection.rollback()
+        if self.get_transaction_level() > 1:
+            self.rollback_to_savepoint()
+        else:
+            self._connection.rollback()
+
         self.transaction_level -= 1
+        if self.get_transaction_level() <= 0:
+            self.close_connection()
 
     def get_transaction_level(self):
         """Transaction"""
@@ -119,6 +169,54 @@ class MySQLConnection(BaseConnection):
     def get_cursor(self):
         return self._cursor
 
+    def bulk_load(self, query, rows, batch_size=10000):
+        """Loads rows into a table with LOAD DATA LOCAL INFILE.
+
+        pymysql only sends files it can open by name so rows are streamed into a temporary
+        file first. The 'local_infile' option has to be enabled on the connection and on the server.
+
+        Arguments:
+            query {string} -- The LOAD DATA statement compiled by the grammar.
+            rows {iterable} -- An iterable of tuples in column order.
+
+        Keyword Arguments:
+            batch_size {int} -- Unused. The file is loaded with one statement. (default: {10000})
+
+        Returns:
+            int -- The number of rows loaded.
+        """
+        if not self.options.get("local_infile"):
+            raise QueryException(
+                "Bulk loading into MySQL uses LOAD DATA LOCAL INFILE. Enable it by adding 'local_infile': True to the connection options."
+            )
+
+        connection = self.get_open_connection()
+        if connection is not self:
+            return connection.bulk_load(query, rows, batch_size)
+
+        count = 0
+        start = timer()
+        buffer = tempfile.NamedTemporaryFile(
+            "w", encoding="utf-8", newline="", suffix=".tsv", delete=False
+        )
+        try:
+            with buffer:
+                for row in rows:
+                    buffer.write(self.encode_bulk_load_row(row))
+                    count += 1
+
+            with self._connection.cursor() as cursor:
+                cursor.execute(self.prepare_query(query), (buffer.name,))
+        except Exception as e:
+            raise QueryException(str(e)) from e
+        finally:
+            os.remove(buffer.name)
+            if self.get_transaction_level() <= 0:
+                self.close_connection()
+
+        self.log_bulk_load(query, count, start)
+        return count
+
     def query(self, query, bindings=(), results="*"):
         """Make the actual query that will reach the database and come back with a result.
 
@@ -137,8 +235,9 @@ class MySQLConnection(BaseConnection):
         if self._dry:
             return {}
 
-        if not self._connection.open:
-            self._connection.connect()
+        connection = self.get_open_connection()
+        if connection is not self:
+            return connection.query(query, bindings, results)
 
         self._cursor = self._connection.cursor()
 
@@ -146,11 +245,11 @@ class MySQLConnection(BaseConnection):
             with self._cursor as cursor:
                 if isinstance(query, list):
                     for q in query:
-                        q = q.replace("'?'", "%s")
+                        q = self.prepare_query(q)
                         self.statement(q, ())
                     return
 
-                query = query.replace("'?'", "%s")
+                query = self.prepare_query(query)
                 self.statement(query, bindings)
                 if results == 1:
                     return self.format_cursor_results(cursor.fetchone())
@@ -160,5 +259,4 @@ class MySQLConnection(BaseConnection):
             raise QueryException(str(e)) from e
         finally:
             if self.get_transaction_level() <= 0:
-                self.open = 0
-                self._connection.close()
+                self.close_connection()
@@ -0,0 +1,6 @@
+class NativeQuery(str):
+    """SQL compiled with the placeholder of the connection driver.
+
+    Connections send it to the driver as it is instead of swapping the
+    grammar's qmark placeholders.
+    """
@@ -1,3 +1,7 @@
+import itertools
+import uuid
+from timeit import default_timer as timer
+
 from ..exceptions import DriverNotFound
 from .BaseConnection import BaseConnection
 from ..query.grammars import PostgresGrammar
@@ -6,13 +10,12 @@ from ..query.processors import PostgresPostProcessor
 from ..exceptions import QueryException
 
 
-CONNECTION_POOL = []
-
-
 class PostgresConnection(BaseConnection):
     """Postgres Connection class."""
 
     name = "postgres"
+    max_parameters = 65535
+    placeholder = "%s"
 
     def __init__(
         self,
@@ -46,6 +49,21 @@ class PostgresConnection(BaseConnection):
 
     def make_connection(self):
         """This sets the connection on the connection class"""
+        if self.has_global_connection():
+            return self.get_global_connection()
+
+        self._pool = self.get_pool()
+        if self._pool:
+            self._connection = self._pool.acquire()
+        else:
+            self._connection = self.create_connection()
+
+        self.open = 1
+
+        return self
+
+    def create_connection(self):
+        """Opens a new psycopg2 connection in autocommit mode"""
         try:
             import psycopg2
         except ModuleNotFoundError:
@@ -53,10 +71,7 @@ class PostgresConnection(BaseConnection):
                 "You must have the 'psycopg2' package installed to make a connection to Postgres. Please install it using 'pip install psycopg2-binary'"
             )
 
-        if self.has_global_connection():
-            return self.get_global_connection()
-
-        self._connection = psycopg2.connect(
+        connection = psycopg2.connect(
             database=self.database,
             user=self.user,
             password=self.password,
@@ -64,11 +79,28 @@ class PostgresConnection(BaseConnection):
             port=self.port,
         )
 
-        self._connection.autocommit = True
+        connection.autocommit = True
 
-        self.open = 1
+        return connection
 
-        return self
+    def ping_connection(self, connection):
+        if connection.closed:
+            raise ConnectionError("The connection is closed")
+
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT 1")
+
+    def reset_connection(self, connection):
+        """Rolls back anything left open so a pooled connection is never handed out idle in transaction"""
+        from psycopg2.extensions import TRANSACTION_STATUS_IDLE
+
+        if connection.closed:
+            raise ConnectionError("The connection is closed")
+
+        if connection.get_transaction_status() != TRANSACTION_STATUS_IDLE:
+            connection.rollback()
+
+        connection.autocommit = True
 
     def get_database_name(self):
         return self.database
@@ -90,25 +122,41 @@ class PostgresConnection(BaseConnection):
 
     def commit(self):
         """Transaction"""
-        if self.get_transaction_level() == 1:
+        if self.get_transaction_level() > 1:
+            self.release_savepoint()
+        elif self.get_transaction_level() == 1:
             self._connection.commit()
             self._connection.autocommit = True
 
         self.transaction_level -= 1
+        if self.get_transaction_level() <= 0:
+            self.close_connection()
 
     def begin(self):
         """Postgres Transaction"""
-        self._connection.autocommit = False
+        connection = self.get_open_connection()
+        if connection is not self:
+            return connection.begin()
+
         self.transaction_level += 1
+        if self.get_transaction_level() > 1:
+            self.create_savepoint()
+        else:
+            self._connection.autocommit = False
+
         return self
 
     def rollback(self):
         """Transaction"""
-        if self.get_transaction_level() == 1:
+        if self.get_transaction_level() > 1:
+            self.rollback_to_savepoint()
+        elif self.get_transaction_level() == 1:
             self._connection.rollback()
             self._connection.autocommit = True
 
         self.transaction_level -= 1
+        if self.get_transaction_level() <= 0:
+            self.close_connection()
 
     def get_transaction_level(self):
         """Transaction"""
@@ -120,6 +168,63 @@ class PostgresConnection(BaseConnection):
         self._cursor = self._connection.cursor(cursor_factory=RealDictCursor)
         return self._cursor
 
+    def get_streaming_cursor(self):
+        """Named cursor that keeps the result on the server and fetches it in batches.
+
+        Named cursors only exist inside a transaction so one is opened when none is active.
+        It ends when the connection is closed or reset after the stream.
+        """
+        from psycopg2.extras import RealDictCursor
+
+        if self.get_transaction_level() <= 0:
+            self._connection.autocommit = False
+
+        return self._connection.cursor(
+            name=f"masonite_cursor_{uuid.uuid4().hex}", cursor_factory=RealDictCursor
+        )
+
+    def bulk_load(self, query, rows, batch_size=10000):
+        """Streams rows into a table with COPY ... FROM STDIN.
+
+        Rows are encoded as they are read by the driver so the whole load never has to be held in memory.
+        COPY is a single statement so the load is atomic even outside of a transaction.
+
+        Arguments:
+            query {string} -- The COPY statement compiled by the grammar.
+            rows {iterable} -- An iterable of tuples in column order.
+
+        Keyword Arguments:
+            batch_size {int} -- Unused. COPY streams every row in one statement. (default: {10000})
+
+        Returns:
+            int -- The number of rows loaded.
+        """
+        if not self.open or self._connection.closed:
+            connection = self.make_connection()
+            if connection is not self:
+                return connection.bulk_load(query, rows, batch_size)
+
+        counter = itertools.count()
+        lines = (self.encode_bulk_load_row(row) for row, _ in zip(rows, counter))
+
+        start = timer()
+        try:
+            with self._connection.cursor() as cursor:
+                cursor.copy_expert(query, CopyBuffer(lines))
+        except Exception as e:
+            raise QueryException(str(e)) from e
+        finally:
+            if self.get_transaction_level() <= 0:
+                self.close_connection()
+
+        count = next(counter)
+        self.log_bulk_load(query, count, start)
+        return count
+
+    def encode_bulk_load_bytes(self, value):
+        """Writes bytea values in hex. The backslash is escaped for the COPY text format."""
+        return "\\\\x" + value.hex()
+
     def query(self, query, bindings=(), results="*"):
         """Make the actual query that will reach the database and come back with a result.
 
@@ -135,8 +240,10 @@ class PostgresConnection(BaseConnection):
             dict|None -- Returns a dictionary of results or None
         """
         try:
-            if self._connection.closed:
-                self.make_connection()
+            if not self.open or self._connection.closed:
+                connection = self.make_connection()
+                if connection is not self:
+                    return connection.query(query, bindings, results)
 
             self.set_cursor()
 
@@ -146,17 +253,37 @@ class PostgresConnection(BaseConnection):
                         self.statement(q, ())
                     return
 
-                query = query.replace("'?'", "%s")
+                query = self.prepare_query(query)
                 self.statement(query, bindings)
                 if results == 1:
                     return dict(cursor.fetchone() or {})
                 else:
-                    if "SELECT" in cursor.statusmessage:
+                    if cursor.description:
                         return cursor.fetchall()
                     return {}
         except Exception as e:
             raise QueryException(str(e)) from e
         finally:
             if self.get_transaction_level() <= 0:
-                self.open = 0
-                self._connection.close()
+                self.close_connection()
+
+
+class CopyBuffer:
+    """A read only file object that feeds COPY ... FROM STDIN from an iterator of lines."""
+
+    def __init__(self, lines):
+        self._lines = lines
+        self._buffer = ""
+
+    def read(self, size=-1):
+        while size < 0 or len(self._buffer) < size:
+            line = next(self._lines, None)
+            if line is None:
+                break
+            self._buffer += line
+
+        if size < 0:
+            size = len(self._buffer)
+
+        chunk, self._buffer = self._buffer[:size], self._buffer[size:]
+        return chunk
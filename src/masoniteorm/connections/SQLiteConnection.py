@@ -1,8 +1,30 @@
+import threading
+
 from ..query.grammars import SQLiteGrammar
 from .BaseConnection import BaseConnection
 from ..schema.platforms import SQLitePlatform
 from ..query.processors import SQLitePostProcessor
-from ..exceptions import QueryException
+from ..exceptions import QueryException, DriverNotFound
+
+
+class ThreadConnections(dict):
+    """Persistent connections of a single thread.
+
+    The thread local storage is discarded when its thread exits which closes
+    any connection that close_thread_connections() was not called for.
+    """
+
+    def close(self):
+        for connection in self.values():
+            try:
+                connection.close()
+            except Exception:
+                pass
+
+        self.clear()
+
+    def __del__(self):
+        self.close()
 
 
 class SQLiteConnection(BaseConnection):
@@ -12,6 +34,9 @@ class SQLiteConnection(BaseConnection):
 
     _connection = None
 
+    # Long lived connections cached per thread and keyed by connection name and database
+    _thread_connections = threading.local()
+
     def __init__(
         self,
         host=None,
@@ -43,22 +68,106 @@ class SQLiteConnection(BaseConnection):
 
     def make_connection(self):
         """This sets the connection on the connection class"""
+        if self.has_global_connection():
+            return self.get_global_connection()
+
+        if self.is_persistent():
+            self._connection = self.get_persistent_connection()
+        else:
+            self._connection = self.create_connection()
+
+        self.open = 1
+
+        return self
+
+    def create_connection(self):
+        """Opens a new sqlite3 connection and applies the configured PRAGMAs once.
+
+        PRAGMAs and the statement cache size are read from the connection options:
+
+            'options': {
+                'cached_statements': 256,
+                'pragmas': {
+                    'journal_mode': 'WAL',
+                    'synchronous': 'NORMAL',
+                    'cache_size': -64000,
+                    'mmap_size': 268435456,
+                    'temp_store': 'MEMORY',
+                },
+            }
+        """
         try:
             import sqlite3
         except ModuleNotFoundError:
             raise DriverNotFound(
-                "You must have the 'sqlite3' package installed to make a connection to MySQL. Please install it using 'pip install pymysql'"
+                "You must have the 'sqlite3' package installed to make a connection to SQLite."
             )
 
-        if self.has_global_connection():
-            return self.get_global_connection()
+        connection = sqlite3.connect(
+            self.database,
+            isolation_level=None,
+            cached_statements=int(self.options.get("cached_statements", 128)),
+        )
 
-        self._connection = sqlite3.connect(self.database, isolation_level=None)
+        connection.row_factory = sqlite3.Row
 
-        self._connection.row_factory = sqlite3.Row
-        self.open = 1
+        for pragma, value in self.options.get("pragmas", {}).items():
+            connection.execute(f"PRAGMA {pragma} = {value}")
 
-        return self
+        return connection
+
+    def is_persistent(self):
+        """Connections stay open for the life of the thread when 'persistent' is enabled in the options."""
+        return self.options.get("persistent", False)
+
+    def get_persistent_connection(self):
+        """Gets the connection cached for the current thread, opening one if needed."""
+        connections = self.get_thread_connections()
+        key = (self.name, self.database)
+
+        connection = connections.get(key)
+        if connection is not None:
+            try:
+                # Raises if the connection has been closed
+                connection.total_changes
+                return connection
+            except Exception:
+                connections.pop(key)
+
+        connection = connections[key] = self.create_connection()
+        return connection
+
+    @classmethod
+    def get_thread_connections(cls):
+        if not hasattr(cls._thread_connections, "connections"):
+            cls._thread_connections.connections = ThreadConnections()
+
+        return cls._thread_connections.connections
+
+    @classmethod
+    def close_thread_connections(cls):
+        """Closes every persistent connection opened by the current thread.
+
+        Connections are also closed when their thread exits.
+        """
+        cls.get_thread_connections().close()
+
+    def close_connection(self):
+        if self.is_persistent():
+            self.open = 0
+            return
+
+        super().close_connection()
+
+    @classmethod
+    def get_max_parameters(cls):
+        """SQLITE_MAX_VARIABLE_NUMBER defaults to 999 before SQLite 3.32.0 and 32766 after"""
+        import sqlite3
+
+        if sqlite3.sqlite_version_info < (3, 32, 0):
+            return 999
+
+        return 32766
 
     @classmethod
     def get_default_query_grammar(cls):
@@ -81,36 +190,60 @@ class SQLiteConnection(BaseConnection):
     def commit(self):
         """Transaction"""
 
-        if self.get_transaction_level() == 1:
-            self.transaction_level -= 1
+        if self.get_transaction_level() > 1:
+            self.release_savepoint()
+        elif self.get_transaction_level() == 1:
             self._connection.commit()
             self._connection.isolation_level = None
-            self._connection.close()
-            self.open = 0
 
         self.transaction_level -= 1
+        if self.get_transaction_level() <= 0:
+            self.close_connection()
+
         return self
 
     def begin(self):
         """Sqlite Transaction"""
+        connection = self.get_open_connection()
+        if connection is not self:
+            return connection.begin()
+
+        if self.get_transaction_level() > 0:
+            # A savepoint outside of a transaction would open and commit its own transaction
+            if not self._connection.in_transaction:
+                self._connection.execute("BEGIN")
+
+            self.transaction_level += 1
+            self.create_savepoint()
+            return self
+
         self._connection.isolation_level = "DEFERRED"
         self.transaction_level += 1
         return self
 
     def rollback(self):
         """Transaction"""
-        if self.get_transaction_level() == 1:
-            self.transaction_level -= 1
+        if self.get_transaction_level() > 1:
+            self.rollback_to_savepoint()
+        elif self.get_transaction_level() == 1:
             self._connection.rollback()
-            self._connection.close()
-            self.open = 0
+            self._connection.isolation_level = None
 
         self.transaction_level -= 1
+        if self.get_transaction_level() <= 0:
+            self.close_connection()
+
         return self
 
     def get_cursor(self):
         return self._cursor
 
+    def get_tuple_cursor(self):
+        cursor = self._connection.cursor()
+        # The connection returns sqlite3.Row objects
+        cursor.row_factory = None
+        return cursor
+
     def get_transaction_level(self):
         return self.transaction_level
 
@@ -128,8 +261,9 @@ class SQLiteConnection(BaseConnection):
         Returns:
             dict|None -- Returns a dictionary of results or None
         """
-        if not self.open:
-            self.make_connection()
+        connection = self.get_open_connection()
+        if connection is not self:
+            return connection.query(query, bindings, results)
 
         try:
             self._cursor = self._connection.cursor()
@@ -138,32 +272,21 @@ class SQLiteConnection(BaseConnection):
                 for query in query:
                     self.statement(query)
             else:
-                query = query.replace("'?'", "?")
+                query = self.prepare_query(query)
                 self.statement(query, bindings)
                 if results == 1:
-                    result = [dict(row) for row in self._cursor.fetchall()]
-                    if result:
-                        return result[0]
+                    row = self._cursor.fetchone()
+                    # Resets the statement so a partly read select releases its lock
+                    self._cursor.close()
+                    if row:
+                        return dict(row)
                 else:
                     return [dict(row) for row in self._cursor.fetchall()]
         except Exception as e:
             raise QueryException(str(e)) from e
         finally:
             if self.get_transaction_level() <= 0:
-                self._connection.close()
-                self.open = 0
+                self.close_connection()
 
     def format_cursor_results(self, cursor_result):
         return [dict(row) for row in cursor_result]
-
-    def select_many(self, query, bindings, amount):
-        self._cursor = self._connection.cursor()
-        self.statement(query)
-        if not self.open:
-            self.make_connection()
-
-        result = self.format_cursor_results(self._cursor.fetchmany(amount))
-        while result:
-            yield result
-
-            result = self.format_cursor_results(self._cursor.fetchmany(amount))
@@ -0,0 +1,20 @@
+import threading
+
+
+class ThreadLocalVar:
+    """A stand in for contextvars.ContextVar on Python 3.6, which does not have it.
+
+    It offers the 'get' and 'set' methods used by the ORM. Values are kept per thread,
+    so asyncio tasks running on the same thread share them.
+    """
+
+    def __init__(self, name, default=None):
+        self.name = name
+        self._default = default
+        self._local = threading.local()
+
+    def get(self):
+        return getattr(self._local, "value", self._default)
+
+    def set(self, value):
+        self._local.value = value
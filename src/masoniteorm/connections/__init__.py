@@ -1,6 +1,13 @@
 from .ConnectionResolver import ConnectionResolver
 from .ConnectionFactory import ConnectionFactory
+from .ConnectionPool import ConnectionPool
+from .AsyncConnectionPool import AsyncConnectionPool
+from .ConnectionRouter import ConnectionRouter
+from .NativeQuery import NativeQuery
 from .MySQLConnection import MySQLConnection
 from .PostgresConnection import PostgresConnection
 from .SQLiteConnection import SQLiteConnection
 from .MSSQLConnection import MSSQLConnection
+from .AsyncSQLiteConnection import AsyncSQLiteConnection
+from .AsyncPostgresConnection import AsyncPostgresConnection
+from .AsyncMySQLConnection import AsyncMySQLConnection
@@ -20,3 +20,11 @@ class QueryException(Exception):
 
 class MigrationNotFound(Exception):
     pass
+
+
+class ConnectionPoolExhausted(Exception):
+    pass
+
+
+class InvalidCursor(Exception):
+    pass
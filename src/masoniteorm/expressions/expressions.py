@@ -63,6 +63,22 @@ class UpdateQueryExpression:
         self.update_type = update_type
 
 
+class UpsertExpression:
+    """A helper class to manage upsert expressions."""
+
+    def __init__(self, unique_by, update=()):
+        self.unique_by = list(unique_by)
+        self.update = list(update)
+
+
+class BulkUpdateExpression:
+    """A helper class to manage bulk update expressions."""
+
+    def __init__(self, key, columns=()):
+        self.key = key
+        self.columns = list(columns)
+
+
 class BetweenExpression:
     """A helper class to manage where between expressions."""
 
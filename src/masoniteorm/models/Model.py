@@ -1,18 +1,25 @@
 import json
 from datetime import datetime
+from decimal import Decimal
 
 from inflection import tableize
 import inspect
 
-from ..query import QueryBuilder
+from ..query import QueryBuilder, AsyncQueryBuilder
+from ..connections import ConnectionFactory
 from ..collection import Collection
 from ..observers import ObservesEvents
 from ..scopes import TimeStampsMixin
+from .ModelMetadata import ModelMetadata
 
 """This is a magic class that will help using models like User.first() instead of having to instatiate a class like
 User().first()
 """
 
+# Decoded values that are safe to hand out more than once. Anything else, like the dict
+# of a json cast, could be changed in place and would no longer match the raw value.
+IMMUTABLE_DECODED_TYPES = (str, bytes, int, float, bool, Decimal, datetime)
+
 
 class ModelMeta(type):
     def __getattr__(self, attribute, *args, **kwargs):
@@ -118,14 +125,21 @@ class Model(TimeStampsMixin, ObservesEvents, metaclass=ModelMeta):
         "add_select",
         "avg",
         "bulk_create",
+        "bulk_load",
+        "bulk_update",
         "chunk",
         "count",
+        "cursor_paginate",
         "delete",
+        "estimated_count",
         "find_or_404",
         "find_or_fail",
         "first_or_fail",
         "first",
         "get",
+        "get_async_future",
+        "get_dicts",
+        "get_tuples",
         "has",
         "join",
         "joins",
@@ -137,15 +151,18 @@ class Model(TimeStampsMixin, ObservesEvents, metaclass=ModelMeta):
         "order_by",
         "or_where",
         "paginate",
+        "pluck",
         "select",
         "set_global_scope",
         "simple_paginate",
         "statement",
         "sum",
         "to_qmark",
+        "to_native",
         "to_sql",
         "truncate",
         "update",
+        "upsert",
         "when",
         "where_has",
         "where_from_builder",
@@ -168,16 +185,20 @@ class Model(TimeStampsMixin, ObservesEvents, metaclass=ModelMeta):
     }
 
     def __init__(self):
-        self.__attributes__ = {}
-        self.__original_attributes__ = {}
-        self.__dirty_attributes__ = {}
-        if not hasattr(self, "__appends__"):
-            self.__appends__ = []
-        self._relationships = {}
-        self._global_scopes = {}
-
-        self.get_builder()
-        self.boot()
+        # Set through __dict__ to skip __setattr__. The builder is created and the
+        # model booted the first time the builder is used so hydrating rows stays cheap.
+        state = self.__dict__
+        state["__attributes__"] = {}
+        state["__original_attributes__"] = {}
+        state["__dirty_attributes__"] = {}
+        # Cast and date values by attribute, stored as (raw value, decoded value)
+        state["_decoded_attributes"] = {}
+        try:
+            object.__getattribute__(self, "__appends__")
+        except AttributeError:
+            state["__appends__"] = []
+        state["_relationships"] = {}
+        state["_global_scopes"] = {}
 
     @classmethod
     def get_primary_key(self):
@@ -210,18 +231,41 @@ class Model(TimeStampsMixin, ObservesEvents, metaclass=ModelMeta):
         return self.get_builder()
 
     def get_builder(self):
-        if hasattr(self, "builder"):
-            return self.builder
-        self.builder = QueryBuilder(
+        builder = self.__dict__.get("builder")
+        if builder is not None:
+            return builder
+
+        connection_details = self.get_connection_details()
+        builder_class = self.get_builder_class(connection_details)
+        self.__dict__["builder"] = builder = builder_class(
             connection=self.__connection__,
             table=self.get_table_name(),
-            connection_details=self.get_connection_details(),
+            connection_details=connection_details,
             model=self,
             scopes=self._scopes,
             dry=self.__dry__,
         )
+        self.boot()
+
+        return builder.select(*self.__selects__)
+
+    def get_builder_class(self, connection_details):
+        """Gets the query builder class for the model connection.
 
-        return self.builder.select(*self.__selects__)
+        Models on an asyncio driver (aiosqlite, asyncpg or aiomysql) use the AsyncQueryBuilder.
+
+        Returns:
+            QueryBuilder|AsyncQueryBuilder
+        """
+        connection = self.__connection__
+        if connection == "default":
+            connection = connection_details.get("default")
+
+        driver = connection_details.get(connection, {}).get("driver")
+        if ConnectionFactory.is_async(driver):
+            return AsyncQueryBuilder
+
+        return QueryBuilder
 
     def get_connection_details(self):
         from config.database import ConnectionResolver
@@ -231,19 +275,45 @@ class Model(TimeStampsMixin, ObservesEvents, metaclass=ModelMeta):
     def boot(self):
         if not self._booted:
             self.observe_events(self, "booting")
-            for base_class in inspect.getmro(self.__class__):
-                class_name = base_class.__name__
-
-                if class_name.endswith("Mixin"):
-                    getattr(base_class(), "boot_" + class_name)(self.builder)
+            for boot_method in self.get_boot_methods():
+                boot_method(self.builder)
 
-            self._booted = True
+            self.__dict__["_booted"] = True
             self.observe_events(self, "booted")
 
-            self.append_passthrough(list(self.builder._macros.keys()))
+            self.append_passthrough(self.builder._macros.keys())
+
+    @classmethod
+    def get_boot_methods(cls):
+        """Gets the boot methods of the Mixins of the model. They are looked up once per model class.
+
+        Returns:
+            tuple
+        """
+        boot_methods = cls.__dict__.get("_boot_methods")
+        if boot_methods is None:
+            boot_methods = tuple(
+                getattr(base_class(), "boot_" + base_class.__name__)
+                for base_class in inspect.getmro(cls)
+                if base_class.__name__.endswith("Mixin")
+            )
+            cls._boot_methods = boot_methods
+
+        return boot_methods
+
+    @classmethod
+    def get_passthrough(cls):
+        """Gets the names of the methods passed through to the query builder.
+
+        Returns:
+            frozenset|None -- None until the first model of the class is booted and its macros are known.
+        """
+        return cls.__dict__.get("_passthrough")
 
     def append_passthrough(self, passthrough):
-        self.__passthrough__ += passthrough
+        cls = self.__class__
+        names = cls.get_passthrough() or frozenset(cls.__passthrough__)
+        cls._passthrough = names.union(passthrough)
         return self
 
     @classmethod
@@ -325,16 +395,11 @@ class Model(TimeStampsMixin, ObservesEvents, metaclass=ModelMeta):
             return cls.new_collection(response)
 
         elif isinstance(result, dict):
+            # Dates and casts are decoded when the attribute is first read
             model = cls()
-            dic = {}
-            for key, value in result.items():
-                if key in model.get_dates() and value:
-                    value = model.get_new_date(value)
-                dic.update({key: value})
-
             model.observe_events(model, "hydrating")
-            model.__attributes__.update(dic or {})
-            model.__original_attributes__.update(dic or {})
+            model.__attributes__.update(result)
+            model.__original_attributes__.update(result)
             model.add_relation(relations)
             model.observe_events(model, "hydrated")
             return model
@@ -355,6 +420,9 @@ class Model(TimeStampsMixin, ObservesEvents, metaclass=ModelMeta):
     def fill(self, attributes):
         self.__attributes__.update(attributes)
         self.__original_attributes__.update(attributes)
+        decoded_attributes = self.__dict__.setdefault("_decoded_attributes", {})
+        for key in attributes:
+            decoded_attributes.pop(key, None)
         return self
 
     @classmethod
@@ -435,7 +503,8 @@ class Model(TimeStampsMixin, ObservesEvents, metaclass=ModelMeta):
                 if key in serialized_dictionary:
                     serialized_dictionary.pop(key)
 
-        for date_column in self.get_dates():
+        metadata = self.get_metadata()
+        for date_column in metadata.dates:
             if (
                 date_column in serialized_dictionary
                 and serialized_dictionary[date_column]
@@ -458,8 +527,8 @@ class Model(TimeStampsMixin, ObservesEvents, metaclass=ModelMeta):
         for key, value in serialized_dictionary.items():
             if isinstance(value, datetime):
                 value = self.get_new_serialized_date(value)
-            if key in self.__casts__:
-                value = self._cast_attribute(key, value)
+            if key in metadata.getters:
+                value = metadata.getters[key](value)
 
             serialized_dictionary.update({key: value})
 
@@ -480,11 +549,22 @@ class Model(TimeStampsMixin, ObservesEvents, metaclass=ModelMeta):
         total = {}
         total.update(updates)
         total.update(wheres)
+
+        if inspect.isawaitable(record):
+            return self._update_or_create_async(record, wheres, total)
+
         if not record:
             return self.create(total)
 
         return self.where(wheres).update(total)
 
+    async def _update_or_create_async(self, record, wheres, total):
+        """Finishes updating or creating a model on an async connection"""
+        if not await record:
+            return await self.create(total)
+
+        return await self.where(wheres).update(total)
+
     def relations_to_dict(self):
         """Converts a models relationships to a dictionary
 
@@ -534,17 +614,26 @@ class Model(TimeStampsMixin, ObservesEvents, metaclass=ModelMeta):
             mixed: Could be anything that a method can return.
         """
 
-        if attribute in self.__passthrough__:
+        if attribute == "builder":
+            return self.get_builder()
+
+        passthrough = self.get_passthrough()
+        if passthrough is None:
+            # Macros added by the scopes are known once a model of the class is booted
+            self.get_builder()
+            passthrough = self.get_passthrough() or self.__passthrough__
+
+        if attribute in passthrough:
 
             def method(*args, **kwargs):
                 return getattr(self.get_builder(), attribute)(*args, **kwargs)
 
             return method
 
-        new_name_accessor = "get_" + attribute + "_attribute"
-
-        if (new_name_accessor) in self.__class__.__dict__:
-            return self.__class__.__dict__.get(new_name_accessor)(self)
+        metadata = self.get_metadata()
+        accessor = metadata.accessors.get(attribute)
+        if accessor:
+            return accessor(self)
 
         if (
             "__dirty_attributes__" in self.__dict__
@@ -556,11 +645,9 @@ class Model(TimeStampsMixin, ObservesEvents, metaclass=ModelMeta):
             "__attributes__" in self.__dict__
             and attribute in self.__dict__["__attributes__"]
         ):
-            if attribute in self.get_dates():
-                return (
-                    self.get_new_date(self.get_value(attribute))
-                    if self.get_value(attribute)
-                    else None
+            if attribute in metadata.dates:
+                return self._decode_attribute(
+                    attribute, self.__attributes__[attribute], date=True
                 )
             return self.get_value(attribute)
 
@@ -575,16 +662,19 @@ class Model(TimeStampsMixin, ObservesEvents, metaclass=ModelMeta):
         return None
 
     def __setattr__(self, attribute, value):
-        if hasattr(self, "set_" + attribute + "_attribute"):
-            method = getattr(self, "set_" + attribute + "_attribute")
-            value = method(value)
+        metadata = self.get_metadata()
+        mutator = metadata.mutators.get(attribute)
+        if mutator:
+            value = getattr(self, mutator)(value)
 
-        if attribute in self.__casts__:
-            value = self._set_cast_attribute(attribute, value)
+        setter = metadata.setters.get(attribute)
+        if setter:
+            value = setter(value)
 
         try:
             if not attribute.startswith("_"):
                 self.__dict__["__dirty_attributes__"].update({attribute: value})
+                self.__dict__["_decoded_attributes"].pop(attribute, None)
             else:
                 self.__dict__[attribute] = value
         except KeyError:
@@ -599,13 +689,21 @@ class Model(TimeStampsMixin, ObservesEvents, metaclass=ModelMeta):
         Returns:
             mixed: Any value an attribute can be.
         """
-        return self.__attributes__.get(attribute)
+        value = self.__attributes__.get(attribute)
+        if attribute in self.get_metadata().dates:
+            return self._decode_attribute(attribute, value, date=True)
+
+        return value
 
     def is_dirty(self):
         return bool(self.__dirty_attributes__)
 
     def get_original(self, key):
-        return self.__original_attributes__.get(key)
+        value = self.__original_attributes__.get(key)
+        if key in self.get_metadata().dates:
+            return self._decode_attribute(key, value, date=True)
+
+        return value
 
     def get_dirty(self, key):
         return self.__dirty_attributes__.get(key)
@@ -626,6 +724,10 @@ class Model(TimeStampsMixin, ObservesEvents, metaclass=ModelMeta):
                 result = builder.update(self.__dirty_attributes__)
             else:
                 result = self.create(self.__dirty_attributes__, query=query)
+
+            if inspect.isawaitable(result):
+                return self._save_async(result)
+
             self.observe_events(self, "saved")
             self.fill(result.__attributes__)
             return result
@@ -637,26 +739,56 @@ class Model(TimeStampsMixin, ObservesEvents, metaclass=ModelMeta):
 
         return result
 
-    def get_value(self, attribute):
-        value = self.__attributes__[attribute]
-        if attribute in self.__casts__:
-            return self._cast_attribute(attribute, value)
+    async def _save_async(self, result):
+        """Finishes saving a model on an async connection"""
+        result = await result
+        self.observe_events(self, "saved")
+        self.fill(result.__attributes__)
+        return result
 
-        return value
+    def get_value(self, attribute):
+        return self._decode_attribute(
+            attribute,
+            self.__attributes__[attribute],
+            date=attribute in self.get_metadata().dates,
+        )
 
     def get_dirty_value(self, attribute):
-        value = self.__dirty_attributes__[attribute]
-        if attribute in self.__casts__:
-            return self._cast_attribute(attribute, value)
+        return self._decode_attribute(attribute, self.__dirty_attributes__[attribute])
 
-        return value
+    def _decode_attribute(self, attribute, value, date=False):
+        """Casts a raw value and converts it to a date, at most once per raw value.
+
+        Only immutable results are reused. Mutable ones are decoded again on every read.
+
+        Returns:
+            mixed
+        """
+        getter = self.get_metadata().getters.get(attribute)
+        if not getter and not date:
+            return value
+
+        decoded_attributes = self.__dict__.setdefault("_decoded_attributes", {})
+        cached = decoded_attributes.get(attribute)
+        if cached is not None and cached[0] is value:
+            return cached[1]
+
+        decoded = getter(value) if getter else value
+        if date:
+            decoded = self.get_new_date(decoded) if decoded else None
+
+        if isinstance(decoded, IMMUTABLE_DECODED_TYPES):
+            decoded_attributes[attribute] = (value, decoded)
+
+        return decoded
 
     def all_attributes(self):
         attributes = self.__attributes__
         attributes.update(self.get_dirty_attributes())
+        getters = self.get_metadata().getters
         for key, value in attributes.items():
-            if key in self.__casts__:
-                attributes.update({key: self._cast_attribute(key, value)})
+            if key in getters:
+                attributes.update({key: getters[key](value)})
 
         return attributes
 
@@ -666,27 +798,30 @@ class Model(TimeStampsMixin, ObservesEvents, metaclass=ModelMeta):
         return self.__dirty_attributes__ or {}
 
     def get_cast_map(self):
-        cast_map = self.__internal_cast_map__
+        cast_map = dict(self.__internal_cast_map__)
         cast_map.update(self.__cast_map__)
         return cast_map
 
-    def _cast_attribute(self, attribute, value):
-        cast_method = self.__casts__[attribute]
-        cast_map = self.get_cast_map()
+    def get_metadata(self):
+        """Gets the dates, casts, accessors and mutators of the model class.
 
-        if isinstance(cast_method, str):
-            return cast_map[cast_method]().get(value)
+        They are worked out from the first model of the class that needs them.
 
-        return cast_method(value)
+        Returns:
+            masoniteorm.models.ModelMetadata
+        """
+        metadata = self.__class__.__dict__.get("_metadata")
+        if metadata is None:
+            metadata = ModelMetadata(self)
+            self.__class__._metadata = metadata
 
-    def _set_cast_attribute(self, attribute, value):
-        cast_method = self.__casts__[attribute]
-        cast_map = self.get_cast_map()
+        return metadata
 
-        if isinstance(cast_method, str):
-            return cast_map[cast_method]().set(value)
+    def _cast_attribute(self, attribute, value):
+        return self.get_metadata().getters[attribute](value)
 
-        return cast_method(value)
+    def _set_cast_attribute(self, attribute, value):
+        return self.get_metadata().setters[attribute](value)
 
     @classmethod
     def load(cls, *loads):
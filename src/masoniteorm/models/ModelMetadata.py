@@ -0,0 +1,46 @@
+class ModelMetadata:
+    """What reading and writing the attributes of a model needs to know about its class.
+
+    It is built once per model class, from the first model that needs it, so attribute
+    access is a couple of dictionary lookups instead of rebuilding the date columns and
+    the cast map and instantiating a cast on every read:
+
+        User().get_metadata().dates
+        # frozenset({'created_at', 'updated_at', 'verified_at'})
+    """
+
+    __slots__ = ("dates", "getters", "setters", "accessors", "mutators")
+
+    def __init__(self, model):
+        """ModelMetadata initializer
+
+        Arguments:
+            model {masoniteorm.models.Model} -- A model of the class to describe.
+        """
+        cls = model.__class__
+
+        self.dates = frozenset(model.get_dates())
+
+        # Cast instances are shared by every model of the class
+        cast_map = model.get_cast_map()
+        self.getters = {}
+        self.setters = {}
+        for attribute, cast in model.__casts__.items():
+            if isinstance(cast, str):
+                cast = cast_map[cast]()
+                self.getters[attribute] = cast.get
+                self.setters[attribute] = cast.set
+            else:
+                self.getters[attribute] = self.setters[attribute] = cast
+
+        # Accessors are only looked up on the class itself, mutators are inherited
+        self.accessors = {
+            name[4:-10]: method
+            for name, method in vars(cls).items()
+            if name.startswith("get_") and name.endswith("_attribute")
+        }
+        self.mutators = {
+            name[4:-10]: name
+            for name in dir(cls)
+            if name.startswith("set_") and name.endswith("_attribute")
+        }
@@ -1 +1,2 @@
 from .Model import Model
+from .ModelMetadata import ModelMetadata
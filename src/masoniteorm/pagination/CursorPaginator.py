@@ -0,0 +1,74 @@
+import base64
+import json
+
+from ..exceptions import InvalidCursor
+from .BasePaginator import BasePaginator
+
+
+class CursorPaginator(BasePaginator):
+    """Paginates with opaque cursors pointing at the first or last row of a page.
+
+    Cursors hold the values of the ordered columns of that row so the next page is
+    fetched with a where expression instead of an offset.
+    """
+
+    def __init__(self, result, per_page, next_cursor=None, previous_cursor=None):
+        self.result = result
+        self.per_page = per_page
+        self.count = len(self.result)
+        self.next_cursor = next_cursor
+        self.previous_cursor = previous_cursor
+
+    def serialize(self):
+        return {
+            "data": self.result.serialize(),
+            "meta": {
+                "next_cursor": self.next_cursor,
+                "previous_cursor": self.previous_cursor,
+                "count": self.count,
+                "per_page": self.per_page,
+            },
+        }
+
+    def has_more_pages(self):
+        return self.next_cursor is not None
+
+    @staticmethod
+    def encode_cursor(values, direction="next"):
+        """Encodes the values of a row into a cursor.
+
+        Arguments:
+            values {list} -- The values of the ordered columns.
+
+        Keyword Arguments:
+            direction {string} -- Either next or previous. (default: {"next"})
+
+        Returns:
+            string
+        """
+        cursor = json.dumps({"values": values, "direction": direction}, default=str)
+        return base64.urlsafe_b64encode(cursor.encode("utf-8")).decode("ascii")
+
+    @staticmethod
+    def decode_cursor(cursor):
+        """Decodes a cursor made by 'encode_cursor'.
+
+        Raises:
+            InvalidCursor: Raised when the cursor was not made by 'encode_cursor'.
+
+        Returns:
+            dict -- The values and the direction of the cursor.
+        """
+        try:
+            decoded = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        except (ValueError, TypeError, AttributeError):
+            raise InvalidCursor(f"The cursor '{cursor}' is not valid")
+
+        if (
+            not isinstance(decoded, dict)
+            or not isinstance(decoded.get("values"), list)
+            or decoded.get("direction") not in ("next", "previous")
+        ):
+            raise InvalidCursor(f"The cursor '{cursor}' is not valid")
+
+        return decoded
@@ -0,0 +1,70 @@
+import threading
+import time
+from collections import OrderedDict
+
+
+class TotalsCache:
+    """A thread safe LRU cache of pagination totals that expire after a number of seconds.
+
+    Totals are keyed by the count query of a paginated builder so every page of the
+    same listing shares one entry and only the first page runs the count:
+
+        User.where("active", 1).paginate(20, page, cache_total=60)
+    """
+
+    def __init__(self, maxsize=1024):
+        """TotalsCache initializer
+
+        Keyword Arguments:
+            maxsize {int} -- The most totals kept. (default: {1024})
+        """
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """Gets a total that has not expired yet.
+
+        Arguments:
+            key {tuple} -- The key the total was stored with.
+
+        Returns:
+            int|None
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            total, expires_at = entry
+            if expires_at <= self._now():
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            return total
+
+    def set(self, key, total, ttl):
+        """Stores a total.
+
+        Arguments:
+            key {tuple} -- The key to store the total with.
+            total {int} -- The total number of rows.
+            ttl {int|float} -- The number of seconds the total is kept for.
+        """
+        with self._lock:
+            self._entries[key] = (total, self._now() + ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def forget(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def _now(self):
+        return time.monotonic()
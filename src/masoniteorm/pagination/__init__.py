@@ -1,2 +1,4 @@
 from .LengthAwarePaginator import LengthAwarePaginator
 from .SimplePaginator import SimplePaginator
+from .CursorPaginator import CursorPaginator
+from .TotalsCache import TotalsCache
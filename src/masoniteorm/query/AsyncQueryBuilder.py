@@ -0,0 +1,535 @@
+import asyncio
+import inspect
+
+from ..collection.Collection import Collection
+from ..exceptions import ModelNotFound, HTTP404, QueryException
+from ..pagination import LengthAwarePaginator, SimplePaginator
+from .QueryBuilder import QueryBuilder
+
+
+class AsyncQueryBuilder(QueryBuilder):
+    """A query builder that executes queries on an asyncio connection.
+
+    Building a query works exactly like the QueryBuilder and compiles with the same
+    grammars. Methods that reach the database are coroutines:
+
+        users = await User.where("active", 1).get()
+
+        async for user in User.where("active", 1).cursor():
+            ...
+    """
+
+    def open_connection(self, connection_information):
+        """Gets the async connection class. The connection is opened when the first query runs."""
+        return self.connection_class(**connection_information, name=self.connection)
+
+    async def begin(self):
+        return await self.new_connection(read=False).begin()
+
+    async def commit(self):
+        return await self._connection.commit()
+
+    async def rollback(self):
+        await self._connection.rollback()
+        return self
+
+    async def run_in_transaction(self, callback):
+        """Awaits the callback inside a transaction unless one is already open on the builder.
+
+        Arguments:
+            callback {callable} -- A coroutine function running the queries.
+
+        Returns:
+            The value returned by the callback.
+        """
+        if self.in_transaction():
+            return await callback()
+
+        await self.begin()
+        try:
+            result = await callback()
+        except Exception:
+            await self.rollback()
+            raise
+
+        await self.commit()
+        return result
+
+    async def statement(self, query, bindings=()):
+        result = await self.new_connection().query(query, bindings)
+        return await self.prepare_result(result)
+
+    async def bulk_create(self, creates, query=False, batch_size=None):
+        """Inserts many rows and sets their generated primary keys.
+
+        Rows are split into statements that stay under the connection's parameter and statement
+        size limits and every statement runs in one transaction.
+
+        Arguments:
+            creates {list} -- A list of dictionaries with the same keys.
+
+        Keyword Arguments:
+            query {bool} -- Whether to return the builder instead of running the query. (default: {False})
+            batch_size {int} -- The most rows sent per statement. (default: {None})
+
+        Returns:
+            Collection|list -- The created models or rows with their primary keys.
+        """
+        self._creates = creates
+        self.set_action("bulk_create")
+
+        if query:
+            return self
+
+        if self.dry or not creates:
+            return self._hydrate_rows(self._creates)
+
+        rows = [dict(row) for row in creates]
+        id_key = self._model.get_primary_key() if self._model else "id"
+        processor = self.get_processor()
+
+        async def run_batches():
+            for batch in self.get_batches(rows, len(rows[0]), batch_size):
+                results = await self.new_connection().query(
+                    self._compile_batch("bulk_create", batch), self._bindings
+                )
+                processed = processor.process_bulk_insert_get_ids(
+                    self, batch, results, id_key
+                )
+                if inspect.isawaitable(processed):
+                    await processed
+
+        await self.run_in_transaction(run_batches)
+
+        return self._hydrate_rows(rows)
+
+    def bulk_load(self, rows, columns=None, batch_size=10000):
+        """Bulk loading is not supported by the asyncio drivers. Use 'bulk_create' instead.
+
+        Raises:
+            NotImplementedError
+        """
+        raise NotImplementedError(
+            f"'{self.connection_class.__name__}' does not support bulk loading. Use 'await builder.bulk_create(rows)' instead."
+        )
+
+    async def upsert(self, rows, unique_by, update=None, batch_size=None, query=False):
+        rows = self._prepare_upsert(rows, unique_by, update)
+        if not rows:
+            return 0
+
+        if query:
+            return self
+
+        if self.dry:
+            return len(rows)
+
+        async def run_batches():
+            for batch in self.get_batches(rows, len(rows[0]), batch_size):
+                await self.new_connection().query(
+                    self._compile_batch("upsert", batch), self._bindings
+                )
+
+        await self.run_in_transaction(run_batches)
+
+        return len(rows)
+
+    async def bulk_update(
+        self, records, columns=None, key=None, batch_size=None, query=False
+    ):
+        records, rows = self._prepare_bulk_update(records, columns, key)
+        if not rows:
+            return 0
+
+        if query:
+            return self
+
+        if self.dry:
+            return len(rows)
+
+        async def run_batches():
+            for batch in self._get_bulk_update_batches(rows, batch_size):
+                await self.new_connection().query(
+                    self._compile_batch("bulk_update", batch), self._bindings
+                )
+
+        await self.run_in_transaction(run_batches)
+
+        self._fill_bulk_updated_models(records, rows)
+        return len(rows)
+
+    async def create(self, creates=None, query=False, id_key="id", **kwargs):
+        """Specifies a dictionary that should be used to create new values.
+
+        Arguments:
+            creates {dict} -- A dictionary of columns and values.
+
+        Returns:
+            Model|dict
+        """
+        self._creates = {}
+
+        if not creates:
+            creates = kwargs
+
+        self.set_action("insert")
+        self._creates.update(creates)
+
+        if query:
+            return self
+
+        model = self._prepare_create()
+
+        query_result = None
+        if not self.dry:
+            query_result = await self.new_connection().query(
+                self.to_native(), self._bindings, results=1
+            )
+
+        return self._process_create(model, query_result, id_key)
+
+    async def delete(self, column=None, value=None, query=False):
+        """Specify the column and value to delete
+        or deletes everything based on a previously used where expression.
+
+        Keyword Arguments:
+            column {string} -- The name of the column (default: {None})
+            value {string|int} -- The value of the column (default: {None})
+
+        Returns:
+            self
+        """
+        self.set_action("delete")
+
+        if column and value:
+            if isinstance(value, (list, tuple)):
+                self.where_in(column, value)
+            else:
+                self.where(column, value)
+
+        if query:
+            return self
+
+        self._prepare_delete()
+
+        result = await self.new_connection().query(self.to_native(), self._bindings)
+
+        if self._model:
+            self.observe_events(self._model, "deleted")
+
+        return result
+
+    async def update(self, updates: dict, dry=False):
+        """Specifies columns and values to be updated.
+
+        Arguments:
+            updates {dictionary} -- A dictionary of columns and values to update.
+
+        Keyword Arguments:
+            dry {bool} -- Whether the query should be executed. (default: {False})
+
+        Returns:
+            Model|dict
+        """
+        additional = self._prepare_update(updates)
+        if dry or self.dry:
+            return self
+
+        result = await self.new_connection().query(self.to_native(), self._bindings)
+        return self._process_update(result, additional)
+
+    async def count(self, column=None, approximate=False):
+        """Aggregates a columns values.
+
+        Arguments:
+            column {string} -- The name of the column to aggregate.
+
+        Keyword Arguments:
+            approximate {bool} -- Reads the number of rows from the table statistics or the
+                query plan instead of counting them. Falls back to an exact count when the
+                database has no estimate. SQLite only keeps row counts of whole tables after
+                ANALYZE and has no estimates for filtered queries, so those are always counted
+                exactly. (default: {False})
+
+        Returns:
+            int|self
+        """
+        if approximate and column is None and not self.dry:
+            estimate = await self._estimate_count()
+            if estimate is not None:
+                return estimate
+
+        alias = self._prepare_count(column)
+
+        if self.dry:
+            return self
+
+        if not column:
+            result = await self.new_connection().query(
+                self.to_native(), self._bindings, results=1
+            )
+
+            return self._process_count(result, alias)
+        else:
+            return self
+
+    async def estimated_count(self):
+        return await self.count(approximate=True)
+
+    async def _estimate_count(self):
+        estimate_query = self._get_estimate_query(
+            self.connection_class.get_default_platform()()
+        )
+        if not estimate_query:
+            return None
+
+        sql, bindings, process = estimate_query
+        try:
+            if isinstance(sql, list):
+                return process(
+                    await self.run_in_transaction(
+                        lambda: self._run_explain(sql, bindings)
+                    )
+                )
+
+            return process(await self.new_connection().query(sql, bindings))
+        except QueryException:
+            return None
+
+    async def _run_explain(self, statements, bindings):
+        setup, query, restore = statements
+        connection = self.new_connection()
+        await connection.query(setup, ())
+        try:
+            return await connection.query(query, bindings)
+        finally:
+            await connection.query(restore, ())
+
+    async def first(self, query=False):
+        """Gets the first record.
+
+        Returns:
+            Model|dict|None
+        """
+        self.limit(1)
+        if query:
+            return self
+
+        result = await self.new_connection().query(
+            self.to_native(), self._bindings, results=1
+        )
+
+        return await self.prepare_result(result)
+
+    async def exists(self, query=False):
+        if query:
+            return self._compile_exists("to_sql")[0]
+
+        sql, bindings = self._compile_exists("to_native")
+        result = await self.new_connection().query(sql, bindings, results=1)
+
+        return self._process_exists(result)
+
+    async def doesnt_exist(self):
+        return not await self.exists()
+
+    async def last(self, column=None, query=False):
+        """Gets the last record, ordered by column in descendant order or primary
+        key if no column is given.
+
+        Returns:
+            Model|dict|None
+        """
+        self._prepare_last(column)
+        if query:
+            return self
+
+        result = await self.new_connection().query(
+            self.to_native(), self._bindings, results=1
+        )
+
+        return await self.prepare_result(result)
+
+    async def find_or_fail(self, record_id):
+        result = await self.find(record_id=record_id)
+
+        if not result:
+            raise ModelNotFound()
+
+        return result
+
+    async def find_or_404(self, record_id):
+        try:
+            return await self.find_or_fail(record_id)
+        except ModelNotFound:
+            raise HTTP404()
+
+    async def first_or_fail(self, query=False):
+        if query:
+            return self.limit(1)
+
+        result = await self.first()
+
+        if not result:
+            raise ModelNotFound()
+
+        return result
+
+    async def all(self, selects=[], query=False):
+        """Returns all records from the table.
+
+        Returns:
+            Collection
+        """
+        self.select(*selects)
+        if query:
+            return self.to_sql()
+
+        result = (
+            await self.new_connection().query(self.to_native(), self._bindings) or []
+        )
+
+        return await self.prepare_result(result, collection=True)
+
+    async def get(self, selects=[]):
+        """Runs the select query built from the query builder.
+
+        Returns:
+            Collection
+        """
+        self.select(*selects)
+        result = await self.new_connection().query(self.to_native(), self._bindings)
+
+        return await self.prepare_result(result, collection=True)
+
+    async def get_dicts(self, selects=[]):
+        self.select(*selects)
+        return await self._run_select()
+
+    async def get_tuples(self, selects=[]):
+        self.select(*selects)
+        return await self.new_connection().select_tuples(
+            self.to_native(), self._bindings
+        )
+
+    async def values(self, column):
+        self._columns = ()
+        return [row[0] for row in await self.get_tuples([column])]
+
+    async def pluck(self, value, key=None):
+        if key is None:
+            return Collection(await self.values(value))
+
+        self._columns = ()
+        rows = await self.get_tuples([value, key])
+        return Collection({row[1]: row[0] for row in rows})
+
+    async def cursor(self, chunk_size=1000):
+        """Streams the results of the query one row at a time.
+
+        Rows are fetched from the database in batches of chunk_size and are hydrated
+        one by one so large results never have to be held in memory.
+
+        Keyword Arguments:
+            chunk_size {int} -- The number of rows fetched per round trip. (default: {1000})
+
+        Yields:
+            Model|dict
+        """
+        connection = self.new_connection()
+        async for rows in connection.cursor(
+            self.to_native(), self._bindings, chunk_size
+        ):
+            for row in rows:
+                yield self._model.hydrate(row) if self._model else row
+
+    async def chunk(self, chunk_amount):
+        connection = self.new_connection()
+        async for rows in connection.cursor(
+            self.to_native(), self._bindings, chunk_amount
+        ):
+            if not self._model:
+                yield rows
+            else:
+                yield self._model.hydrate(rows)
+
+    def get_async_future(self, method="get", *args, **kwargs):
+        """Schedules a method of the builder as a task on the running event loop.
+
+        Returns:
+            asyncio.Task
+        """
+        return asyncio.ensure_future(getattr(self, method)(*args, **kwargs))
+
+    async def paginate(self, per_page, page=1, window_count=False, cache_total=None):
+        new_from_builder, cache_key, cached = self._prepare_paginate(
+            per_page, page, cache_total
+        )
+
+        total = cached
+        if total is None and window_count:
+            self._select_window_count()
+            rows = await self._run_select()
+            total = self._pop_window_count(rows)
+            result = await self.prepare_result(rows, collection=True)
+        else:
+            result = await self.get()
+
+        if total is None:
+            total = await new_from_builder.count()
+
+        self._cache_total(cache_key, cached, total, cache_total)
+
+        return LengthAwarePaginator(result, per_page, page, total)
+
+    async def _run_select(self):
+        return await self.new_connection().query(self.to_native(), self._bindings) or []
+
+    async def simple_paginate(self, per_page, page=1):
+        if page == 1:
+            offset = 0
+        else:
+            offset = (int(page) * per_page) - per_page
+
+        result = await self.limit(per_page).offset(offset).get()
+
+        return SimplePaginator(result, per_page, page)
+
+    async def cursor_paginate(self, per_page, cursor=None):
+        columns, backwards = self._prepare_cursor_page(per_page, cursor)
+
+        return self._make_cursor_paginator(
+            await self.get(), per_page, columns, bool(cursor), backwards
+        )
+
+    async def truncate(self, foreign_keys=False):
+        sql = self.get_grammar().truncate_table(self.get_table_name(), foreign_keys)
+        if self.dry:
+            return sql
+
+        return await self.new_connection().query(sql, ())
+
+    async def prepare_result(self, result, collection=False):
+        if self._model:
+            hydrated_model = self._model.hydrate(result)
+            if self._eager_relation.eagers and hydrated_model:
+                for related, result_set, relation_key in self._get_eager_loads(
+                    hydrated_model
+                ):
+                    # Relationships to models on an async connection return coroutines
+                    if inspect.isawaitable(result_set):
+                        result_set = await result_set
+
+                    self._register_relationships_to_model(
+                        related, result_set, hydrated_model, relation_key=relation_key
+                    )
+
+            if collection:
+                return hydrated_model if result else Collection([])
+            else:
+                return hydrated_model if result else None
+
+        if collection:
+            return result or Collection([])
+        else:
+            return result or None
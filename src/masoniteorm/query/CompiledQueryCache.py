@@ -0,0 +1,291 @@
+import copy
+import threading
+from collections import OrderedDict
+
+from ..expressions.expressions import (
+    QueryExpression,
+    OrderByExpression,
+    GroupByExpression,
+    SubGroupExpression,
+    SubSelectExpression,
+    Raw,
+)
+
+# Attributes of each expression holding values that are sent as bindings
+SLOT_ATTRIBUTES = {
+    QueryExpression: ("value", "bindings"),
+    OrderByExpression: ("bindings",),
+    GroupByExpression: ("bindings",),
+}
+
+STRUCTURAL_TYPES = (str, int, float, bool, type(None))
+
+SLOT_MARKER = "\x00masoniteorm_slot_"
+
+
+class Uncacheable(Exception):
+    """Raised while fingerprinting a query that cannot be cached."""
+
+
+class Slot:
+    """Stands in for a bound value while a query shape is compiled."""
+
+    __slots__ = ("index",)
+
+    def __init__(self, index):
+        self.index = index
+
+    def __str__(self):
+        return f"{SLOT_MARKER}{self.index}\x00"
+
+    __repr__ = __str__
+
+
+class CompiledQuery:
+    """The SQL of a query shape and where each of its bindings comes from."""
+
+    __slots__ = ("sql", "bindings")
+
+    def __init__(self, sql, bindings):
+        self.sql = sql
+        # Each binding is (True, slot index) for a bound value of the builder
+        # or (False, value) for a value that is part of the shape.
+        self.bindings = bindings
+
+    def get_bindings(self, values):
+        return [values[value] if slot else value for slot, value in self.bindings]
+
+
+class CompiledQueryCache:
+    """A thread safe LRU cache of compiled queries keyed by the shape of the builder.
+
+    The shape is everything that changes the SQL: the grammar, table, columns, where
+    operators, joins, orders, groups, limits and the number of values in IN lists.
+    Values sent as bindings are left out so queries differing only by their values
+    share one entry and skip the grammar entirely:
+
+        QueryBuilder.compiled_cache.stats()
+        # {'hits': 1200, 'misses': 4, 'uncacheable': 0, 'size': 4, 'maxsize': 1024}
+
+    Queries with subqueries or Raw values are always compiled.
+    """
+
+    def __init__(self, maxsize=1024):
+        """CompiledQueryCache initializer
+
+        Keyword Arguments:
+            maxsize {int} -- The most query shapes kept. 0 disables the cache. (default: {1024})
+        """
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._uncacheable = 0
+
+    def compile(self, builder, action, placeholder="'?'"):
+        """Gets the qmark SQL and the bindings of a builder, using the cached shape when possible.
+
+        Arguments:
+            builder {masoniteorm.query.QueryBuilder} -- The builder to compile.
+            action {string} -- The grammar action to compile.
+
+        Keyword Arguments:
+            placeholder {string} -- Written in place of bound values. (default: {"'?'"})
+
+        Returns:
+            tuple|None -- The SQL and bindings or None when the query cannot be cached.
+        """
+        if not self.maxsize:
+            return None
+
+        try:
+            key, values = self.fingerprint(builder, action)
+        except Uncacheable:
+            self._count("_uncacheable")
+            return None
+
+        key = (placeholder, key)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+
+        if entry is None:
+            entry = self._compile_shape(builder, action, len(values), placeholder)
+            if entry is None:
+                self._count("_uncacheable")
+                return None
+
+            self._count("_misses")
+            self._store(key, entry)
+
+        return entry.sql, entry.get_bindings(values)
+
+    def fingerprint(self, builder, action):
+        """Gets the shape of a builder and the values bound into it.
+
+        Raises:
+            Uncacheable: Raised when part of the query cannot be described by its shape.
+
+        Returns:
+            tuple -- The cache key and the list of bound values in slot order.
+        """
+        if builder._creates:
+            raise Uncacheable()
+
+        values = []
+        key = (
+            builder.grammar,
+            action,
+            self._describe(builder._table, values),
+            self._describe(builder._columns, values),
+            self._describe(builder._wheres, values),
+            self._describe(builder._joins, values),
+            self._describe(builder._aggregates, values),
+            self._describe(builder._order_by, values),
+            self._describe(builder._group_by, values),
+            self._describe(builder._having, values),
+            self._describe(builder._limit, values),
+            self._describe(builder._offset, values),
+        )
+        return key, values
+
+    def stats(self):
+        """Returns a snapshot of the cache usage.
+
+        Returns:
+            dict
+        """
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "uncacheable": self._uncacheable,
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+        }
+
+    def clear(self):
+        """Removes every cached query and resets the stats."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = self._misses = self._uncacheable = 0
+
+    def _compile_shape(self, builder, action, size, placeholder="'?'"):
+        """Compiles the builder with a Slot in place of every bound value.
+
+        Returns None when the grammar writes a bound value into the SQL itself.
+        """
+        # A shallow copy without going through the builder's __getattr__
+        shaped = builder.__class__.__new__(builder.__class__)
+        shaped.__dict__.update(builder.__dict__)
+        slots = iter(Slot(index) for index in range(size))
+        shaped._wheres = self._fill(builder._wheres, slots)
+        shaped._order_by = self._fill(builder._order_by, slots)
+        shaped._group_by = self._fill(builder._group_by, slots)
+
+        grammar = shaped.get_grammar(placeholder=placeholder)
+        sql = grammar.compile(action, qmark=True).to_sql()
+        if SLOT_MARKER in sql:
+            return None
+
+        bindings = []
+        for binding in grammar._bindings:
+            if isinstance(binding, Slot):
+                bindings.append((True, binding.index))
+            elif SLOT_MARKER in repr(binding):
+                return None
+            else:
+                bindings.append((False, binding))
+
+        return CompiledQuery(sql, tuple(bindings))
+
+    def _describe(self, value, values):
+        if isinstance(value, STRUCTURAL_TYPES):
+            # True, 1 and 1.0 are equal keys but are written differently in the SQL
+            return (value.__class__, value)
+
+        if isinstance(value, (list, tuple)):
+            return tuple(self._describe(item, values) for item in value)
+
+        if value.__class__.__module__ != QueryExpression.__module__ or isinstance(
+            value, (SubGroupExpression, SubSelectExpression, Raw)
+        ):
+            raise Uncacheable()
+
+        slot_attributes = self._slot_attributes(value)
+        description = [value.__class__]
+        for attribute, item in sorted(vars(value).items()):
+            if attribute in slot_attributes:
+                description.append(
+                    (attribute, self._add_slots(item, values, attribute))
+                )
+            else:
+                description.append((attribute, self._describe(item, values)))
+
+        return tuple(description)
+
+    def _add_slots(self, value, values, attribute):
+        # Lists of values and the bindings of raw expressions get one slot per item
+        if isinstance(value, list) or attribute == "bindings":
+            for item in value:
+                self._add_slots(item, values, None)
+            return (type(value), len(value))
+
+        if isinstance(value, (SubGroupExpression, SubSelectExpression, Raw)) or hasattr(
+            value, "get_grammar"
+        ):
+            raise Uncacheable()
+
+        values.append(value)
+        return Slot
+
+    def _fill(self, expressions, slots):
+        filled = []
+        for expression in expressions:
+            slot_attributes = self._slot_attributes(expression)
+            if slot_attributes:
+                expression = copy.copy(expression)
+                # Same order as the attributes are described in
+                for attribute in sorted(slot_attributes):
+                    setattr(
+                        expression,
+                        attribute,
+                        self._take_slots(
+                            getattr(expression, attribute), slots, attribute
+                        ),
+                    )
+            filled.append(expression)
+
+        return tuple(filled)
+
+    def _take_slots(self, value, slots, attribute):
+        if isinstance(value, list) or attribute == "bindings":
+            return type(value)(self._take_slots(item, slots, None) for item in value)
+
+        return next(slots)
+
+    @staticmethod
+    def _slot_attributes(expression):
+        attributes = SLOT_ATTRIBUTES.get(expression.__class__, ())
+        # Only plain values are bound. Columns, NULL checks and True are part of the SQL.
+        if (
+            isinstance(expression, QueryExpression)
+            and not expression.raw
+            and (expression.value_type != "value" or expression.value is True)
+        ):
+            return tuple(attribute for attribute in attributes if attribute != "value")
+
+        return attributes
+
+    def _store(self, key, entry):
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def _count(self, counter):
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
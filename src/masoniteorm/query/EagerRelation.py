@@ -23,6 +23,16 @@ class EagerRelations:
 
         return self
 
+    def clone(self):
+        eager_relation = EagerRelations(self.relation)
+        eager_relation.eagers = list(self.eagers)
+        eager_relation.nested_eagers = {
+            relation: list(nested) for relation, nested in self.nested_eagers.items()
+        }
+        eager_relation.is_nested = self.is_nested
+
+        return eager_relation
+
     def get_eagers(self):
         eagers = []
         if self.eagers:
@@ -1,4 +1,5 @@
 import inspect
+import itertools
 
 from ..collection.Collection import Collection
 from ..expressions.expressions import (
@@ -11,6 +12,8 @@ from ..expressions.expressions import (
     QueryExpression,
     OrderByExpression,
     UpdateQueryExpression,
+    UpsertExpression,
+    BulkUpdateExpression,
     JoinExpression,
     HavingExpression,
     FromTable,
@@ -18,15 +21,35 @@ from ..expressions.expressions import (
 
 from ..scopes import BaseScope
 from ..schema import Schema
+from ..connections.ConnectionRouter import ConnectionRouter
+from ..connections.NativeQuery import NativeQuery
 from ..observers import ObservesEvents
-from ..exceptions import ModelNotFound, HTTP404, ConnectionNotRegistered
-from ..pagination import LengthAwarePaginator, SimplePaginator
+from ..exceptions import (
+    ModelNotFound,
+    HTTP404,
+    ConnectionNotRegistered,
+    InvalidCursor,
+    QueryException,
+)
+from ..pagination import (
+    LengthAwarePaginator,
+    SimplePaginator,
+    CursorPaginator,
+    TotalsCache,
+)
 from .EagerRelation import EagerRelations
+from .CompiledQueryCache import CompiledQueryCache
 
 
 class QueryBuilder(ObservesEvents):
     """A builder class to manage the building and creation of query expressions."""
 
+    # Compiled selects shared by every builder, keyed by the shape of the query
+    compiled_cache = CompiledQueryCache()
+
+    # Pagination totals kept by 'paginate' when it is given cache_total
+    totals_cache = TotalsCache()
+
     def __init__(
         self,
         grammar=None,
@@ -54,6 +77,7 @@ class QueryBuilder(ObservesEvents):
         self.connection = connection
         self.connection_class = connection_class
         self._connection = None
+        self._read_connection = None
         self._connection_details = connection_details or {}
         self._connection_driver = connection_driver
         self._scopes = scopes or {}
@@ -74,6 +98,8 @@ class QueryBuilder(ObservesEvents):
         self._bindings = ()
 
         self._updates = ()
+        self._upsert = None
+        self._bulk_update = None
 
         self._wheres = ()
         self._order_by = ()
@@ -117,22 +143,19 @@ class QueryBuilder(ObservesEvents):
 
         return self
 
-    def get_connection_information(self):
+    def get_connection_information(self, details=None):
+        if details is None:
+            details = self._connection_details.get(self.connection, {})
+
         return {
-            "host": self._connection_details.get(self.connection, {}).get("host"),
-            "database": self._connection_details.get(self.connection, {}).get(
-                "database"
-            ),
-            "user": self._connection_details.get(self.connection, {}).get("user"),
-            "port": self._connection_details.get(self.connection, {}).get("port"),
-            "password": self._connection_details.get(self.connection, {}).get(
-                "password"
-            ),
-            "prefix": self._connection_details.get(self.connection, {}).get("prefix"),
-            "options": self._connection_details.get(self.connection, {}).get(
-                "options", {}
-            ),
-            "full_details": self._connection_details.get(self.connection, {}),
+            "host": details.get("host"),
+            "database": details.get("database"),
+            "user": details.get("user"),
+            "port": details.get("port"),
+            "password": details.get("password"),
+            "prefix": details.get("prefix"),
+            "options": details.get("options", {}),
+            "full_details": details,
         }
 
     def table(self, table, raw=False):
@@ -214,7 +237,7 @@ class QueryBuilder(ObservesEvents):
         Returns:
             self
         """
-        return self.new_connection().begin()
+        return self.new_connection(read=False).begin()
 
     def begin_transaction(self, *args, **kwargs):
         return self.begin(*args, **kwargs)
@@ -392,7 +415,8 @@ class QueryBuilder(ObservesEvents):
         return self
 
     def statement(self, query, bindings=()):
-        result = self.new_connection().query(query, bindings)
+        is_read = query.lstrip()[:6].upper() == "SELECT"
+        result = self.new_connection(read=is_read).query(query, bindings)
         return self.prepare_result(result)
 
     def select_raw(self, string):
@@ -407,32 +431,347 @@ class QueryBuilder(ObservesEvents):
     def get_processor(self):
         return self.connection_class.get_default_post_processor()()
 
-    def bulk_create(self, creates, query=False):
-        model = None
-        self.set_action("bulk_create")
+    def bulk_create(self, creates, query=False, batch_size=None):
+        """Inserts many rows and sets their generated primary keys.
+
+        Rows are split into statements that stay under the connection's parameter and statement
+        size limits and every statement runs in one transaction.
 
+        Arguments:
+            creates {list} -- A list of dictionaries with the same keys.
+
+        Keyword Arguments:
+            query {bool} -- Whether to return the builder instead of running the query. (default: {False})
+            batch_size {int} -- The most rows sent per statement. (default: {None})
+
+        Returns:
+            Collection|list -- The created models or rows with their primary keys.
+        """
         self._creates = creates
+        self.set_action("bulk_create")
 
-        if self._model:
-            model = self._model
+        if query:
+            return self
+
+        if self.dry or not creates:
+            return self._hydrate_rows(self._creates)
+
+        rows = [dict(row) for row in creates]
+        id_key = self._model.get_primary_key() if self._model else "id"
+        processor = self.get_processor()
+
+        def run_batches():
+            for batch in self.get_batches(rows, len(rows[0]), batch_size):
+                results = self.new_connection().query(
+                    self._compile_batch("bulk_create", batch), self._bindings
+                )
+                processor.process_bulk_insert_get_ids(self, batch, results, id_key)
+
+        self.run_in_transaction(run_batches)
+
+        return self._hydrate_rows(rows)
+
+    def _hydrate_rows(self, rows):
+        return self._model.hydrate(rows) if self._model else rows
+
+    def _compile_batch(self, action, rows):
+        """Compiles the statement writing one batch of rows.
+
+        Returns:
+            string -- The query. Its bindings are set on the builder.
+        """
+        self._creates = rows
+        self.set_action(action)
+        return self.to_native()
+
+    def bulk_load(self, rows, columns=None, batch_size=10000):
+        """Loads rows into the table with the fastest method the driver supports.
+
+        Postgres uses COPY ... FROM STDIN, MySQL uses LOAD DATA LOCAL INFILE and SQLite and
+        MSSQL run an insert with 'executemany' inside one transaction. Rows are streamed from
+        the iterable and skip models, events and timestamps.
+
+        Arguments:
+            rows {iterable} -- Dictionaries or tuples of values in column order.
+
+        Keyword Arguments:
+            columns {list} -- The columns being loaded. Defaults to the keys of the first row. (default: {None})
+            batch_size {int} -- Rows per 'executemany' call for drivers without a native loader. (default: {10000})
+
+        Returns:
+            int|string -- The number of rows loaded or the statement when the builder is dry.
+        """
+        rows = iter(rows)
+        if columns is None:
+            first = next(rows, None)
+            if first is None:
+                return 0
+
+            if not isinstance(first, dict):
+                raise ValueError(
+                    "The 'columns' argument is required when rows are not dictionaries"
+                )
+
+            columns = list(first.keys())
+            rows = itertools.chain([first], rows)
+
+        columns = list(columns)
+        sql = self.get_grammar().bulk_load(self.get_table_name(), columns)
+        if self.dry:
+            return sql
+
+        values = (
+            (
+                tuple(row.get(column) for column in columns)
+                if isinstance(row, dict)
+                else tuple(row)
+            )
+            for row in rows
+        )
+
+        return self.new_connection(read=False).bulk_load(sql, values, batch_size)
+
+    def upsert(self, rows, unique_by, update=None, batch_size=None, query=False):
+        """Inserts rows and updates the rows that already exist.
+
+        Postgres and SQLite compile to ON CONFLICT ... DO UPDATE, MySQL to ON DUPLICATE KEY UPDATE
+        and MSSQL to MERGE. Rows are split into statements that stay under the connection's
+        parameter limit and every statement runs in one transaction.
+
+        Arguments:
+            rows {list} -- A list of dictionaries with the same keys.
+            unique_by {list} -- The columns identifying existing rows.
+
+        Keyword Arguments:
+            update {list} -- The columns updated on existing rows. Defaults to every column not in unique_by. (default: {None})
+            batch_size {int} -- The most rows sent per statement. (default: {None})
+            query {bool} -- Whether to return the builder instead of running the query. (default: {False})
+
+        Returns:
+            int|self -- The number of rows sent.
+        """
+        rows = self._prepare_upsert(rows, unique_by, update)
+        if not rows:
+            return 0
 
         if query:
             return self
 
-        if model:
-            model = model.hydrate(self._creates)
-        if not self.dry:
-            connection = self.new_connection()
-            query_result = connection.query(self.to_qmark(), self._bindings, results=1)
+        if self.dry:
+            return len(rows)
+
+        def run_batches():
+            for batch in self.get_batches(rows, len(rows[0]), batch_size):
+                self.new_connection().query(
+                    self._compile_batch("upsert", batch), self._bindings
+                )
+
+        self.run_in_transaction(run_batches)
+
+        return len(rows)
+
+    def _prepare_upsert(self, rows, unique_by, update):
+        """Sets the rows and the conflict columns of an upsert.
 
-            processed_results = query_result or self._creates
+        Returns:
+            list -- The rows to upsert.
+        """
+        if isinstance(rows, dict):
+            rows = [rows]
+
+        rows = list(rows)
+        if not rows:
+            return rows
+
+        if isinstance(unique_by, str):
+            unique_by = [unique_by]
+
+        if update is None:
+            update = [column for column in rows[0] if column not in unique_by]
+
+        self._upsert = UpsertExpression(unique_by, update)
+        self._creates = rows
+        self.set_action("upsert")
+        return rows
+
+    def bulk_update(
+        self, records, columns=None, key=None, batch_size=None, query=False
+    ):
+        """Updates many rows with different values, matching them by key.
+
+        MySQL and SQLite compile to UPDATE ... SET column = CASE key WHEN ... END, Postgres to
+        UPDATE ... FROM (VALUES ...) and MSSQL to MERGE. Records are split into statements that
+        stay under the connection's parameter limit and every statement runs in one transaction.
+        Model events are not fired.
+
+        Arguments:
+            records {list} -- Models or dictionaries holding the key and the new values.
+
+        Keyword Arguments:
+            columns {list} -- The columns to update. Defaults to the dirty attributes of models
+                    or every key of dictionaries other than the key. (default: {None})
+            key {string} -- The column matching records to rows. Defaults to the model's primary key. (default: {None})
+            batch_size {int} -- The most records sent per statement. (default: {None})
+            query {bool} -- Whether to return the builder instead of running the query. (default: {False})
+
+        Returns:
+            int|self -- The number of records sent.
+        """
+        records, rows = self._prepare_bulk_update(records, columns, key)
+        if not rows:
+            return 0
+
+        if query:
+            return self
+
+        if self.dry:
+            return len(rows)
+
+        def run_batches():
+            for batch in self._get_bulk_update_batches(rows, batch_size):
+                self.new_connection().query(
+                    self._compile_batch("bulk_update", batch), self._bindings
+                )
+
+        self.run_in_transaction(run_batches)
+
+        self._fill_bulk_updated_models(records, rows)
+        return len(rows)
+
+    def _prepare_bulk_update(self, records, columns, key):
+        """Sets the key, the columns and the rows of a bulk update.
+
+        Returns:
+            tuple -- The records and the rows to update. No rows means there is nothing to update.
+        """
+        if isinstance(records, dict) or hasattr(records, "get_dirty_attributes"):
+            records = [records]
+
+        records = list(records)
+        if not records:
+            return records, []
+
+        if key is None:
+            key = self._model.get_primary_key() if self._model else "id"
+
+        if columns is None:
+            columns = []
+            for record in records:
+                values = (
+                    record
+                    if isinstance(record, dict)
+                    else record.get_dirty_attributes()
+                )
+                columns += [
+                    column
+                    for column in values
+                    if column != key and column not in columns
+                ]
+        elif isinstance(columns, str):
+            columns = [columns]
+
+        if not columns:
+            return records, []
+
+        rows = [self._get_bulk_update_row(record, key, columns) for record in records]
+
+        self._bulk_update = BulkUpdateExpression(key, columns)
+        self._creates = rows
+        self.set_action("bulk_update")
+        return records, rows
+
+    def _get_bulk_update_batches(self, rows, batch_size):
+        # The CASE form binds the key once per column and once more in the WHERE clause
+        columns = len(self._bulk_update.columns)
+        return self.get_batches(rows, columns * 2 + 1, batch_size)
+
+    def _fill_bulk_updated_models(self, records, rows):
+        for record, row in zip(records, rows):
+            if not isinstance(record, dict):
+                record.fill(row)
+
+    def _get_bulk_update_row(self, record, key, columns):
+        if isinstance(record, dict):
+            values = record
         else:
-            processed_results = self._creates
+            values = dict(record.__attributes__)
+            values.update(record.get_dirty_attributes())
 
-        if model:
-            return model
+        missing = [column for column in [key] + columns if column not in values]
+        if missing:
+            raise ValueError(
+                f"Cannot bulk update a record without a value for {', '.join(missing)}"
+            )
 
-        return processed_results
+        return {column: values[column] for column in [key] + columns}
+
+    def get_batches(self, rows, parameters_per_row, batch_size=None):
+        """Splits rows into batches that stay under the connection's parameter and statement size limits.
+
+        Arguments:
+            rows {list} -- The rows to split.
+            parameters_per_row {int} -- The number of bound parameters each row adds to a statement.
+
+        Keyword Arguments:
+            batch_size {int} -- The most rows in a batch. (default: {None})
+
+        Returns:
+            list
+        """
+        max_parameters = self.connection_class.get_max_parameters()
+        if max_parameters:
+            fits = max(1, max_parameters // max(1, parameters_per_row))
+            batch_size = min(batch_size, fits) if batch_size else fits
+
+        max_size = self.connection_class.get_max_statement_size()
+        if not max_size:
+            if not batch_size:
+                return [rows]
+
+            return [rows[i : i + batch_size] for i in range(0, len(rows), batch_size)]
+
+        batches = []
+        batch = []
+        size = 0
+        for row in rows:
+            # Rough size of the row once its values are escaped into the statement
+            row_size = sum(len(str(value)) + 4 for value in row.values())
+            if batch and (
+                (batch_size and len(batch) >= batch_size) or size + row_size > max_size
+            ):
+                batches.append(batch)
+                batch = []
+                size = 0
+
+            batch.append(row)
+            size += row_size
+
+        if batch:
+            batches.append(batch)
+
+        return batches
+
+    def run_in_transaction(self, callback):
+        """Runs the callback inside a transaction unless one is already open on the builder.
+
+        Arguments:
+            callback {callable} -- The callback running the queries.
+
+        Returns:
+            The value returned by the callback.
+        """
+        if self.in_transaction():
+            return callback()
+
+        self.begin()
+        try:
+            result = callback()
+        except Exception:
+            self.rollback()
+            raise
+
+        self.commit()
+        return result
 
     def create(self, creates=None, query=False, id_key="id", **kwargs):
         """Specifies a dictionary that should be used to create new values.
@@ -448,28 +787,40 @@ class QueryBuilder(ObservesEvents):
         if not creates:
             creates = kwargs
 
-        model = None
-
-        if self._model:
-            model = self._model
-
         self.set_action("insert")
         self._creates.update(creates)
 
         if query:
             return self
 
-        if model:
-            model = model.hydrate(self._creates)
-            self.observe_events(model, "creating")
-
-            # if attributes were modified during model observer then we need to update the creates here
-            self._creates.update(model.get_dirty_attributes())
+        model = self._prepare_create()
 
+        query_result = None
         if not self.dry:
-            connection = self.new_connection()
-            query_result = connection.query(self.to_qmark(), self._bindings, results=1)
+            query_result = self.new_connection().query(
+                self.to_native(), self._bindings, results=1
+            )
+
+        return self._process_create(model, query_result, id_key)
+
+    def _prepare_create(self):
+        """Fires the creating event of the model being created.
+
+        Returns:
+            Model|None
+        """
+        if not self._model:
+            return None
+
+        model = self._model.hydrate(self._creates)
+        self.observe_events(model, "creating")
+
+        # if attributes were modified during model observer then we need to update the creates here
+        self._creates.update(model.get_dirty_attributes())
+        return model
 
+    def _process_create(self, model, query_result, id_key):
+        if not self.dry:
             if model:
                 id_key = model.get_primary_key()
 
@@ -497,12 +848,8 @@ class QueryBuilder(ObservesEvents):
         Returns:
             self
         """
-        model = None
         self.set_action("delete")
 
-        if self._model:
-            model = self._model
-
         if column and value:
             if isinstance(value, (list, tuple)):
                 self.where_in(column, value)
@@ -512,17 +859,21 @@ class QueryBuilder(ObservesEvents):
         if query:
             return self
 
-        if model and model.is_loaded():
-            self.where(model.get_primary_key(), model.get_primary_key_value())
-            self.observe_events(model, "deleting")
+        self._prepare_delete()
 
-        result = self.new_connection().query(self.to_qmark(), self._bindings)
+        result = self.new_connection().query(self.to_native(), self._bindings)
 
-        if model:
-            self.observe_events(model, "deleted")
+        if self._model:
+            self.observe_events(self._model, "deleted")
 
         return result
 
+    def _prepare_delete(self):
+        model = self._model
+        if model and model.is_loaded():
+            self.where(model.get_primary_key(), model.get_primary_key_value())
+            self.observe_events(model, "deleting")
+
     def where(self, column, *args):
         """Specifies a where expression.
 
@@ -699,13 +1050,90 @@ class QueryBuilder(ObservesEvents):
         return self
 
     def chunk(self, chunk_amount):
+        """Streams the results of the query in chunks using a server side cursor.
+
+        Arguments:
+            chunk_amount {int} -- The number of rows in each chunk.
+
+        Yields:
+            Collection|list
+        """
         chunk_connection = self.new_connection()
-        for result in chunk_connection.select_many(self.to_sql(), (), chunk_amount):
+        for result in chunk_connection.select_many(
+            self.to_native(), self._bindings, chunk_amount
+        ):
             if not self._model:
                 yield result
             else:
                 yield self._model.hydrate(result)
 
+    def get_dicts(self, selects=[]):
+        """Runs the select query and returns the rows as the dictionaries of the driver,
+        without hydrating models or wrapping them in a collection.
+
+        Returns:
+            list
+        """
+        self.select(*selects)
+        return self._run_select()
+
+    def get_tuples(self, selects=[]):
+        """Runs the select query and returns the rows as tuples in column order.
+
+        Returns:
+            list
+        """
+        self.select(*selects)
+        return self.new_connection().select_tuples(self.to_native(), self._bindings)
+
+    def values(self, column):
+        """Selects only one column and returns its values.
+
+        Arguments:
+            column {string} -- The name of the column.
+
+        Returns:
+            list
+        """
+        self._columns = ()
+        return [row[0] for row in self.get_tuples([column])]
+
+    def pluck(self, value, key=None):
+        """Selects only the value column, and the key column if one is given.
+
+        Arguments:
+            value {string} -- The column of the values.
+
+        Keyword Arguments:
+            key {string} -- The column the values are keyed by. (default: {None})
+
+        Returns:
+            Collection -- A list of values or a dictionary of values by key.
+        """
+        if key is None:
+            return Collection(self.values(value))
+
+        self._columns = ()
+        return Collection({row[1]: row[0] for row in self.get_tuples([value, key])})
+
+    def cursor(self, chunk_size=1000):
+        """Streams the results of the query one row at a time.
+
+        Rows are fetched with a server side cursor in batches of chunk_size and are hydrated
+        one by one so large results never have to be held in memory.
+
+        Keyword Arguments:
+            chunk_size {int} -- The number of rows fetched per round trip. (default: {1000})
+
+        Yields:
+            Model|dict
+        """
+        for rows in self.new_connection().select_many(
+            self.to_native(), self._bindings, chunk_size
+        ):
+            for row in rows:
+                yield self._model.hydrate(row) if self._model else row
+
     def where_not_null(self, column: str):
         """Specifies a where expression where the column is not NULL.
 
@@ -970,8 +1398,7 @@ class QueryBuilder(ObservesEvents):
         return self
 
     def take(self, *args, **kwargs):
-        """Alias for limit method
-        """
+        """Alias for limit method"""
         return self.limit(*args, **kwargs)
 
     def limit(self, amount):
@@ -999,8 +1426,7 @@ class QueryBuilder(ObservesEvents):
         return self
 
     def skip(self, *args, **kwargs):
-        """Alias for limit method
-        """
+        """Alias for limit method"""
         return self.offset(*args, **kwargs)
 
     def update(self, updates: dict, dry=False):
@@ -1015,12 +1441,21 @@ class QueryBuilder(ObservesEvents):
         Returns:
             self
         """
-        model = None
+        additional = self._prepare_update(updates)
+        if dry or self.dry:
+            return self
 
-        additional = {}
+        result = self.new_connection().query(self.to_native(), self._bindings)
+        return self._process_update(result, additional)
 
-        if self._model:
-            model = self._model
+    def _prepare_update(self, updates):
+        """Sets the updates and fires the updating event of a loaded model.
+
+        Returns:
+            dict -- The values returned when the builder has no model.
+        """
+        model = self._model
+        additional = {}
 
         if model and model.is_loaded():
             self.where(model.get_primary_key(), model.get_primary_key_value())
@@ -1030,12 +1465,12 @@ class QueryBuilder(ObservesEvents):
 
         self._updates = (UpdateQueryExpression(updates),)
         self.set_action("update")
-        if dry or self.dry:
-            return self
 
         additional.update(updates)
+        return additional
 
-        result = self.new_connection().query(self.to_qmark(), self._bindings)
+    def _process_update(self, result, additional):
+        model = self._model
         if model:
             model.fill(result)
             self.observe_events(model, "updated")
@@ -1105,15 +1540,47 @@ class QueryBuilder(ObservesEvents):
         self.aggregate("SUM", "{column}".format(column=column))
         return self
 
-    def count(self, column=None):
+    def count(self, column=None, approximate=False):
         """Aggregates a columns values.
 
         Arguments:
             column {string} -- The name of the column to aggregate.
 
+        Keyword Arguments:
+            approximate {bool} -- Reads the number of rows from the table statistics or the
+                query plan instead of counting them. Falls back to an exact count when the
+                database has no estimate. SQLite only keeps row counts of whole tables after
+                ANALYZE and has no estimates for filtered queries, so those are always counted
+                exactly. (default: {False})
+
         Returns:
             self
         """
+        if approximate and column is None and not self.dry:
+            estimate = self._estimate_count()
+            if estimate is not None:
+                return estimate
+
+        alias = self._prepare_count(column)
+
+        if self.dry:
+            return self
+
+        if not column:
+            result = self.new_connection().query(
+                self.to_native(), self._bindings, results=1
+            )
+
+            return self._process_count(result, alias)
+        else:
+            return self
+
+    def _prepare_count(self, column):
+        """Adds the COUNT aggregate.
+
+        Returns:
+            string -- The alias of the count.
+        """
         alias = "m_count_reserved" if (column == "*" or column is None) else column
         if column == "*":
             self.aggregate("COUNT", f"{column} as {alias}")
@@ -1122,23 +1589,98 @@ class QueryBuilder(ObservesEvents):
         else:
             self.aggregate("COUNT", f"{column}")
 
-        if self.dry:
-            return self
+        return alias
 
-        if not column:
-            result = self.new_connection().query(
-                self.to_qmark(), self._bindings, results=1
+    @staticmethod
+    def _process_count(result, alias):
+        if not result:
+            return 0
+
+        if isinstance(result, dict):
+            return result.get(alias, 0)
+
+        prepared_result = list(result.values())
+        if not prepared_result:
+            return 0
+        return prepared_result[0]
+
+    def estimated_count(self):
+        """Gets the approximate number of rows of the query without counting them.
+
+        Returns:
+            int
+        """
+        return self.count(approximate=True)
+
+    def _get_estimate_query(self, platform):
+        """Gets the query estimating the number of rows of this query.
+
+        Unfiltered queries read the row count of the table kept by the database. Filtered
+        queries read the number of rows the planner expects the query to return.
+
+        Returns:
+            tuple|None -- The SQL, bindings and the method processing the result or None
+                when the platform has no estimate for this query.
+        """
+        filtered = (
+            self._wheres
+            or self._joins
+            or self._group_by
+            or self._having
+            or self._global_scopes.get("select")
+        )
+
+        if not filtered:
+            database = self._connection_details.get(self.connection, {}).get("database")
+            sql = platform.compile_estimated_count(
+                self.get_table_name(), database=database
             )
+            return sql and (sql, (), platform.process_estimated_count)
+
+        builder = self.clone()
+        builder._order_by = ()
+        builder._limit = False
+        builder._offset = False
+        query = builder.to_native()
+        sql = platform.compile_explain(query)
+        if not sql:
+            return None
+
+        if isinstance(query, NativeQuery):
+            if isinstance(sql, list):
+                sql[1] = NativeQuery(sql[1])
+            else:
+                sql = NativeQuery(sql)
 
-            if isinstance(result, dict):
-                return result.get(alias, 0)
+        return sql, builder._bindings, platform.process_explain
 
-            prepared_result = list(result.values())
-            if not prepared_result:
-                return 0
-            return prepared_result[0]
-        else:
-            return self
+    def _estimate_count(self):
+        estimate_query = self._get_estimate_query(
+            self.connection_class.get_default_platform()()
+        )
+        if not estimate_query:
+            return None
+
+        sql, bindings, process = estimate_query
+        try:
+            if isinstance(sql, list):
+                # The session settings only apply to the connection they were set on
+                return process(
+                    self.run_in_transaction(lambda: self._run_explain(sql, bindings))
+                )
+
+            return process(self.new_connection().query(sql, bindings))
+        except QueryException:
+            return None
+
+    def _run_explain(self, statements, bindings):
+        setup, query, restore = statements
+        connection = self.new_connection()
+        connection.query(setup, ())
+        try:
+            return connection.query(query, bindings)
+        finally:
+            connection.query(restore, ())
 
     def max(self, column):
         """Aggregates a columns values.
@@ -1229,16 +1771,64 @@ class QueryBuilder(ObservesEvents):
         Returns:
             dictionary -- Returns a dictionary of results.
         """
-
+        self.limit(1)
         if query:
-            return self.limit(1)
+            return self
 
         result = self.new_connection().query(
-            self.limit(1).to_qmark(), self._bindings, results=1
+            self.to_native(), self._bindings, results=1
         )
 
         return self.prepare_result(result)
 
+    def exists(self, query=False):
+        """Checks if the query matches at least one record without fetching it.
+
+        Keyword Arguments:
+            query {bool} -- Returns the SQL instead of running it. (default: {False})
+
+        Returns:
+            bool|string
+        """
+        if query:
+            return self._compile_exists("to_sql")[0]
+
+        sql, bindings = self._compile_exists("to_native")
+        result = self.new_connection().query(sql, bindings, results=1)
+
+        return self._process_exists(result)
+
+    def doesnt_exist(self):
+        """Checks if the query matches no record.
+
+        Returns:
+            bool
+        """
+        return not self.exists()
+
+    def _compile_exists(self, compile):
+        # Compiled from a copy so the builder can still run the query itself afterwards
+        builder = self.clone()
+        # Only whether a row is found matters so the columns and orders are dropped
+        if not builder._having:
+            builder._columns = (SelectExpression("1", raw=True),)
+        if builder._limit is False and builder._offset is False:
+            builder._order_by = ()
+
+        query = getattr(builder, compile)()
+        sql = builder.get_grammar().exists_format().format(query=query)
+        if isinstance(query, NativeQuery):
+            sql = NativeQuery(sql)
+
+        return sql, builder._bindings
+
+    @staticmethod
+    def _process_exists(result):
+        if not result:
+            return False
+
+        return bool(result.get("m_exists_reserved"))
+
     def last(self, column=None, query=False):
         """Gets the last record, ordered by column in descendant order or primary
         key if no column is given.
@@ -1246,18 +1836,20 @@ class QueryBuilder(ObservesEvents):
         Returns:
             dictionary -- Returns a dictionary of results.
         """
-        _column = column if column else self._model.get_primary_key()
+        self._prepare_last(column)
         if query:
-            return self.limit(1).order_by(_column, direction="DESC")
+            return self
 
         result = self.new_connection().query(
-            self.limit(1).order_by(_column, direction="DESC").to_qmark(),
-            self._bindings,
-            results=1,
+            self.to_native(), self._bindings, results=1
         )
 
         return self.prepare_result(result)
 
+    def _prepare_last(self, column):
+        _column = column if column else self._model.get_primary_key()
+        return self.limit(1).order_by(_column, direction="DESC")
+
     def _get_eager_load_result(self, related, collection):
         return related.eager_load_from_collection(collection)
 
@@ -1330,38 +1922,12 @@ class QueryBuilder(ObservesEvents):
             # eager load here
             hydrated_model = self._model.hydrate(result)
             if self._eager_relation.eagers and hydrated_model:
-                for eager_load in self._eager_relation.get_eagers():
-                    if isinstance(eager_load, dict):
-                        # Nested
-                        for relation, eagers in eager_load.items():
-                            if inspect.isclass(self._model):
-                                related = getattr(self._model, relation)
-                            else:
-                                related = self._model.get_related(relation)
-
-                            result_set = related.get_related(
-                                self, hydrated_model, eagers=eagers
-                            )
-
-                            self._register_relationships_to_model(
-                                related,
-                                result_set,
-                                hydrated_model,
-                                relation_key=relation,
-                            )
-                    else:
-                        # Not Nested
-                        for eager in eager_load:
-                            if inspect.isclass(self._model):
-                                related = getattr(self._model, eager)
-                            else:
-                                related = self._model.get_related(eager)
-
-                            result_set = related.get_related(self, hydrated_model)
-
-                            self._register_relationships_to_model(
-                                related, result_set, hydrated_model, relation_key=eager
-                            )
+                for related, result_set, relation_key in self._get_eager_loads(
+                    hydrated_model
+                ):
+                    self._register_relationships_to_model(
+                        related, result_set, hydrated_model, relation_key=relation_key
+                    )
 
             if collection:
                 return hydrated_model if result else Collection([])
@@ -1373,6 +1939,35 @@ class QueryBuilder(ObservesEvents):
         else:
             return result or None
 
+    def _get_eager_loads(self, hydrated_model):
+        """Loads the registered eager relationships for a hydrated result.
+
+        Arguments:
+            hydrated_model {Model|Collection} -- The hydrated result of the query.
+
+        Yields:
+            tuple -- The relationship, its related result and the relation key.
+        """
+        for eager_load in self._eager_relation.get_eagers():
+            if isinstance(eager_load, dict):
+                # Nested
+                for relation, eagers in eager_load.items():
+                    related = self._get_eager_related(relation)
+                    yield related, related.get_related(
+                        self, hydrated_model, eagers=eagers
+                    ), relation
+            else:
+                # Not Nested
+                for eager in eager_load:
+                    related = self._get_eager_related(eager)
+                    yield related, related.get_related(self, hydrated_model), eager
+
+    def _get_eager_related(self, relation):
+        if inspect.isclass(self._model):
+            return getattr(self._model, relation)
+
+        return self._model.get_related(relation)
+
     def _register_relationships_to_model(
         self, related, related_result, hydrated_model, relation_key
     ):
@@ -1408,7 +2003,7 @@ class QueryBuilder(ObservesEvents):
         if query:
             return self.to_sql()
 
-        result = self.new_connection().query(self.to_qmark(), self._bindings) or []
+        result = self.new_connection().query(self.to_native(), self._bindings) or []
 
         return self.prepare_result(result, collection=True)
 
@@ -1419,19 +2014,71 @@ class QueryBuilder(ObservesEvents):
             self
         """
         self.select(*selects)
-        result = self.new_connection().query(self.to_qmark(), self._bindings)
+        result = self.new_connection().query(self.to_native(), self._bindings)
 
         return self.prepare_result(result, collection=True)
 
-    def new_connection(self):
+    def new_connection(self, read=None):
+        """Gets the connection the next query runs on.
+
+        When the connection has 'read' hosts, selects are sent to a replica while writes and
+        everything inside a transaction are sent to the primary.
+
+        Keyword Arguments:
+            read {bool} -- Whether the query only reads. Defaults to whether the action is a select. (default: {None})
+
+        Returns:
+            masoniteorm.connections.BaseConnection
+        """
+        router = self.get_router()
+
+        if router and not self.in_transaction():
+            if read is None:
+                read = self._action == "select"
+
+            if read and not router.is_sticky():
+                if not self._read_connection:
+                    self._read_connection = self.open_connection(
+                        self.get_connection_information(router.read_details())
+                    )
+                return self._read_connection
+
+            if not read:
+                router.record_write()
+
         if self._connection:
             return self._connection
 
-        self._connection = self.connection_class(
-            **self.get_connection_information(), name=self.connection
-        ).make_connection()
+        self._connection = self.open_connection(
+            self.get_connection_information(router.write_details() if router else None)
+        )
         return self._connection
 
+    def open_connection(self, connection_information):
+        return self.connection_class(
+            **connection_information, name=self.connection
+        ).make_connection()
+
+    def get_router(self):
+        """Gets the router of a connection configured with 'read' and 'write' hosts.
+
+        Returns:
+            masoniteorm.connections.ConnectionRouter|None
+        """
+        return ConnectionRouter.make(
+            self.connection,
+            self._connection_details.get(self.connection),
+            is_async=getattr(self.connection_class, "is_async", False),
+        )
+
+    def in_transaction(self):
+        if self._connection and self._connection.get_transaction_level() > 0:
+            return True
+
+        from ..connections.ConnectionResolver import ConnectionResolver
+
+        return self.connection in ConnectionResolver.get_global_connections()
+
     def get_connection(self):
         return self._connection
 
@@ -1443,7 +2090,73 @@ class QueryBuilder(ObservesEvents):
         self._eager_relation.register(eagers)
         return self
 
-    def paginate(self, per_page, page=1):
+    def get_async_future(self, method="get", *args, **kwargs):
+        """Runs a method of the builder on the ORM's bounded thread pool.
+
+        The query borrows its own connection so independent queries can run at the
+        same time. See ConnectionResolver.gather to run many of them.
+
+        Keyword Arguments:
+            method {string} -- The builder method returning the results. (default: {"get"})
+
+        Raises:
+            QueryException: Raised inside a global transaction.
+
+        Returns:
+            concurrent.futures.Future -- Resolves to what the method returns.
+        """
+        from ..connections.ConnectionResolver import ConnectionResolver
+
+        ConnectionResolver.ensure_outside_transaction()
+
+        return ConnectionResolver.get_executor().submit(
+            getattr(self, method), *args, **kwargs
+        )
+
+    def paginate(self, per_page, page=1, window_count=False, cache_total=None):
+        """Paginates the query and counts the total number of rows.
+
+        Arguments:
+            per_page {int} -- The number of rows per page.
+
+        Keyword Arguments:
+            page {int} -- The page to fetch. (default: {1})
+            window_count {bool} -- Counts the rows with COUNT(*) OVER() in the page query
+                instead of running a second query. Needs window functions: Postgres,
+                MySQL 8, SQLite 3.25 or SQL Server. (default: {False})
+            cache_total {int|float} -- Keeps the total for this many seconds so the next pages
+                of the same query skip counting. (default: {None})
+
+        Returns:
+            LengthAwarePaginator
+        """
+        new_from_builder, cache_key, cached = self._prepare_paginate(
+            per_page, page, cache_total
+        )
+
+        total = cached
+        if total is None and window_count:
+            self._select_window_count()
+            rows = self._run_select()
+            total = self._pop_window_count(rows)
+            result = self.prepare_result(rows, collection=True)
+        else:
+            result = self.get()
+
+        if total is None:
+            total = new_from_builder.count()
+
+        self._cache_total(cache_key, cached, total, cache_total)
+
+        paginator = LengthAwarePaginator(result, per_page, page, total)
+        return paginator
+
+    def _prepare_paginate(self, per_page, page, cache_total):
+        """Limits the builder to the page and makes the builder counting the total.
+
+        Returns:
+            tuple -- The count builder, the key of the cached total and the cached total.
+        """
         if page == 1:
             offset = 0
         else:
@@ -1452,11 +2165,55 @@ class QueryBuilder(ObservesEvents):
         new_from_builder = self.new_from_builder()
         new_from_builder._order_by = ()
 
-        result = self.limit(per_page).offset(offset).get()
-        total = new_from_builder.count()
+        cached = None
+        cache_key = self._get_total_cache_key(new_from_builder) if cache_total else None
+        if cache_key is not None:
+            cached = self.totals_cache.get(cache_key)
 
-        paginator = LengthAwarePaginator(result, per_page, page, total)
-        return paginator
+        self.limit(per_page).offset(offset)
+        return new_from_builder, cache_key, cached
+
+    def _cache_total(self, cache_key, cached, total, cache_total):
+        if cache_key is not None and cached is None:
+            self.totals_cache.set(cache_key, total, cache_total)
+
+    def _run_select(self):
+        return self.new_connection().query(self.to_native(), self._bindings) or []
+
+    def _select_window_count(self):
+        if not self._columns:
+            self.select("*")
+
+        self.select_raw("COUNT(*) OVER() AS m_total_reserved")
+
+    @staticmethod
+    def _pop_window_count(rows):
+        """Removes the window count from the rows of a page.
+
+        Returns:
+            int|None -- The total or None when the page is empty.
+        """
+        total = None
+        for row in rows:
+            total = row.pop("m_total_reserved", total)
+
+        return total
+
+    def _get_total_cache_key(self, count_builder):
+        """Gets the key the total of a paginated query is cached with.
+
+        Returns:
+            tuple|None -- None when the bindings cannot be used in a key.
+        """
+        count_builder = count_builder.clone()
+        sql = count_builder.to_qmark()
+        key = (self.connection, sql, tuple(count_builder._bindings))
+        try:
+            hash(key)
+        except TypeError:
+            return None
+
+        return key
 
     def simple_paginate(self, per_page, page=1):
         if page == 1:
@@ -1469,6 +2226,119 @@ class QueryBuilder(ObservesEvents):
         paginator = SimplePaginator(result, per_page, page)
         return paginator
 
+    def cursor_paginate(self, per_page, cursor=None):
+        """Paginates with cursors instead of offsets so deep pages are as fast as the first one.
+
+        Rows are ordered by the order by columns of the builder followed by the primary key,
+        which breaks ties. Pages after the first one are selected with a where expression
+        on these columns so the database can seek to them with an index.
+
+        Arguments:
+            per_page {int} -- The number of rows per page.
+
+        Keyword Arguments:
+            cursor {string} -- The next or previous cursor of a page. (default: {None})
+
+        Returns:
+            CursorPaginator
+        """
+        columns, backwards = self._prepare_cursor_page(per_page, cursor)
+
+        return self._make_cursor_paginator(
+            self.get(), per_page, columns, bool(cursor), backwards
+        )
+
+    def _prepare_cursor_page(self, per_page, cursor):
+        columns = self._get_cursor_columns()
+        backwards = False
+
+        if cursor:
+            decoded = CursorPaginator.decode_cursor(cursor)
+            if len(decoded["values"]) != len(columns):
+                raise InvalidCursor("The cursor does not match the order of the query")
+
+            backwards = decoded["direction"] == "previous"
+            comparisons = [
+                (column, ">" if (direction == "ASC") != backwards else "<")
+                for column, direction in columns
+            ]
+            sql, bindings = self.get_grammar().compile_cursor_where(
+                comparisons, decoded["values"]
+            )
+            self.where_raw(sql, bindings)
+
+        # Previous pages are read backwards from the cursor and reversed afterwards
+        flipped = {"ASC": "DESC", "DESC": "ASC"}
+        self._order_by = tuple(
+            OrderByExpression(
+                column, direction=flipped[direction] if backwards else direction
+            )
+            for column, direction in columns
+        )
+
+        # One more row than needed tells whether there is another page
+        self.limit(per_page + 1)
+
+        return columns, backwards
+
+    def _get_cursor_columns(self):
+        columns = []
+        for order_by in self._order_by:
+            if order_by.raw:
+                raise ValueError(
+                    "Raw order by expressions cannot be paginated with cursors"
+                )
+            columns.append((order_by.column, order_by.direction.upper()))
+
+        primary_key = self._model.get_primary_key() if self._model else "id"
+        if primary_key not in [column.split(".")[-1] for column, direction in columns]:
+            columns.append(
+                (
+                    f"{self.get_table_name()}.{primary_key}",
+                    columns[-1][1] if columns else "ASC",
+                )
+            )
+
+        return columns
+
+    def _make_cursor_paginator(self, result, per_page, columns, has_cursor, backwards):
+        items = list(result or [])
+        has_more = len(items) > per_page
+        items = items[:per_page]
+        if backwards:
+            items.reverse()
+
+        next_cursor = previous_cursor = None
+        if items:
+            if has_cursor if backwards else has_more:
+                next_cursor = CursorPaginator.encode_cursor(
+                    self._get_cursor_values(items[-1], columns), "next"
+                )
+            if has_more if backwards else has_cursor:
+                previous_cursor = CursorPaginator.encode_cursor(
+                    self._get_cursor_values(items[0], columns), "previous"
+                )
+
+        if isinstance(result, Collection):
+            result = result.__class__(items)
+        else:
+            result = Collection(items)
+
+        return CursorPaginator(result, per_page, next_cursor, previous_cursor)
+
+    @staticmethod
+    def _get_cursor_values(row, columns):
+        values = []
+        for column, direction in columns:
+            name = column.split(".")[-1]
+            if isinstance(row, dict):
+                values.append(row.get(name))
+            else:
+                # The stored value so dates are compared the way the database returned them
+                values.append(row.__attributes__.get(name))
+
+        return values
+
     def set_action(self, action):
         """Sets the action that the query builder should take when the query is built.
 
@@ -1481,9 +2351,12 @@ class QueryBuilder(ObservesEvents):
         self._action = action
         return self
 
-    def get_grammar(self):
+    def get_grammar(self, placeholder="'?'"):
         """Initializes and returns the grammar class.
 
+        Keyword Arguments:
+            placeholder {string} -- Written in place of bound values when compiling with qmark. (default: {"'?'"})
+
         Returns:
             masoniteorm.grammar.Grammar -- An ORM grammar class.
         """
@@ -1503,6 +2376,9 @@ class QueryBuilder(ObservesEvents):
             group_by=self._group_by,
             joins=self._joins,
             having=self._having,
+            upsert=self._upsert,
+            bulk_update=self._bulk_update,
+            placeholder=placeholder,
         )
 
     def to_sql(self):
@@ -1524,15 +2400,41 @@ class QueryBuilder(ObservesEvents):
         Returns:
             self
         """
-        grammar = self.get_grammar()
+        return self._compile_bindings("'?'")
+
+    def to_native(self):
+        """Compiles the QueryBuilder class into a SQL statement using the placeholder
+        of the connection driver, so the connection can run it without rewriting it.
+
+        Returns:
+            string
+        """
+        placeholder = getattr(self.connection_class, "placeholder", None)
+        if not placeholder:
+            return self.to_qmark()
+
+        sql = self._compile_bindings(placeholder)
+
+        # Raw expressions and subqueries are written with qmarks
+        if "'?'" in sql:
+            sql = sql.replace("'?'", placeholder)
 
+        return NativeQuery(sql)
+
+    def _compile_bindings(self, placeholder):
         for name, scope in self._global_scopes.get(self._action, {}).items():
             scope(self)
 
-        grammar = self.get_grammar()
-        sql = grammar.compile(self._action, qmark=True).to_sql()
+        compiled = None
+        if self._action == "select":
+            compiled = self.compiled_cache.compile(self, self._action, placeholder)
 
-        self._bindings = grammar._bindings
+        if compiled:
+            sql, self._bindings = compiled
+        else:
+            grammar = self.get_grammar(placeholder=placeholder)
+            sql = grammar.compile(self._action, qmark=True).to_sql()
+            self._bindings = grammar._bindings
 
         self.reset()
 
@@ -1544,11 +2446,12 @@ class QueryBuilder(ObservesEvents):
         Returns:
             QueryBuilder -- The ORM QueryBuilder class.
         """
-        builder = QueryBuilder(
+        builder = self.__class__(
             grammar=self.grammar,
             connection_class=self.connection_class,
             connection=self.connection,
             connection_driver=self._connection_driver,
+            connection_details=self._connection_details,
         )
 
         if self._table:
@@ -1635,11 +2538,12 @@ class QueryBuilder(ObservesEvents):
         if from_builder is None:
             from_builder = self
 
-        builder = QueryBuilder(
+        builder = self.__class__(
             grammar=self.grammar,
             connection_class=self.connection_class,
             connection=self.connection,
             connection_driver=self._connection_driver,
+            connection_details=self._connection_details,
         )
 
         if self._table:
@@ -1659,3 +2563,28 @@ class QueryBuilder(ObservesEvents):
         builder._aggregates = from_builder._aggregates
 
         return builder
+
+    def clone(self):
+        """Creates a copy of the builder that can be changed without changing this builder.
+
+        Expressions are kept in tuples that are replaced rather than changed when the
+        query grows so the copy shares them with this builder instead of copying them.
+
+        Returns:
+            QueryBuilder -- The ORM QueryBuilder class.
+        """
+        # Skips __init__ and the builder's __getattr__
+        builder = self.__class__.__new__(self.__class__)
+        builder.__dict__.update(self.__dict__)
+        builder.builder = builder
+        builder._connection = None
+        builder._read_connection = None
+        builder._creates = self._creates.copy()
+        builder._scopes = self._scopes.copy()
+        builder._macros = self._macros.copy()
+        builder._global_scopes = {
+            action: scopes.copy() for action, scopes in self._global_scopes.items()
+        }
+        builder._eager_relation = self._eager_relation.clone()
+
+        return builder
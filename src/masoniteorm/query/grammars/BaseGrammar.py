@@ -1,5 +1,3 @@
-import re
-
 from ...expressions.expressions import (
     SubGroupExpression,
     SubSelectExpression,
@@ -8,7 +6,6 @@ from ...expressions.expressions import (
 
 
 class BaseGrammar:
-
     """The keys in this dictionary is how the ORM will reference these aggregates
 
     The values on the right are the matching functions for the grammar
@@ -19,6 +16,9 @@ class BaseGrammar:
 
     table = "users"
 
+    # Whether the database compares row values like (a, b) > (1, 2)
+    supports_row_values = True
+
     def __init__(
         self,
         columns=(),
@@ -34,6 +34,9 @@ class BaseGrammar:
         joins=(),
         having=(),
         connection_details=None,
+        upsert=None,
+        bulk_update=None,
+        placeholder="'?'",
     ):
         self._columns = columns
         self.table = table
@@ -47,6 +50,10 @@ class BaseGrammar:
         self._group_by = group_by
         self._joins = joins
         self._having = having
+        self._upsert = upsert
+        self._bulk_update = bulk_update
+        # Written in place of every bound value when compiling with qmark
+        self._placeholder = placeholder
         self._connection_details = connection_details or {}
         self._column = None
 
@@ -156,39 +163,138 @@ class BaseGrammar:
         )
         return self
 
+    def _compile_upsert(self, qmark=False):
+        """Compiles an insert that updates the existing rows conflicting on the unique columns.
+
+        Returns:
+            self
+        """
+        columns = list(self._columns[0].keys())
+        values = [[row.get(column) for column in columns] for row in self._columns]
+
+        self._sql = self.upsert_format().format(
+            table=self.process_table(self.table),
+            columns=self.columnize_bulk_columns(columns),
+            values=self.columnize_bulk_values(values, qmark=qmark),
+            conflict=self.process_upsert_conflict(
+                self._upsert.unique_by, self._upsert.update
+            ),
+        )
+        return self
+
+    def process_upsert_conflict(self, unique_by, update):
+        """Compiles the clause resolving rows that conflict with existing rows.
+
+        Defaults to the ON CONFLICT clause shared by Postgres and SQLite.
+
+        Arguments:
+            unique_by {list} -- The columns identifying a row.
+            update {list} -- The columns updated when the row exists.
+
+        Returns:
+            string
+        """
+        unique = self.columnize_bulk_columns(unique_by)
+        if not update:
+            return f"ON CONFLICT ({unique}) DO NOTHING"
+
+        updates = ", ".join(
+            "{column} = EXCLUDED.{column}".format(
+                column=self.column_string().format(column=column, separator="")
+            )
+            for column in update
+        )
+        return f"ON CONFLICT ({unique}) DO UPDATE SET {updates}"
+
+    def _compile_bulk_update(self, qmark=False):
+        """Compiles an update setting different values on each row matched by key.
+
+        Returns:
+            self
+        """
+        self._sql = self.process_bulk_update(
+            self._bulk_update.key, self._bulk_update.columns, qmark=qmark
+        )
+        return self
+
+    def process_bulk_update(self, key, columns, qmark=False):
+        """Compiles a bulk update as one CASE expression per column.
+
+        Arguments:
+            key {string} -- The column matching the rows.
+            columns {list} -- The columns to update.
+
+        Keyword Arguments:
+            qmark {bool} -- Whether the query should use qmark. (default: {False})
+
+        Returns:
+            string
+        """
+        key_column = self.column_string().format(column=key, separator="")
+
+        cases = []
+        for column in columns:
+            whens = " ".join(
+                "WHEN {key} THEN {value}".format(
+                    key=self.process_bulk_update_value(row[key], qmark),
+                    value=self.process_bulk_update_value(row[column], qmark),
+                )
+                for row in self._columns
+            )
+            cases.append(
+                "{column} = CASE {key} {whens} END".format(
+                    column=self.column_string().format(column=column, separator=""),
+                    key=key_column,
+                    whens=whens,
+                )
+            )
+
+        keys = ", ".join(
+            self.process_bulk_update_value(row[key], qmark) for row in self._columns
+        )
+
+        return self.bulk_update_format().format(
+            table=self.process_table(self.table),
+            cases=", ".join(cases),
+            key=key_column,
+            keys=keys,
+        )
+
+    def process_bulk_update_value(self, value, qmark=False):
+        if qmark:
+            self.add_binding(value)
+            return self._placeholder
+
+        return self.value_string().format(value=value, separator="")
+
     def columnize_bulk_columns(self, columns=[]):
         return ", ".join(
             self.column_string().format(column=x, separator="") for x in columns
         ).rstrip(",")
 
     def columnize_bulk_values(self, columns=[], qmark=False):
-        sql = ""
+        sql = []
+        value_string = self.value_string()
+        process_value_string = self.process_value_string()
         for x in columns:
-            inner = ""
             if isinstance(x, list):
-                for y in x:
-                    if qmark:
-                        self.add_binding(y)
-                    inner += (
-                        "'?', "
-                        if qmark
-                        else self.value_string().format(value=y, separator=", ")
+                if qmark:
+                    self.add_binding(list(x))
+                    inner = ", ".join([self._placeholder] * len(x))
+                else:
+                    inner = ", ".join(
+                        value_string.format(value=y, separator="") for y in x
                     )
 
-                inner = inner.rstrip(", ")
-                sql += self.process_value_string().format(value=inner, separator=", ")
+                sql.append(process_value_string.format(value=inner, separator=""))
             else:
                 if qmark:
                     self.add_binding(x)
-                sql += (
-                    "'?', "
-                    if qmark
-                    else self.process_value_string().format(
-                        value="?" if qmark else x, separator=", "
-                    )
-                )
+                    sql.append(self._placeholder)
+                else:
+                    sql.append(process_value_string.format(value=x, separator=""))
 
-        return sql.rstrip(", ")
+        return ", ".join(sql)
 
     def process_value_string(self):
         return "({value}){separator}"
@@ -231,22 +337,24 @@ class BaseGrammar:
         Returns:
             self
         """
-        sql = ""
+        sql = []
         for join in self._joins:
             local_table = join.column1.split(".")[0]
             column1 = join.column1
             column2 = join.column2
-            sql += self.join_string().format(
-                foreign_table=self.process_table(join.foreign_table),
-                local_table=self.process_table(local_table),
-                column1=self._table_column_string(column1),
-                equality=join.equality,
-                column2=self._table_column_string(column2),
-                keyword=self.join_keywords[join.clause],
+            sql.append(
+                self.join_string().format(
+                    foreign_table=self.process_table(join.foreign_table),
+                    local_table=self.process_table(local_table),
+                    column1=self._table_column_string(column1),
+                    equality=join.equality,
+                    column2=self._table_column_string(column2),
+                    keyword=self.join_keywords[join.clause],
+                )
             )
-            sql += " "
+            sql.append(" ")
 
-        return sql
+        return "".join(sql)
 
     # TODO: Clean
     def _compile_key_value_equals(self, qmark=False):
@@ -258,7 +366,7 @@ class BaseGrammar:
         Returns:
             self
         """
-        sql = ""
+        sql = []
         for update in self._updates:
 
             if update.update_type == "increment":
@@ -268,37 +376,46 @@ class BaseGrammar:
             else:
                 sql_string = self.key_value_string()
 
+            if qmark:
+                # The placeholder replaces the quoted value
+                sql_string = sql_string.replace("'{value}'", "{value}")
+
             column = update.column
             value = update.value
             if isinstance(column, dict):
                 for key, value in column.items():
 
                     if hasattr(value, "expression"):
-                        sql += self.column_value_string().format(
-                            column=self._table_column_string(key),
-                            value=value.expression,
-                            separator=", ",
+                        sql.append(
+                            self.column_value_string().format(
+                                column=self._table_column_string(key),
+                                value=value.expression,
+                                separator="",
+                            )
                         )
                     else:
-                        sql += sql_string.format(
-                            column=self._table_column_string(key),
-                            value=value if not qmark else "?",
-                            separator=", ",
+                        sql.append(
+                            sql_string.format(
+                                column=self._table_column_string(key),
+                                value=value if not qmark else self._placeholder,
+                                separator="",
+                            )
                         )
 
                         if qmark:
                             self._bindings += (value,)
             else:
-                sql += sql_string.format(
-                    column=self._table_column_string(column),
-                    value=value if not qmark else "?",
-                    separator=", ",
+                sql.append(
+                    sql_string.format(
+                        column=self._table_column_string(column),
+                        value=value if not qmark else self._placeholder,
+                        separator="",
+                    )
                 )
                 if qmark:
                     self._bindings += (value,)
 
-        sql = sql.rstrip(", ")
-        return sql
+        return ", ".join(sql)
 
     def process_aggregates(self):
         """Compiles aggregates to be used in a query expression.
@@ -306,7 +423,7 @@ class BaseGrammar:
         Returns:
             self
         """
-        sql = ""
+        sql = []
         for aggregates in self._aggregates:
             aggregate = aggregates.aggregate
             column = aggregates.column
@@ -316,16 +433,16 @@ class BaseGrammar:
             else:
                 aggregate_string = self.aggregate_string_with_alias()
 
-            sql += (
+            sql.append(
                 aggregate_string.format(
                     aggregate_function=aggregate_function,
                     column="*" if column == "*" else self._table_column_string(column),
                     alias=self.process_alias(aggregates.alias or column),
                 )
-                + ", "
             )
+            sql.append(", ")
 
-        return sql
+        return "".join(sql)
 
     def process_order_by(self):
         """Compiles an order by for a query expression.
@@ -496,7 +613,7 @@ class BaseGrammar:
         Returns:
             self
         """
-        sql = ""
+        sql = []
         loop_count = 0
         for where in self._wheres:
             column = where.column
@@ -523,8 +640,8 @@ class BaseGrammar:
                 """If we have a raw query we just want to use the query supplied
                 and don't need to compile anything.
                 """
-                sql += self.raw_query_string().format(
-                    keyword=keyword, query=where.column
+                sql.append(
+                    self.raw_query_string().format(keyword=keyword, query=where.column)
                 )
 
                 if not isinstance(where.bindings, (list, tuple)):
@@ -533,8 +650,9 @@ class BaseGrammar:
                     )
 
                 if where.bindings:
-                    self.add_binding(*where.bindings)
+                    self.add_binding(list(where.bindings))
 
+                loop_count += 1
                 continue
 
             """The column is an easy compile
@@ -600,18 +718,17 @@ class BaseGrammar:
                     query_from_builder = value.builder.to_sql()
                 query_value = self.subquery_string().format(query=query_from_builder)
             elif isinstance(value, list):
-                query_value = "("
-                for val in value:
-                    if qmark:
-                        query_value += "'?', "
-                        self.add_binding(val)
-                    else:
-                        query_value += self.value_string().format(
-                            value=val, separator=","
-                        )
-                query_value = query_value.rstrip(",").rstrip(", ") + ")"
+                if qmark:
+                    self.add_binding(list(value))
+                    query_value = ", ".join([self._placeholder] * len(value))
+                else:
+                    value_string = self.value_string()
+                    query_value = ",".join(
+                        value_string.format(value=val, separator="") for val in value
+                    )
+                query_value = "(" + query_value + ")"
             elif qmark and value_type != "column":
-                query_value = "'?'"
+                query_value = self._placeholder
                 if (
                     value is not True
                     and value_type != "value_equals"
@@ -620,7 +737,7 @@ class BaseGrammar:
                     self.add_binding(value)
             elif value_type == "value":
                 if qmark:
-                    query_value = "'?'"
+                    query_value = self._placeholder
                 else:
                     query_value = self.value_string().format(value=value, separator="")
                 self.add_binding(value)
@@ -631,13 +748,55 @@ class BaseGrammar:
             else:
                 query_value = ""
 
-            sql += sql_string.format(
-                keyword=keyword, column=column, equality=equality, value=query_value
+            sql.append(
+                sql_string.format(
+                    keyword=keyword, column=column, equality=equality, value=query_value
+                )
             )
 
             loop_count += 1
 
-        return sql
+        return "".join(sql)
+
+    def compile_cursor_where(self, columns, values):
+        """Compiles the where expression selecting the rows that come after a cursor.
+
+        Arguments:
+            columns {list} -- Tuples of a column and the operator it is compared with, > or <.
+            values {list} -- The values of the columns in the row the cursor points to.
+
+        Returns:
+            tuple -- The qmark SQL and its bindings.
+        """
+        wrapped = [self._table_column_string(column) for column, operator in columns]
+        operators = {operator for column, operator in columns}
+
+        if len(columns) == 1:
+            return f"{wrapped[0]} {columns[0][1]} '?'", list(values)
+
+        if self.supports_row_values and len(operators) == 1:
+            sql = "({columns}) {operator} ({values})".format(
+                columns=", ".join(wrapped),
+                operator=operators.pop(),
+                values=", ".join(["'?'"] * len(values)),
+            )
+            return sql, list(values)
+
+        # Spelled out when the directions differ or row values are not supported:
+        # (a > ?) OR (a = ? AND b > ?) OR ...
+        clauses = []
+        bindings = []
+        for index, (column, operator) in enumerate(columns):
+            parts = []
+            for previous in range(index):
+                parts.append(f"{wrapped[previous]} = '?'")
+                bindings.append(values[previous])
+
+            parts.append(f"{wrapped[index]} {operator} '?'")
+            bindings.append(values[index])
+            clauses.append("(" + " AND ".join(parts) + ")")
+
+        return "(" + " OR ".join(clauses) + ")", bindings
 
     def add_binding(self, binding):
         """Adds a binding to the bindings tuple.
@@ -697,7 +856,7 @@ class BaseGrammar:
         Returns:
             string
         """
-        return re.sub(" +", " ", self._sql.strip())
+        return self.collapse_spaces(self._sql)
 
     def to_qmark(self):
         """Cleans up the SQL string and returns the SQL
@@ -705,7 +864,23 @@ class BaseGrammar:
         Returns:
             string
         """
-        return re.sub(" +", " ", self._sql.strip())
+        return self.collapse_spaces(self._sql)
+
+    @staticmethod
+    def collapse_spaces(sql):
+        """Strips the SQL and collapses runs of spaces left by empty clauses into one space.
+
+        Arguments:
+            sql {string} -- The compiled SQL.
+
+        Returns:
+            string
+        """
+        sql = sql.strip()
+        if "  " not in sql:
+            return sql
+
+        return " ".join([part for part in sql.split(" ") if part])
 
     # TODO: Inspect this can't just be used by another method. seems duplicative
     def process_columns(self, separator="", action="select", qmark=False):
@@ -717,13 +892,13 @@ class BaseGrammar:
         Returns:
             self
         """
-        sql = ""
+        sql = []
         for column in self._columns:
             alias = None
             if isinstance(column, SelectExpression):
                 alias = column.alias
                 if column.raw:
-                    sql += column.column + ", "
+                    sql.append(column.column + ", ")
                     continue
 
                 column = column.column
@@ -735,14 +910,17 @@ class BaseGrammar:
                         self.add_binding(*column.builder._bindings)
                 else:
                     builder_sql = column.builder.to_sql()
-                sql += f"({builder_sql}) AS {column.alias}, "
+                sql.append(f"({builder_sql}) AS {column.alias}, ")
                 continue
 
-            sql += self._table_column_string(column, alias=alias, separator=separator)
+            sql.append(
+                self._table_column_string(column, alias=alias, separator=separator)
+            )
 
         if self._aggregates:
-            sql += self.process_aggregates()
+            sql.append(self.process_aggregates())
 
+        sql = "".join(sql)
         if sql == "":
             return "*"
 
@@ -758,29 +936,20 @@ class BaseGrammar:
         Returns:
             self
         """
-        sql = ""
         if self._columns == "*":
             return self._columns
         elif isinstance(self._columns, list):
-            for c in self._columns:
-                for column, value in dict(c).items():
-                    if qmark:
-                        self.add_binding(value)
-                        sql += f"'?'{separator}".strip()
-                    else:
-                        sql += self._compile_value(value, separator=separator)
+            values = [value for c in self._columns for value in dict(c).values()]
         else:
-            for column, value in dict(self._columns).items():
-                if qmark:
-                    self.add_binding(value)
-                    sql += f"'?'{separator}".strip()
-                else:
-                    sql += self._compile_value(value, separator=separator)
+            values = list(dict(self._columns).values())
 
-        if not qmark:
-            return sql[:-2]
+        if qmark:
+            self.add_binding(values)
+            return separator.strip().join([self._placeholder] * len(values))
 
-        return sql.rstrip(separator.strip())
+        return "".join(
+            [self._compile_value(value, separator=separator) for value in values]
+        )[:-2]
 
     def process_column(self, column, separator=""):
         """Compiles a column into the column syntax.
@@ -890,6 +1059,25 @@ class BaseGrammar:
         )
         return self
 
+    def bulk_load(self, table, columns):
+        """Compiles the statement used to bulk load rows into a table.
+
+        Grammars without a native bulk loading statement insert one row per parameter set
+        and the connection runs it with 'executemany'.
+
+        Arguments:
+            table {string} -- The name of the table to load rows into.
+            columns {list} -- The names of the columns in each row.
+
+        Returns:
+            string
+        """
+        return "INSERT INTO {table} ({columns}) VALUES ({values})".format(
+            table=self.wrap_table(table),
+            columns=self.columnize_bulk_columns(columns),
+            values=", ".join("'?'" for _ in columns),
+        )
+
     def truncate_table(self, table, foreign_keys=False):
         """Specifies a truncate table expression.
 
@@ -4,6 +4,8 @@ from .BaseGrammar import BaseGrammar
 class MSSQLGrammar(BaseGrammar):
     """Microsoft SQL Server grammar class."""
 
+    supports_row_values = False
+
     aggregate_options = {
         "SUM": "SUM",
         "MAX": "MAX",
@@ -33,6 +35,9 @@ class MSSQLGrammar(BaseGrammar):
     def select_no_table(self):
         return "SELECT {columns}"
 
+    def exists_format(self):
+        return "SELECT CASE WHEN EXISTS({query}) THEN 1 ELSE 0 END AS m_exists_reserved"
+
     def select_format(self):
         return "SELECT {limit} {columns} FROM {table} {joins} {wheres} {group_by} {order_by} {offset} {having}"
 
@@ -45,6 +50,52 @@ class MSSQLGrammar(BaseGrammar):
     def bulk_insert_format(self):
         return "INSERT INTO {table} ({columns}) VALUES {values}"
 
+    def upsert_format(self):
+        return (
+            "MERGE INTO {table} AS [target] USING (VALUES {values}) AS [source] ({columns}) "
+            "ON {conflict};"
+        )
+
+    def bulk_update_format(self):
+        return (
+            "MERGE INTO {table} AS [target] USING (VALUES {values}) AS [source] ({columns}) "
+            "ON [target].{key} = [source].{key} WHEN MATCHED THEN UPDATE SET {sets};"
+        )
+
+    def process_bulk_update(self, key, columns, qmark=False):
+        sets = ", ".join(
+            f"[target].[{column}] = [source].[{column}]" for column in columns
+        )
+        values = [[row[column] for column in [key] + columns] for row in self._columns]
+
+        return self.bulk_update_format().format(
+            table=self.process_table(self.table),
+            values=self.columnize_bulk_values(values, qmark=qmark),
+            columns=self.columnize_bulk_columns([key] + columns),
+            key=self.column_string().format(column=key, separator=""),
+            sets=sets,
+        )
+
+    def process_upsert_conflict(self, unique_by, update):
+        matches = " AND ".join(
+            f"[target].[{column}] = [source].[{column}]" for column in unique_by
+        )
+        columns = list(self._columns[0].keys())
+        sql = matches
+
+        if update:
+            sql += " WHEN MATCHED THEN UPDATE SET " + ", ".join(
+                f"[target].[{column}] = [source].[{column}]" for column in update
+            )
+
+        return (
+            sql
+            + " WHEN NOT MATCHED THEN INSERT ({columns}) VALUES ({values})".format(
+                columns=self.columnize_bulk_columns(columns),
+                values=", ".join(f"[source].[{column}]" for column in columns),
+            )
+        )
+
     def delete_format(self):
         return "DELETE FROM {table} {wheres}"
 
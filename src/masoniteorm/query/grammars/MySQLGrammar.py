@@ -52,6 +52,9 @@ class MySQLGrammar(BaseGrammar):
     def select_no_table(self):
         return "SELECT {columns}"
 
+    def exists_format(self):
+        return "SELECT EXISTS({query}) AS m_exists_reserved"
+
     def update_format(self):
         return "UPDATE {table} SET {key_equals} {wheres}"
 
@@ -61,6 +64,26 @@ class MySQLGrammar(BaseGrammar):
     def bulk_insert_format(self):
         return "INSERT INTO {table} ({columns}) VALUES {values}"
 
+    def upsert_format(self):
+        return "INSERT INTO {table} ({columns}) VALUES {values} {conflict}"
+
+    def process_upsert_conflict(self, unique_by, update):
+        """MySQL resolves conflicts on any unique index so unique_by only matters when nothing is updated"""
+        if not update:
+            # Assigning a column to itself leaves existing rows untouched
+            column = self.column_string().format(column=unique_by[0], separator="")
+            return f"ON DUPLICATE KEY UPDATE {column} = {column}"
+
+        return "ON DUPLICATE KEY UPDATE " + ", ".join(
+            "{column} = VALUES({column})".format(
+                column=self.column_string().format(column=column, separator="")
+            )
+            for column in update
+        )
+
+    def bulk_update_format(self):
+        return "UPDATE {table} SET {cases} WHERE {key} IN ({keys})"
+
     def delete_format(self):
         return "DELETE FROM {table} {wheres}"
 
@@ -202,6 +225,24 @@ class MySQLGrammar(BaseGrammar):
     def disable_foreign_key_constraints(self):
         return "SET FOREIGN_KEY_CHECKS=0"
 
+    def bulk_load(self, table, columns):
+        """Compiles a LOAD DATA LOCAL INFILE statement that reads tab separated rows from a client side file.
+
+        Arguments:
+            table {string} -- The name of the table to load rows into.
+            columns {list} -- The names of the columns in each row.
+
+        Returns:
+            string
+        """
+        return (
+            f"LOAD DATA LOCAL INFILE '?' INTO TABLE {self.wrap_table(table)} "
+            "CHARACTER SET utf8mb4 "
+            "FIELDS TERMINATED BY '\\t' ESCAPED BY '\\\\' "
+            "LINES TERMINATED BY '\\n' "
+            f"({self.columnize_bulk_columns(columns)})"
+        )
+
     def truncate_table(self, table, foreign_keys=False):
         """Specifies a truncate table expression.
 
@@ -34,6 +34,9 @@ class PostgresGrammar(BaseGrammar):
     def select_no_table(self):
         return "SELECT {columns}"
 
+    def exists_format(self):
+        return "SELECT EXISTS({query}) AS m_exists_reserved"
+
     def select_format(self):
         return "SELECT {columns} FROM {table} {joins} {wheres} {group_by} {order_by} {limit} {offset} {having}"
 
@@ -46,6 +49,48 @@ class PostgresGrammar(BaseGrammar):
     def bulk_insert_format(self):
         return "INSERT INTO {table} ({columns}) VALUES {values} RETURNING *"
 
+    def upsert_format(self):
+        return "INSERT INTO {table} ({columns}) VALUES {values} {conflict}"
+
+    def bulk_update_format(self):
+        return (
+            'UPDATE {table} SET {sets} FROM (VALUES {types}, {values}) AS "m_bulk_update" ({columns}) '
+            'WHERE {table}.{key} = "m_bulk_update".{key}'
+        )
+
+    def process_bulk_update(self, key, columns, qmark=False):
+        """Joins the table to the new values so every row is updated in one pass.
+
+        Columns of a VALUES list take the type of their values, which is text for quoted
+        values and NULL. The first row holds a NULL of each column's type, read from the
+        row type of the table, so the values are converted to the types of the columns.
+        It never matches a row since its key is NULL.
+        """
+        table = self.process_table(self.table)
+        sets = ", ".join(
+            '{column} = "m_bulk_update".{column}'.format(
+                column=self.column_string().format(column=column, separator="")
+            )
+            for column in columns
+        )
+        types = ", ".join(
+            "(NULL::{table}).{column}".format(
+                table=table,
+                column=self.column_string().format(column=column, separator=""),
+            )
+            for column in [key] + columns
+        )
+        values = [[row[column] for column in [key] + columns] for row in self._columns]
+
+        return self.bulk_update_format().format(
+            table=table,
+            sets=sets,
+            types=f"({types})",
+            values=self.columnize_bulk_values(values, qmark=qmark),
+            columns=self.columnize_bulk_columns([key] + columns),
+            key=self.column_string().format(column=key, separator=""),
+        )
+
     def delete_format(self):
         return "DELETE FROM {table} {wheres}"
 
@@ -185,6 +230,18 @@ class PostgresGrammar(BaseGrammar):
     def where_not_null_string(self):
         return " {keyword} {column} IS NOT NULL"
 
+    def bulk_load(self, table, columns):
+        """Compiles a COPY statement that reads tab separated rows from STDIN.
+
+        Arguments:
+            table {string} -- The name of the table to load rows into.
+            columns {list} -- The names of the columns in each row.
+
+        Returns:
+            string
+        """
+        return f"COPY {self.wrap_table(table)} ({self.columnize_bulk_columns(columns)}) FROM STDIN"
+
     def truncate_table(self, table, foreign_keys=False):
         """Specifies a truncate table expression.
 
@@ -37,6 +37,9 @@ class SQLiteGrammar(BaseGrammar):
     def select_no_table(self):
         return "SELECT {columns}"
 
+    def exists_format(self):
+        return "SELECT EXISTS({query}) AS m_exists_reserved"
+
     def update_format(self):
         return "UPDATE {table} SET {key_equals} {wheres}"
 
@@ -46,6 +49,12 @@ class SQLiteGrammar(BaseGrammar):
     def bulk_insert_format(self):
         return "INSERT INTO {table} ({columns}) VALUES {values}"
 
+    def upsert_format(self):
+        return "INSERT INTO {table} ({columns}) VALUES {values} {conflict}"
+
+    def bulk_update_format(self):
+        return "UPDATE {table} SET {cases} WHERE {key} IN ({keys})"
+
     def delete_format(self):
         return "DELETE FROM {table} {wheres}"
 
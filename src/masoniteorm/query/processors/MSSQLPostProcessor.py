@@ -37,3 +37,31 @@ class MSSQLPostProcessor:
 
         results.update({id_key: id})
         return results
+
+    def process_bulk_insert_get_ids(self, builder, rows, results, id_key):
+        """Sets the generated primary keys on the rows of a bulk insert.
+
+        Args:
+            builder (masoniteorm.builder.QueryBuilder): The query builder class
+            rows (list): The dictionaries that were inserted.
+            results (list): The result from the bulk insert query.
+            id_key (string): The key to set the primary key to. This is usually the primary key of the table.
+
+        Returns:
+            list: The rows with their primary keys.
+        """
+        # @@Identity is the identity generated for the last row of a multi row insert
+        if any(id_key in row for row in rows):
+            return rows
+
+        last_id = builder.new_connection().query(
+            "SELECT @@Identity as [id]", results=1
+        )["id"]
+        if not str(last_id).isdigit():
+            return rows
+
+        first_id = int(last_id) - len(rows) + 1
+        for offset, row in enumerate(rows):
+            row[id_key] = first_id + offset
+
+        return rows
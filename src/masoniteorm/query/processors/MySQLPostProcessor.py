@@ -1,3 +1,6 @@
+import inspect
+
+
 class MySQLPostProcessor:
     """Post processor classes are responsable for modifying the result after a query.
 
@@ -24,3 +27,49 @@ class MySQLPostProcessor:
 
         results.update({id_key: builder._connection.get_cursor().lastrowid})
         return results
+
+    def process_bulk_insert_get_ids(self, builder, rows, results, id_key):
+        """Sets the generated primary keys on the rows of a bulk insert.
+
+        The keys are counted up from the id of the first row by @@auto_increment_increment.
+        They are not set when fewer rows than given were inserted, like with INSERT IGNORE,
+        because the skipped rows cannot be told apart.
+
+        Args:
+            builder (masoniteorm.builder.QueryBuilder): The query builder class
+            rows (list): The dictionaries that were inserted.
+            results (list): The result from the bulk insert query.
+            id_key (string): The key to set the primary key to. This is usually the primary key of the table.
+
+        Returns:
+            list|coroutine: The rows with their primary keys. A coroutine on async connections.
+        """
+        # LAST_INSERT_ID() is the id generated for the first row of a multi row insert
+        cursor = builder._connection.get_cursor()
+        first_id = cursor.lastrowid
+        if (
+            any(id_key in row for row in rows)
+            or not first_id
+            or cursor.rowcount != len(rows)
+        ):
+            return rows
+
+        increment = builder._connection.query(
+            "SELECT @@auto_increment_increment AS m_increment", (), results=1
+        )
+
+        if inspect.isawaitable(increment):
+            return self._set_bulk_insert_ids_async(rows, increment, first_id, id_key)
+
+        return self._set_bulk_insert_ids(rows, increment, first_id, id_key)
+
+    async def _set_bulk_insert_ids_async(self, rows, increment, first_id, id_key):
+        return self._set_bulk_insert_ids(rows, await increment, first_id, id_key)
+
+    @staticmethod
+    def _set_bulk_insert_ids(rows, increment, first_id, id_key):
+        step = int(increment["m_increment"]) if increment else 1
+        for offset, row in enumerate(rows):
+            row[id_key] = first_id + offset * step
+
+        return rows
@@ -25,3 +25,21 @@ class PostgresPostProcessor:
         """
 
         return results
+
+    def process_bulk_insert_get_ids(self, builder, rows, results, id_key):
+        """Sets the generated primary keys on the rows of a bulk insert.
+
+        Args:
+            builder (masoniteorm.builder.QueryBuilder): The query builder class
+            rows (list): The dictionaries that were inserted.
+            results (list): The result from the bulk insert query.
+            id_key (string): The key to set the primary key to. This is usually the primary key of the table.
+
+        Returns:
+            list: The rows with their primary keys.
+        """
+        # Bulk inserts end with RETURNING * so every inserted record is in the results
+        for row, result in zip(rows, results or []):
+            row.update(result)
+
+        return rows
@@ -1,3 +1,6 @@
+import inspect
+
+
 class SQLitePostProcessor:
     """Post processor classes are responsable for modifying the result after a query.
 
@@ -24,3 +27,59 @@ class SQLitePostProcessor:
         results.update({id_key: builder.get_connection().get_cursor().lastrowid})
 
         return results
+
+    def process_bulk_insert_get_ids(self, builder, rows, results, id_key):
+        """Sets the generated primary keys on the rows of a bulk insert.
+
+        The keys are counted back from the rowid of the last row so they are only set when
+        the primary key is an alias of the rowid (a lone INTEGER PRIMARY KEY of a rowid table).
+
+        Args:
+            builder (masoniteorm.builder.QueryBuilder): The query builder class
+            rows (list): The dictionaries that were inserted.
+            results (list): The result from the bulk insert query.
+            id_key (string): The key to set the primary key to. This is usually the primary key of the table.
+
+        Returns:
+            list|coroutine: The rows with their primary keys. A coroutine on async connections.
+        """
+        # lastrowid is the rowid of the last row of a multi row insert
+        connection = builder.get_connection()
+        last_id = connection.get_cursor().lastrowid
+        if any(id_key in row for row in rows) or not last_id:
+            return rows
+
+        table = builder.get_table_name()
+        key = connection.query(
+            "SELECT "
+            "(SELECT COUNT(*) FROM pragma_table_info('?') WHERE pk > 0) AS m_keys, "
+            "(SELECT UPPER(type) FROM pragma_table_info('?') WHERE pk > 0 AND name = '?') AS m_type, "
+            "(SELECT COUNT(*) FROM pragma_index_list('?') WHERE origin = 'pk') AS m_key_indexes",
+            (table, table, id_key, table),
+            results=1,
+        )
+
+        if inspect.isawaitable(key):
+            return self._set_bulk_insert_ids_async(rows, key, last_id, id_key)
+
+        return self._set_bulk_insert_ids(rows, key, last_id, id_key)
+
+    async def _set_bulk_insert_ids_async(self, rows, key, last_id, id_key):
+        return self._set_bulk_insert_ids(rows, await key, last_id, id_key)
+
+    @staticmethod
+    def _set_bulk_insert_ids(rows, key, last_id, id_key):
+        # WITHOUT ROWID tables and other primary keys have an index for the key
+        is_rowid = (
+            key["m_keys"] == 1
+            and key["m_type"] == "INTEGER"
+            and key["m_key_indexes"] == 0
+        )
+        if not is_rowid:
+            return rows
+
+        first_id = last_id - len(rows) + 1
+        for offset, row in enumerate(rows):
+            row[id_key] = first_id + offset
+
+        return rows
@@ -1,6 +1,7 @@
 from .Blueprint import Blueprint
 from .Table import Table
 from .TableDiff import TableDiff
+from ..connections.ConnectionRouter import ConnectionRouter
 from ..exceptions import ConnectionNotRegistered
 
 
@@ -124,21 +125,18 @@ class Schema:
         return self._blueprint
 
     def get_connection_information(self):
+        details = ConnectionRouter.get_write_details(
+            self.connection_details.get(self.connection, {})
+        )
         return {
-            "host": self.connection_details.get(self.connection, {}).get("host"),
-            "database": self.connection_details.get(self.connection, {}).get(
-                "database"
-            ),
-            "user": self.connection_details.get(self.connection, {}).get("user"),
-            "port": self.connection_details.get(self.connection, {}).get("port"),
-            "password": self.connection_details.get(self.connection, {}).get(
-                "password"
-            ),
-            "prefix": self.connection_details.get(self.connection, {}).get("prefix"),
-            "options": self.connection_details.get(self.connection, {}).get(
-                "options", {}
-            ),
-            "full_details": self.connection_details.get(self.connection),
+            "host": details.get("host"),
+            "database": details.get("database"),
+            "user": details.get("user"),
+            "port": details.get("port"),
+            "password": details.get("password"),
+            "prefix": details.get("prefix"),
+            "options": details.get("options", {}),
+            "full_details": details,
         }
 
     def new_connection(self):
@@ -1,3 +1,5 @@
+import re
+
 from .Platform import Platform
 from ..Table import Table
 
@@ -275,6 +277,27 @@ class MSSQLPlatform(Platform):
     def compile_table_exists(self, table, database):
         return f"SELECT * FROM INFORMATION_SCHEMA.TABLES WHERE TABLE_NAME = '{table}'"
 
+    def compile_estimated_count(self, table, database=None):
+        return (
+            "SELECT SUM(rows) AS estimate FROM sys.partitions "
+            f"WHERE object_id = OBJECT_ID('{table}') AND index_id IN (0, 1)"
+        )
+
+    def compile_explain(self, sql):
+        # SHOWPLAN_XML returns the plan instead of running the query and must be set in its own batch
+        return ["SET SHOWPLAN_XML ON", sql, "SET SHOWPLAN_XML OFF"]
+
+    def process_explain(self, result):
+        row = self._first_row(result)
+        if not row:
+            return None
+
+        match = re.search(r'StatementEstRows="([^"]+)"', str(next(iter(row.values()))))
+        if not match:
+            return None
+
+        return int(round(float(match.group(1))))
+
     def compile_truncate(self, table, foreign_keys=False):
         if not foreign_keys:
             return f"TRUNCATE TABLE {self.wrap_table(table)}"
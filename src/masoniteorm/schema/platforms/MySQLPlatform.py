@@ -332,6 +332,27 @@ class MySQLPlatform(Platform):
     def compile_table_exists(self, table, database):
         return f"SELECT * from information_schema.tables where table_name='{table}' AND table_schema = '{database}'"
 
+    def compile_estimated_count(self, table, database=None):
+        return (
+            "SELECT TABLE_ROWS AS estimate FROM information_schema.TABLES "
+            f"WHERE TABLE_SCHEMA = '{database}' AND TABLE_NAME = '{table}'"
+        )
+
+    def compile_explain(self, sql):
+        return f"EXPLAIN {sql}"
+
+    def process_explain(self, result):
+        row = self._first_row(result)
+        if not row or row.get("rows") is None:
+            return None
+
+        # The rows read from the first table times the percentage left by the wheres
+        filtered = row.get("filtered")
+        if filtered is None:
+            filtered = 100
+
+        return int(int(row["rows"]) * float(filtered) / 100)
+
     def compile_truncate(self, table, foreign_keys=False):
         if not foreign_keys:
             return f"TRUNCATE {self.wrap_table(table)}"
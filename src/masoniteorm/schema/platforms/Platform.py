@@ -87,3 +87,49 @@ class Platform:
 
     def wrap_table(self, table_name):
         return self.get_table_string().format(table=table_name)
+
+    def compile_estimated_count(self, table, database=None):
+        """Compiles a query reading the number of rows of a table from the database statistics.
+
+        Returns:
+            string|None -- None when the platform keeps no row counts.
+        """
+        return None
+
+    def process_estimated_count(self, result):
+        """Gets the row count from the result of the 'compile_estimated_count' query.
+
+        Returns:
+            int|None -- None when the table has no statistics yet.
+        """
+        row = self._first_row(result)
+        if not row or row.get("estimate") is None:
+            return None
+
+        estimate = int(row["estimate"])
+        return estimate if estimate >= 0 else None
+
+    def compile_explain(self, sql):
+        """Compiles a query asking the planner how many rows a select returns.
+
+        Returns:
+            string|list|None -- None when the plan of the platform has no row estimates. A list
+                holds a statement setting up the session, the explained query and a statement
+                restoring the session, which run on one connection.
+        """
+        return None
+
+    def process_explain(self, result):
+        """Gets the estimated number of rows from the result of the 'compile_explain' query.
+
+        Returns:
+            int|None
+        """
+        return None
+
+    @staticmethod
+    def _first_row(result):
+        if isinstance(result, (list, tuple)):
+            return result[0] if result else None
+
+        return result
@@ -1,3 +1,5 @@
+import json
+
 from .Platform import Platform
 from ..Table import Table
 
@@ -387,6 +389,28 @@ class PostgresPlatform(Platform):
 
         return table
 
+    def compile_estimated_count(self, table, database=None):
+        return f"SELECT reltuples::bigint AS estimate FROM pg_class WHERE oid = to_regclass('{table}')"
+
+    def process_estimated_count(self, result):
+        # reltuples is -1 before the first ANALYZE and 0 before it on Postgres 13 and older
+        estimate = super().process_estimated_count(result)
+        return estimate if estimate else None
+
+    def compile_explain(self, sql):
+        return f"EXPLAIN (FORMAT JSON) {sql}"
+
+    def process_explain(self, result):
+        row = self._first_row(result)
+        if not row:
+            return None
+
+        plan = row.get("QUERY PLAN")
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+
+        return int(plan[0]["Plan"]["Plan Rows"])
+
     def enable_foreign_key_constraints(self):
         """Postgres does not allow a global way to enable foreign key constraints
         """
@@ -327,6 +327,20 @@ class SQLitePlatform(Platform):
     def compile_column_exists(self, table, column):
         return f"SELECT column_name FROM information_schema.columns WHERE table_name='{table}' and column_name='{column}'"
 
+    def compile_estimated_count(self, table, database=None):
+        # Filled by ANALYZE
+        return f"SELECT stat FROM sqlite_stat1 WHERE tbl = '{table}'"
+
+    def process_estimated_count(self, result):
+        if isinstance(result, dict):
+            result = [result]
+
+        # The first number of every index statistic is the number of rows of the table
+        counts = [
+            int(row["stat"].split()[0]) for row in result or [] if row.get("stat")
+        ]
+        return max(counts) if counts else None
+
     def compile_truncate(self, table, foreign_keys=False):
         if not foreign_keys:
             return f"DELETE FROM {self.wrap_table(table)}"
@@ -0,0 +1,35 @@
+import asyncio
+import unittest
+
+from src.masoniteorm.connections import AsyncPostgresConnection, AsyncSQLiteConnection
+
+
+class FakeAsyncpgConnection:
+    async def fetchrow(self, query, *bindings):
+        return None
+
+
+class TestAsyncConnections(unittest.TestCase):
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+
+    def tearDown(self):
+        self.loop.close()
+
+    def run_async(self, coroutine):
+        return self.loop.run_until_complete(coroutine)
+
+    def test_sqlite_returns_none_without_a_row(self):
+        connection = AsyncSQLiteConnection(database=":memory:")
+
+        self.assertIsNone(
+            self.run_async(connection.query("SELECT 1 WHERE 1 = 0", results=1))
+        )
+
+    def test_postgres_returns_none_without_a_row(self):
+        connection = AsyncPostgresConnection()
+        connection._connection = FakeAsyncpgConnection()
+
+        self.assertIsNone(
+            self.run_async(connection.execute("SELECT 1 WHERE 1 = 0", results=1))
+        )
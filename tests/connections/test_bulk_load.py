@@ -0,0 +1,81 @@
+import datetime
+import unittest
+from unittest import mock
+
+from src.masoniteorm.connections import MySQLConnection, PostgresConnection
+from src.masoniteorm.exceptions import QueryException
+
+ROWS = [
+    (1, "Joe", None),
+    (2, "tab\there", True),
+    (3, "line\nbreak \\ slash", datetime.date(2020, 1, 2)),
+]
+
+ENCODED = (
+    "1\tJoe\t\\N\n" "2\ttab\\there\t1\n" "3\tline\\nbreak \\\\ slash\t2020-01-02\n"
+)
+
+
+class TestBulkLoad(unittest.TestCase):
+    def test_postgres_streams_rows_through_copy(self):
+        raw = mock.MagicMock(closed=0)
+        cursor = raw.cursor.return_value.__enter__.return_value
+        copied = []
+        cursor.copy_expert.side_effect = lambda query, buffer: copied.append(
+            (query, buffer.read(8) + buffer.read())
+        )
+
+        with mock.patch.object(
+            PostgresConnection, "create_connection", return_value=raw
+        ):
+            count = PostgresConnection().bulk_load(
+                'COPY "users" ("id", "name", "active") FROM STDIN', iter(ROWS)
+            )
+
+        self.assertEqual(count, 3)
+        self.assertEqual(
+            copied, [('COPY "users" ("id", "name", "active") FROM STDIN', ENCODED)]
+        )
+        raw.close.assert_called_once()
+
+    def test_mysql_loads_rows_from_a_file(self):
+        raw = mock.MagicMock()
+        cursor = raw.cursor.return_value.__enter__.return_value
+        loaded = []
+
+        def execute(query, bindings):
+            with open(bindings[0], encoding="utf-8") as file:
+                loaded.append((query, file.read()))
+
+        cursor.execute.side_effect = execute
+
+        with mock.patch.object(MySQLConnection, "create_connection", return_value=raw):
+            count = MySQLConnection(options={"local_infile": True}).bulk_load(
+                "LOAD DATA LOCAL INFILE '?' INTO TABLE `users`", ROWS
+            )
+
+        self.assertEqual(count, 3)
+        self.assertEqual(
+            loaded, [("LOAD DATA LOCAL INFILE %s INTO TABLE `users`", ENCODED)]
+        )
+
+    def test_mysql_requires_local_infile(self):
+        with self.assertRaises(QueryException):
+            MySQLConnection().bulk_load("LOAD DATA LOCAL INFILE '?'", ROWS)
+
+    def test_json_values_are_dumped(self):
+        connection = MySQLConnection()
+
+        self.assertEqual(
+            connection.encode_bulk_load_row(({"tags": ["a\tb"]}, [1, 2])),
+            '{"tags": ["a\\\\tb"]}\t[1, 2]\n',
+        )
+
+    def test_postgres_loads_binary_values_as_hex(self):
+        self.assertEqual(
+            PostgresConnection().encode_bulk_load_row((b"\x00\xff",)), "\\\\x00ff\n"
+        )
+
+    def test_mysql_rejects_binary_values(self):
+        with self.assertRaises(QueryException):
+            MySQLConnection().encode_bulk_load_row((b"\x00\xff",))
@@ -0,0 +1,241 @@
+import threading
+import time
+import unittest
+from unittest import mock
+
+from src.masoniteorm.connections import (
+    ConnectionPool,
+    MySQLConnection,
+    PostgresConnection,
+)
+from src.masoniteorm.exceptions import ConnectionPoolExhausted
+
+
+class FakeConnection:
+    def __init__(self):
+        self.closed = False
+        self.healthy = True
+
+    def close(self):
+        self.closed = True
+
+    def ping(self):
+        if not self.healthy:
+            raise ConnectionError("gone away")
+
+
+class TestConnectionPool(unittest.TestCase):
+    def make_pool(self, **kwargs):
+        return ConnectionPool(
+            FakeConnection, ping=lambda connection: connection.ping(), **kwargs
+        )
+
+    def test_reuses_released_connections(self):
+        pool = self.make_pool(max_size=2)
+        connection = pool.acquire()
+        pool.release(connection)
+
+        self.assertIs(pool.acquire(), connection)
+
+    def test_fills_to_min_size(self):
+        pool = self.make_pool(min_size=2, max_size=4)
+        first = pool.acquire()
+        second = pool.acquire()
+
+        self.assertIsNot(first, second)
+        self.assertEqual(pool._size, 2)
+
+    def test_times_out_when_exhausted(self):
+        pool = self.make_pool(max_size=1, timeout=0.05)
+        pool.acquire()
+
+        with self.assertRaises(ConnectionPoolExhausted):
+            pool.acquire()
+
+    def test_waiting_checkout_gets_released_connection(self):
+        pool = self.make_pool(max_size=1, timeout=2)
+        connection = pool.acquire()
+
+        timer = threading.Timer(0.05, pool.release, args=(connection,))
+        timer.start()
+
+        self.assertIs(pool.acquire(), connection)
+        timer.join()
+
+    def test_replaces_unhealthy_connections_on_checkout(self):
+        pool = self.make_pool(max_size=1)
+        connection = pool.acquire()
+        connection.healthy = False
+        pool.release(connection)
+
+        new_connection = pool.acquire()
+
+        self.assertIsNot(new_connection, connection)
+        self.assertTrue(connection.closed)
+
+    def test_recycles_connections_past_max_lifetime(self):
+        pool = self.make_pool(max_size=1, max_lifetime=0.01)
+        connection = pool.acquire()
+        time.sleep(0.02)
+        pool.release(connection)
+
+        self.assertTrue(connection.closed)
+        self.assertIsNot(pool.acquire(), connection)
+
+    def test_reaps_idle_connections_above_min_size(self):
+        pool = self.make_pool(min_size=1, max_size=3, idle_timeout=0.01)
+        connections = [pool.acquire() for _ in range(3)]
+        for connection in connections:
+            pool.release(connection)
+
+        time.sleep(0.02)
+        pool.acquire()
+
+        self.assertEqual(pool._size, 1)
+        self.assertEqual(sum(c.closed for c in connections), 2)
+
+    def test_reaped_connections_are_closed_outside_the_lock(self):
+        locked = []
+
+        def close(connection):
+            locked.append(pool._condition._is_owned())
+            connection.close()
+
+        pool = self.make_pool(max_size=2, idle_timeout=0.01, close=close)
+        connections = [pool.acquire() for _ in range(2)]
+        for connection in connections:
+            pool.release(connection)
+
+        time.sleep(0.02)
+        pool.acquire()
+
+        self.assertEqual(locked, [False, False])
+
+    def test_reaping_refills_to_min_size(self):
+        pool = self.make_pool(min_size=2, max_size=4, max_lifetime=0.01)
+        time.sleep(0.02)
+        pool.acquire()
+
+        self.assertEqual(pool.stats()["size"], 2)
+        self.assertEqual(pool.stats()["idle"], 1)
+
+    def test_failed_pings_count_against_the_timeout(self):
+        def ping(connection):
+            time.sleep(0.05)
+            raise ConnectionError("gone away")
+
+        pool = ConnectionPool(
+            FakeConnection, min_size=3, max_size=3, timeout=0.08, ping=ping
+        )
+
+        with self.assertRaises(ConnectionPoolExhausted):
+            pool.acquire()
+
+        self.assertEqual(pool.stats()["timeouts"], 1)
+
+    def test_stats(self):
+        pool = self.make_pool(min_size=1, max_size=2, timeout=0)
+        first = pool.acquire()
+        pool.acquire()
+        with self.assertRaises(ConnectionPoolExhausted):
+            pool.acquire()
+        pool.release(first)
+
+        stats = pool.stats()
+        self.assertEqual(stats["size"], 2)
+        self.assertEqual(stats["idle"], 1)
+        self.assertEqual(stats["checked_out"], 1)
+        self.assertEqual(stats["checkouts"], 2)
+        self.assertEqual(stats["timeouts"], 1)
+
+    def test_discards_connections_that_fail_to_reset(self):
+        def reset(connection):
+            raise ConnectionError("server closed the connection")
+
+        pool = ConnectionPool(FakeConnection, max_size=1, reset=reset)
+        connection = pool.acquire()
+        pool.release(connection)
+
+        self.assertTrue(connection.closed)
+        self.assertEqual(pool.stats()["size"], 0)
+
+    def test_registers_one_pool_per_name(self):
+        pool = ConnectionPool.register("test_pool", self.make_pool)
+        self.assertIs(ConnectionPool.register("test_pool", self.make_pool), pool)
+
+        ConnectionPool.close_all()
+        self.assertIsNone(ConnectionPool.get_pool("test_pool"))
+
+
+class TestMySQLConnectionPooling(unittest.TestCase):
+    def tearDown(self):
+        ConnectionPool.close_all()
+
+    def make_connection(self):
+        return MySQLConnection(
+            name="pooled_mysql", full_details={"pool": {"min": 0, "max": 2}}
+        )
+
+    def test_queries_borrow_and_return_pooled_connections(self):
+        raw = mock.MagicMock()
+        with mock.patch.object(MySQLConnection, "create_connection", return_value=raw):
+            connection = self.make_connection()
+            connection.query("SELECT 1")
+            connection.query("SELECT 1")
+
+            pool = ConnectionPool.get_pool("pooled_mysql")
+
+            self.assertEqual(pool._size, 1)
+            self.assertEqual(len(pool._idle), 1)
+            self.assertIsNone(connection._connection)
+            raw.close.assert_not_called()
+
+    def test_transactions_hold_connection_until_commit(self):
+        raw = mock.MagicMock()
+        with mock.patch.object(MySQLConnection, "create_connection", return_value=raw):
+            connection = self.make_connection().make_connection().begin()
+            connection.query("SELECT 1")
+
+            pool = ConnectionPool.get_pool("pooled_mysql")
+            self.assertEqual(len(pool._idle), 0)
+
+            connection.commit()
+            self.assertEqual(len(pool._idle), 1)
+
+
+class TestPostgresConnectionPooling(unittest.TestCase):
+    def tearDown(self):
+        ConnectionPool.close_all()
+
+    def make_connection(self):
+        return PostgresConnection(
+            name="pooled_postgres", full_details={"pool": {"min": 0, "max": 2}}
+        )
+
+    def test_returned_connections_are_reset(self):
+        raw = mock.MagicMock(closed=0)
+        # psycopg2.extensions.TRANSACTION_STATUS_INTRANS
+        raw.get_transaction_status.return_value = 2
+        with mock.patch.object(
+            PostgresConnection, "create_connection", return_value=raw
+        ):
+            connection = self.make_connection().make_connection()
+            connection.begin()
+            connection.close_connection()
+
+            raw.rollback.assert_called_once()
+            self.assertTrue(raw.autocommit)
+            self.assertEqual(connection.get_pool_stats()["idle"], 1)
+
+    def test_pool_stats(self):
+        raw = mock.MagicMock(closed=0)
+        with mock.patch.object(
+            PostgresConnection, "create_connection", return_value=raw
+        ):
+            connection = self.make_connection().make_connection()
+
+            stats = connection.get_pool_stats()
+            self.assertEqual(stats["checked_out"], 1)
+            self.assertEqual(stats["max"], 2)
+
+        self.assertEqual(PostgresConnection().get_pool_stats(), {})
@@ -0,0 +1,143 @@
+import os
+import sqlite3
+import tempfile
+import time
+import unittest
+
+from src.masoniteorm.connections import (
+    ConnectionPool,
+    ConnectionRouter,
+    SQLiteConnection,
+)
+from src.masoniteorm.query import QueryBuilder
+
+
+class TestConnectionRouter(unittest.TestCase):
+    def setUp(self):
+        ConnectionRouter._counters.clear()
+
+    def tearDown(self):
+        ConnectionRouter.forget_writes()
+        ConnectionPool.close_all()
+
+    def make_router(self, **details):
+        details.setdefault("driver", "mysql")
+        details.setdefault("user", "root")
+        details.setdefault("read", [{"host": "replica-1"}, {"host": "replica-2"}])
+        details.setdefault("write", {"host": "primary"})
+        return ConnectionRouter.make("mysql", details)
+
+    def test_entries_without_read_hosts_are_not_routed(self):
+        self.assertIsNone(ConnectionRouter.make("mysql", {"host": "localhost"}))
+
+    def test_merges_shared_keys(self):
+        router = self.make_router()
+
+        self.assertEqual(
+            router.write_details(),
+            {"driver": "mysql", "user": "root", "host": "primary", "route": "write"},
+        )
+        self.assertEqual(router.read_details()["user"], "root")
+
+    def test_round_robin(self):
+        router = self.make_router()
+
+        hosts = [router.read_details()["host"] for _ in range(4)]
+
+        self.assertEqual(hosts, ["replica-1", "replica-2", "replica-1", "replica-2"])
+
+    def test_least_loaded(self):
+        router = self.make_router(read_strategy="least_loaded")
+        busy = ConnectionPool.register(
+            "mysql.read.0", lambda: ConnectionPool(object, max_size=5)
+        )
+        busy.acquire()
+
+        hosts = {router.read_details()["host"] for _ in range(4)}
+
+        self.assertEqual(hosts, {"replica-2"})
+
+    def test_sticky_after_write(self):
+        router = self.make_router(sticky=0.05)
+        self.assertFalse(router.is_sticky())
+
+        router.record_write()
+        self.assertTrue(router.is_sticky())
+
+        time.sleep(0.06)
+        self.assertFalse(router.is_sticky())
+
+    def test_writes_are_not_recorded_without_sticky(self):
+        router = self.make_router()
+        router.record_write()
+
+        self.assertFalse(router.is_sticky())
+
+
+class TestQueryBuilderRouting(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.mkdtemp()
+        self.primary = os.path.join(directory, "primary.sqlite3")
+        self.replica = os.path.join(directory, "replica.sqlite3")
+        for database in (self.primary, self.replica):
+            connection = sqlite3.connect(database)
+            connection.execute("CREATE TABLE items (name TEXT)")
+            connection.execute("INSERT INTO items (name) VALUES (?)", (database,))
+            connection.commit()
+            connection.close()
+
+        self.details = {
+            "default": "split",
+            "split": {
+                "driver": "sqlite",
+                "read": [{"database": self.replica}],
+                "write": {"database": self.primary},
+            },
+        }
+
+    def tearDown(self):
+        ConnectionRouter.forget_writes()
+        SQLiteConnection.close_thread_connections()
+
+    def get_builder(self):
+        return QueryBuilder(
+            connection="split", table="items", connection_details=self.details
+        )
+
+    def test_reads_go_to_replicas(self):
+        self.assertEqual(self.get_builder().first()["name"], self.replica)
+
+    def test_writes_go_to_the_primary(self):
+        self.get_builder().create({"name": "new"})
+
+        self.assertEqual(self.get_builder().where("name", "new").count(), 0)
+        self.assertEqual(
+            sqlite3.connect(self.primary)
+            .execute("SELECT COUNT(*) FROM items WHERE name = 'new'")
+            .fetchone()[0],
+            1,
+        )
+
+    def test_raw_statements_are_routed(self):
+        builder = self.get_builder()
+
+        self.assertEqual(
+            builder.statement("SELECT name FROM items")[0]["name"], self.replica
+        )
+        builder.statement("DELETE FROM items")
+        self.assertEqual(
+            sqlite3.connect(self.primary).execute("SELECT * FROM items").fetchall(),
+            [],
+        )
+
+    def test_transactions_read_from_the_primary(self):
+        builder = self.get_builder()
+        builder.begin()
+        self.assertEqual(builder.first()["name"], self.primary)
+        builder.rollback()
+
+    def test_sticky_reads_after_write(self):
+        self.details["split"]["sticky"] = 5
+        self.get_builder().create({"name": "new"})
+
+        self.assertEqual(self.get_builder().where("name", "new").count(), 1)
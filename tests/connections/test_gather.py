@@ -0,0 +1,96 @@
+import threading
+import time
+import unittest
+from concurrent.futures import Future
+
+from src.masoniteorm.collection import Collection
+from src.masoniteorm.connections import ConnectionResolver
+from src.masoniteorm.exceptions import QueryException
+from src.masoniteorm.models import Model
+from src.masoniteorm.query import AsyncQueryBuilder, QueryBuilder
+
+
+class User(Model):
+    __connection__ = "dev"
+    __timestamps__ = False
+
+
+class AsyncUser(Model):
+    __connection__ = "async_dev"
+    __table__ = "users"
+    __timestamps__ = False
+
+
+class TestGather(unittest.TestCase):
+    def setUp(self):
+        self.resolver = ConnectionResolver()
+
+    def test_runs_builders_and_callables_in_order(self):
+        users, count, first = self.resolver.gather(
+            User.where("id", "<", 3),
+            User.get_async_future("count"),
+            lambda: User.where("name", "Joe").first(),
+        )
+
+        self.assertIsInstance(users, Collection)
+        self.assertIsInstance(users.first(), User)
+        self.assertEqual(count, User.all().count())
+        self.assertEqual(first.name, "Joe")
+
+    def test_builder_future_resolves_to_the_method_result(self):
+        future = User.where("id", 1).get_async_future("first")
+
+        self.assertIsInstance(future, Future)
+        self.assertEqual(future.result().id, 1)
+
+    def test_queries_run_at_the_same_time(self):
+        barrier = threading.Barrier(3, timeout=5)
+
+        def query():
+            # Only returns once all three queries are running
+            barrier.wait()
+            return threading.current_thread().name
+
+        start = time.monotonic()
+        names = self.resolver.gather(query, query, query)
+
+        self.assertEqual(len(set(names)), 3)
+        self.assertLess(time.monotonic() - start, 5)
+
+    def test_raises_the_first_error(self):
+        def fail():
+            raise ValueError("failed")
+
+        with self.assertRaises(ValueError):
+            self.resolver.gather(lambda: 1, fail)
+
+    def test_rejects_queries_on_asyncio_connections(self):
+        builder = AsyncUser.where("id", 1)
+        self.assertIsInstance(builder, AsyncQueryBuilder)
+
+        with self.assertRaises(TypeError):
+            self.resolver.gather(User.where("id", 1), builder)
+
+        coroutine = builder.first()
+        try:
+            with self.assertRaises(TypeError):
+                self.resolver.gather(coroutine)
+        finally:
+            coroutine.close()
+
+    def test_rejects_queries_inside_a_transaction(self):
+        with self.resolver.transaction("dev"):
+            with self.assertRaises(QueryException):
+                self.resolver.gather(User.where("id", 1))
+
+            with self.assertRaises(QueryException):
+                User.where("id", 1).get_async_future()
+
+        self.assertEqual(self.resolver.gather(lambda: 1), [1])
+
+    def test_pool_is_bounded(self):
+        self.resolver.set_max_workers(2)
+        try:
+            self.assertEqual(ConnectionResolver.get_executor()._max_workers, 2)
+        finally:
+            self.resolver.set_max_workers(8)
@@ -0,0 +1,73 @@
+import unittest
+from unittest import mock
+
+from src.masoniteorm.connections import (
+    MSSQLConnection,
+    MySQLConnection,
+    PostgresConnection,
+)
+
+
+class TestSavepoints(unittest.TestCase):
+    def run_nested(self, connection_class):
+        raw = mock.MagicMock(closed=0, autocommit=True)
+        connection = connection_class()
+        connection._connection = raw
+        connection.open = 1
+
+        connection.begin()
+        connection.begin()
+        connection.rollback()
+        connection.begin()
+        connection.commit()
+        connection.commit()
+
+        statements = [
+            call.args[0] for call in raw.cursor.return_value.execute.call_args_list
+        ]
+        return raw, statements
+
+    def test_mysql(self):
+        raw, statements = self.run_nested(MySQLConnection)
+
+        self.assertEqual(
+            statements,
+            [
+                "SAVEPOINT masoniteorm_savepoint_2",
+                "ROLLBACK TO SAVEPOINT masoniteorm_savepoint_2",
+                "SAVEPOINT masoniteorm_savepoint_2",
+                "RELEASE SAVEPOINT masoniteorm_savepoint_2",
+            ],
+        )
+        raw.begin.assert_called_once()
+        raw.rollback.assert_not_called()
+        raw.commit.assert_called_once()
+
+    def test_postgres(self):
+        raw, statements = self.run_nested(PostgresConnection)
+
+        self.assertEqual(
+            statements,
+            [
+                "SAVEPOINT masoniteorm_savepoint_2",
+                "ROLLBACK TO SAVEPOINT masoniteorm_savepoint_2",
+                "SAVEPOINT masoniteorm_savepoint_2",
+                "RELEASE SAVEPOINT masoniteorm_savepoint_2",
+            ],
+        )
+        raw.rollback.assert_not_called()
+        raw.commit.assert_called_once()
+
+    def test_mssql(self):
+        raw, statements = self.run_nested(MSSQLConnection)
+
+        self.assertEqual(
+            statements,
+            [
+                "SAVE TRANSACTION masoniteorm_savepoint_2",
+                "ROLLBACK TRANSACTION masoniteorm_savepoint_2",
+                "SAVE TRANSACTION masoniteorm_savepoint_2",
+            ],
+        )
+        raw.rollback.assert_not_called()
+        raw.commit.assert_called_once()
@@ -0,0 +1,52 @@
+import unittest
+from unittest import mock
+
+from src.masoniteorm.connections import MySQLConnection, PostgresConnection
+
+
+class TestStreamingCursors(unittest.TestCase):
+    def make_raw_connection(self, rows):
+        raw = mock.MagicMock(closed=0, autocommit=True)
+        cursor = raw.cursor.return_value
+        cursor.fetchmany.side_effect = [
+            rows[i : i + 2] for i in range(0, len(rows), 2)
+        ] + [[]]
+        return raw, cursor
+
+    def test_mysql_streams_with_an_unbuffered_cursor(self):
+        import pymysql
+
+        raw, cursor = self.make_raw_connection([{"id": 1}, {"id": 2}, {"id": 3}])
+        with mock.patch.object(MySQLConnection, "create_connection", return_value=raw):
+            chunks = list(
+                MySQLConnection().select_many(
+                    "SELECT * FROM `users` WHERE `id` > '?'", (0,), 2
+                )
+            )
+
+        raw.cursor.assert_called_once_with(pymysql.cursors.SSDictCursor)
+        cursor.execute.assert_called_once_with(
+            "SELECT * FROM `users` WHERE `id` > %s", (0,)
+        )
+        self.assertEqual(chunks, [[{"id": 1}, {"id": 2}], [{"id": 3}]])
+        cursor.close.assert_called_once()
+        raw.close.assert_called_once()
+
+    def test_postgres_streams_with_a_named_cursor(self):
+        raw, cursor = self.make_raw_connection([{"id": 1}, {"id": 2}])
+        with mock.patch.object(
+            PostgresConnection, "create_connection", return_value=raw
+        ):
+            chunks = list(
+                PostgresConnection().select_many(
+                    'SELECT * FROM "users" WHERE "id" > \'?\'', (0,), 2
+                )
+            )
+
+        self.assertTrue(raw.cursor.call_args[1]["name"])
+        self.assertFalse(raw.autocommit)
+        cursor.execute.assert_called_once_with(
+            'SELECT * FROM "users" WHERE "id" > %s', (0,)
+        )
+        self.assertEqual(chunks, [[{"id": 1}, {"id": 2}]])
+        raw.close.assert_called_once()
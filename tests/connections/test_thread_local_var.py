@@ -0,0 +1,22 @@
+import threading
+import unittest
+
+from src.masoniteorm.connections.ThreadLocalVar import ThreadLocalVar
+
+
+class TestThreadLocalVar(unittest.TestCase):
+    def test_values_are_kept_per_thread(self):
+        variable = ThreadLocalVar("test", default={})
+        variable.set({"default": 1})
+        seen = []
+
+        def read():
+            seen.append(variable.get())
+            variable.set({"other": 2})
+
+        thread = threading.Thread(target=read)
+        thread.start()
+        thread.join()
+
+        self.assertEqual(seen, [{}])
+        self.assertEqual(variable.get(), {"default": 1})
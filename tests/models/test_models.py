@@ -1,5 +1,8 @@
 import unittest
-from src.masoniteorm.models import Model
+from unittest import mock
+from src.masoniteorm.models import Model, ModelMetadata
+from src.masoniteorm.scopes import SoftDeletesMixin
+import inspect
 import pendulum
 
 
@@ -8,6 +11,29 @@ class ModelTest(Model):
     __casts__ = {"is_vip": "bool", "payload": "json", "x": "int", "f": "float"}
 
 
+class UpperCast:
+    def get(self, value):
+        return str(value).upper()
+
+    def set(self, value):
+        return str(value).lower()
+
+
+class CustomCastModelTest(Model):
+    __cast_map__ = {"upper": UpperCast}
+    __casts__ = {"name": "upper", "age": int}
+
+    def get_greeting_attribute(self):
+        return f"Hello {self.name}"
+
+    def set_email_attribute(self, value):
+        return value.strip()
+
+
+class SoftDeletedModelTest(SoftDeletesMixin, Model):
+    __table__ = "users"
+
+
 class TestModels(unittest.TestCase):
     def test_model_can_access_str_dates_as_pendulum(self):
         model = ModelTest.hydrate({"user": "joe", "due_date": "2020-11-28 11:42:07"})
@@ -87,3 +113,131 @@ class TestModels(unittest.TestCase):
 
         self.assertTrue(sql, """SELECT * FROM `model_tests` WHERE `model_tests`.`name` = 'joe' OR (`model_tests`.`username` = 'Joseph' OR `model_tests`.`age` >= '18'))""")
         
+
+    def test_hydrated_models_create_the_builder_when_used(self):
+        model = ModelTest.hydrate({"id": 1, "username": "joe"})
+
+        self.assertNotIn("builder", model.__dict__)
+        self.assertEqual(model.__dirty_attributes__, {})
+
+        builder = model.get_builder()
+        self.assertIs(model.builder, builder)
+        self.assertIs(builder._model, model)
+        self.assertIn("_timestamps", builder._global_scopes.get("insert", {}))
+
+    def test_booting_does_not_grow_the_passthrough(self):
+        ModelTest().get_builder()
+        passthrough = list(ModelTest.__passthrough__)
+
+        for _ in range(3):
+            ModelTest().get_builder()
+
+        self.assertEqual(ModelTest.__passthrough__, passthrough)
+        self.assertIsInstance(ModelTest.get_passthrough(), frozenset)
+
+    def test_boot_methods_are_resolved_once_per_class(self):
+        SoftDeletedModelTest().get_builder()
+
+        with mock.patch.object(inspect, "getmro") as getmro:
+            builder = SoftDeletedModelTest().get_builder()
+
+        getmro.assert_not_called()
+        self.assertIn("_where_null", builder._global_scopes["select"])
+
+    def test_scope_macros_are_passed_through_before_booting(self):
+        class Trashable(SoftDeletesMixin, Model):
+            __table__ = "users"
+
+        self.assertEqual(
+            Trashable.with_trashed().to_sql(), "SELECT * FROM `users`"
+        )
+        self.assertIn("with_trashed", Trashable.get_passthrough())
+
+    def test_metadata_is_built_once_per_class(self):
+        metadata = CustomCastModelTest().get_metadata()
+
+        self.assertIsInstance(metadata, ModelMetadata)
+        self.assertIs(CustomCastModelTest().get_metadata(), metadata)
+        self.assertEqual(metadata.dates, frozenset(["created_at", "updated_at"]))
+        self.assertIn("greeting", metadata.accessors)
+        self.assertEqual(metadata.mutators, {"email": "set_email_attribute"})
+
+    def test_metadata_casts_attributes(self):
+        model = CustomCastModelTest.hydrate({"name": "joe", "age": "32"})
+
+        self.assertEqual(model.name, "JOE")
+        self.assertEqual(model.age, 32)
+        self.assertEqual(model.greeting, "Hello JOE")
+
+        model.name = "BOB"
+        model.email = " bob@example.com "
+        self.assertEqual(model.__dirty_attributes__["name"], "bob")
+        self.assertEqual(model.__dirty_attributes__["email"], "bob@example.com")
+
+    def test_custom_cast_maps_do_not_leak_to_other_models(self):
+        CustomCastModelTest().get_cast_map()
+
+        self.assertNotIn("upper", ModelTest().get_cast_map())
+        self.assertNotIn("upper", Model.__internal_cast_map__)
+
+    def test_dates_are_parsed_when_read(self):
+        with mock.patch.object(ModelTest, "get_new_date") as get_new_date:
+            model = ModelTest.hydrate({"due_date": "2020-11-28 11:42:07"})
+
+        get_new_date.assert_not_called()
+        self.assertEqual(model.__attributes__["due_date"], "2020-11-28 11:42:07")
+        self.assertIsInstance(model.due_date, pendulum.DateTime)
+        self.assertIs(model.due_date, model.due_date)
+
+    def test_casts_are_decoded_once_until_assigned(self):
+        model = ModelTest.hydrate({"f": "1.5"})
+
+        self.assertIs(model.f, model.f)
+
+        model.f = 2.5
+        self.assertEqual(model.f, 2.5)
+
+        model.fill({"f": "3.5"})
+        self.assertEqual(model.get_value("f"), 3.5)
+
+    def test_mutable_casts_are_decoded_on_every_read(self):
+        model = ModelTest.hydrate({"payload": '{"key": "value"}'})
+
+        model.payload["key"] = "changed"
+
+        self.assertEqual(model.payload, {"key": "value"})
+        self.assertEqual(model.payload, model.serialize()["payload"])
+
+    def test_cursor_column_is_not_passed_through(self):
+        model = ModelTest.hydrate({"cursor": "eyJpZCI6IDF9"})
+
+        self.assertEqual(model.cursor, "eyJpZCI6IDF9")
+
+    def test_exists_column_is_not_passed_through(self):
+        model = ModelTest.hydrate({"exists": 1, "doesnt_exist": 0})
+
+        self.assertEqual(model.exists, 1)
+        self.assertEqual(model.doesnt_exist, 0)
+
+    def test_values_column_is_not_passed_through(self):
+        model = ModelTest.hydrate({"values": "1,2,3"})
+
+        self.assertEqual(model.values, "1,2,3")
+
+    def test_original_dates_are_parsed_when_read(self):
+        model = ModelTest.hydrate({"due_date": "2020-11-28 11:42:07"})
+        model.due_date = "2021-01-01 00:00:00"
+
+        self.assertIsInstance(model.get_original("due_date"), pendulum.DateTime)
+        self.assertEqual(model.get_original("due_date").year, 2020)
+        self.assertIsInstance(model.get_value("due_date"), pendulum.DateTime)
+        self.assertIsNone(
+            ModelTest.hydrate({"due_date": None}).get_original("due_date")
+        )
+
+    def test_raw_dates_are_parsed_when_read(self):
+        model = ModelTest.hydrate({"due_date": "2020-11-28 11:42:07", "name": "Joe"})
+
+        self.assertIsInstance(model.get_raw_attribute("due_date"), pendulum.DateTime)
+        self.assertEqual(model.get_raw_attribute("due_date").year, 2020)
+        self.assertEqual(model.get_raw_attribute("name"), "Joe")
@@ -1,7 +1,8 @@
 import inspect
 import unittest
+from unittest import mock
 
-from src.masoniteorm.connections import ConnectionFactory
+from src.masoniteorm.connections import ConnectionFactory, MSSQLConnection
 from src.masoniteorm.models import Model
 from src.masoniteorm.query import QueryBuilder
 from src.masoniteorm.query.grammars import PostgresGrammar
@@ -411,3 +412,49 @@ class TestMSSQLQueryBuilder(unittest.TestCase):
         builder = self.get_builder(dry=True)
         sql = builder.truncate(foreign_keys=True)
         self.assertEqual(sql, "TRUNCATE TABLE [users]")
+
+    def test_exists(self):
+        sql = (
+            self.get_builder().where("age", ">", 18).order_by("name").exists(query=True)
+        )
+        self.assertEqual(
+            sql,
+            "SELECT CASE WHEN EXISTS(SELECT 1 FROM [users] WHERE [users].[age] > '18') THEN 1 ELSE 0 END AS m_exists_reserved",
+        )
+
+
+class ShowplanConnection(MSSQLConnection):
+    statements = []
+
+    def make_connection(self):
+        self._connection = mock.MagicMock()
+        return self
+
+    def query(self, query, bindings=(), results="*"):
+        self.statements.append((query, self.get_transaction_level()))
+        if query.startswith("SELECT"):
+            return [
+                {
+                    "Microsoft SQL Server 2005 XML Showplan": '<ShowPlanXML><StmtSimple StatementEstRows="12.6" /></ShowPlanXML>'
+                }
+            ]
+
+
+class TestMSSQLEstimatedCount(unittest.TestCase):
+    def test_filtered_estimate_reads_the_showplan(self):
+        ShowplanConnection.statements = []
+        builder = QueryBuilder(
+            connection_class=ShowplanConnection, connection="mssql", table="users"
+        )
+
+        estimate = builder.where("age", ">", 5).count(approximate=True)
+
+        self.assertEqual(estimate, 13)
+        self.assertEqual(
+            ShowplanConnection.statements,
+            [
+                ("SET SHOWPLAN_XML ON", 1),
+                ("SELECT * FROM [users] WHERE [users].[age] > ?", 1),
+                ("SET SHOWPLAN_XML OFF", 1),
+            ],
+        )
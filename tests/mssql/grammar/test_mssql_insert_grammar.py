@@ -30,3 +30,27 @@ class TestMySQLInsertGrammar(unittest.TestCase):
 
         sql = "INSERT INTO [users] ([name]) VALUES ('?'), ('?'), ('?')"
         self.assertEqual(to_sql, sql)
+
+    def test_can_compile_bulk_load(self):
+        self.builder.dry = True
+        to_sql = self.builder.bulk_load(
+            [("Joe", "joe@email.com")], columns=["name", "email"]
+        )
+
+        sql = "INSERT INTO [users] ([name], [email]) VALUES ('?', '?')"
+        self.assertEqual(to_sql, sql)
+
+    def test_can_compile_upsert(self):
+        to_sql = self.builder.upsert(
+            [{"email": "joe@email.com", "name": "Joe"}],
+            unique_by=["email"],
+            query=True,
+        ).to_sql()
+
+        sql = (
+            "MERGE INTO [users] AS [target] USING (VALUES ('joe@email.com', 'Joe')) AS [source] ([email], [name]) "
+            "ON [target].[email] = [source].[email] "
+            "WHEN MATCHED THEN UPDATE SET [target].[name] = [source].[name] "
+            "WHEN NOT MATCHED THEN INSERT ([email], [name]) VALUES ([source].[email], [source].[name]);"
+        )
+        self.assertEqual(to_sql, sql)
@@ -34,3 +34,16 @@ class TestMSSQLUpdateGrammar(unittest.TestCase):
 
         sql = "UPDATE [users] SET [users].[name] = [username]"
         self.assertEqual(to_sql, sql)
+
+    def test_can_compile_bulk_update(self):
+        to_sql = self.builder.bulk_update(
+            [{"id": 1, "name": "Joe", "age": 20}, {"id": 2, "name": "Bob", "age": 30}],
+            query=True,
+        ).to_sql()
+
+        sql = (
+            "MERGE INTO [users] AS [target] USING (VALUES ('1', 'Joe', '20'), ('2', 'Bob', '30')) "
+            "AS [source] ([id], [name], [age]) ON [target].[id] = [source].[id] "
+            "WHEN MATCHED THEN UPDATE SET [target].[name] = [source].[name], [target].[age] = [source].[age];"
+        )
+        self.assertEqual(to_sql, sql)
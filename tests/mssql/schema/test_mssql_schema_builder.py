@@ -236,3 +236,31 @@ class TestMSSQLSchemaBuilder(unittest.TestCase):
                 "ALTER TABLE [users] WITH CHECK CHECK CONSTRAINT ALL",
             ],
         )
+
+    def test_can_compile_estimated_count(self):
+        platform = MSSQLPlatform()
+
+        self.assertEqual(
+            platform.compile_estimated_count("users"),
+            "SELECT SUM(rows) AS estimate FROM sys.partitions "
+            "WHERE object_id = OBJECT_ID('users') AND index_id IN (0, 1)",
+        )
+
+    def test_can_process_showplan_row_estimate(self):
+        platform = MSSQLPlatform()
+
+        self.assertEqual(
+            platform.compile_explain("SELECT * FROM [users]"),
+            ["SET SHOWPLAN_XML ON", "SELECT * FROM [users]", "SET SHOWPLAN_XML OFF"],
+        )
+        self.assertEqual(
+            platform.process_explain(
+                [
+                    {
+                        "Microsoft SQL Server 2005 XML Showplan": '<ShowPlanXML><StmtSimple StatementText="SELECT * FROM [users]" StatementEstRows="41.5" /></ShowPlanXML>'
+                    }
+                ]
+            ),
+            42,
+        )
+        self.assertIsNone(platform.process_explain([]))
@@ -0,0 +1,88 @@
+import unittest
+
+from src.masoniteorm.connections import MySQLConnection, NativeQuery
+from src.masoniteorm.query import QueryBuilder
+from src.masoniteorm.query.grammars import MySQLGrammar
+
+
+class TestMySQLNativePlaceholders(unittest.TestCase):
+    def get_builder(self):
+        return QueryBuilder(
+            grammar=MySQLGrammar, connection_class=MySQLConnection, table="users"
+        )
+
+    def test_can_compile_select(self):
+        builder = self.get_builder().select("username").where("name", "Joe")
+
+        sql = builder.to_native()
+        self.assertIsInstance(sql, NativeQuery)
+        self.assertEqual(
+            sql, "SELECT `users`.`username` FROM `users` WHERE `users`.`name` = %s"
+        )
+        self.assertEqual(builder._bindings, ["Joe"])
+
+    def test_can_compile_where_in(self):
+        builder = self.get_builder().where_in("id", [1, 2, 3])
+
+        self.assertEqual(
+            builder.to_native(),
+            "SELECT * FROM `users` WHERE `users`.`id` IN (%s, %s, %s)",
+        )
+        self.assertEqual(builder._bindings, ["1", "2", "3"])
+
+    def test_can_compile_update(self):
+        builder = (
+            self.get_builder().update({"name": "Bob"}, dry=True).where("name", "Joe")
+        )
+
+        self.assertEqual(
+            builder.to_native(),
+            "UPDATE `users` SET `users`.`name` = %s WHERE `users`.`name` = %s",
+        )
+        self.assertEqual(builder._bindings, ["Bob", "Joe"])
+
+    def test_can_compile_increment(self):
+        builder = self.get_builder().where("id", 1).increment("age", 2)
+
+        self.assertEqual(
+            builder.to_native(),
+            "UPDATE `users` SET `users`.`age` = `users`.`age` + %s WHERE `users`.`id` = %s",
+        )
+
+    def test_can_compile_bulk_create(self):
+        builder = self.get_builder().bulk_create(
+            [{"name": "Joe", "age": 1}, {"name": "Bill", "age": 2}], query=True
+        )
+
+        self.assertEqual(
+            builder.to_native(),
+            "INSERT INTO `users` (`name`, `age`) VALUES (%s, %s), (%s, %s)",
+        )
+        self.assertEqual(builder._bindings, ["Joe", 1, "Bill", 2])
+
+    def test_raw_qmarks_use_the_driver_placeholder(self):
+        builder = self.get_builder().where("id", 1).where_raw("`age` > '?'", [18])
+
+        self.assertEqual(
+            builder.to_native(),
+            "SELECT * FROM `users` WHERE `users`.`id` = %s AND `age` > %s",
+        )
+        self.assertEqual(builder._bindings, [1, 18])
+
+    def test_qmark_is_not_affected(self):
+        self.get_builder().where("name", "Joe").to_native()
+        builder = self.get_builder().where("name", "Joe")
+
+        self.assertEqual(
+            builder.to_qmark(), "SELECT * FROM `users` WHERE `users`.`name` = '?'"
+        )
+
+    def test_connection_sends_native_queries_as_they_are(self):
+        connection = MySQLConnection()
+        native = NativeQuery("SELECT * FROM `users` WHERE `name` = %s")
+
+        self.assertIs(connection.prepare_query(native), native)
+        self.assertEqual(
+            connection.prepare_query("SELECT * FROM `users` WHERE `name` = '?'"),
+            "SELECT * FROM `users` WHERE `name` = %s",
+        )
@@ -255,3 +255,21 @@ class TestMySQLSchemaBuilder(unittest.TestCase):
                 "SET FOREIGN_KEY_CHECKS=1",
             ],
         )
+
+    def test_can_compile_estimated_count(self):
+        platform = MySQLPlatform()
+
+        self.assertEqual(
+            platform.compile_estimated_count("users", database="orm"),
+            "SELECT TABLE_ROWS AS estimate FROM information_schema.TABLES "
+            "WHERE TABLE_SCHEMA = 'orm' AND TABLE_NAME = 'users'",
+        )
+        self.assertEqual(platform.process_estimated_count({"estimate": 300}), 300)
+
+    def test_can_process_explain_row_estimate(self):
+        platform = MySQLPlatform()
+
+        self.assertEqual(
+            platform.process_explain([{"rows": 200, "filtered": 10.0}]), 20
+        )
+        self.assertEqual(platform.process_explain([{"rows": 200}]), 200)
@@ -444,6 +444,24 @@ class BaseTestQueryBuilder:
         )()
         self.assertEqual(sql, sql_ref)
 
+    def test_exists(self):
+        sql = (
+            self.get_builder().where("age", ">", 18).order_by("name").exists(query=True)
+        )
+
+        sql_ref = getattr(
+            self, inspect.currentframe().f_code.co_name.replace("test_", "")
+        )()
+        self.assertEqual(sql, sql_ref)
+
+    def test_exists_with_limit(self):
+        sql = self.get_builder().order_by("name").limit(5).exists(query=True)
+
+        sql_ref = getattr(
+            self, inspect.currentframe().f_code.co_name.replace("test_", "")
+        )()
+        self.assertEqual(sql, sql_ref)
+
 
 class PostgresQueryBuilderTest(BaseTestQueryBuilder, unittest.TestCase):
 
@@ -742,3 +760,15 @@ class PostgresQueryBuilderTest(BaseTestQueryBuilder, unittest.TestCase):
         builder.truncate()
         """
         return """TRUNCATE TABLE "users\""""
+
+    def exists(self):
+        """
+        self.get_builder().where("age", ">", 18).order_by("name").exists(query=True)
+        """
+        return """SELECT EXISTS(SELECT 1 FROM "users" WHERE "users"."age" > '18') AS m_exists_reserved"""
+
+    def exists_with_limit(self):
+        """
+        self.get_builder().order_by("name").limit(5).exists(query=True)
+        """
+        return """SELECT EXISTS(SELECT 1 FROM "users" ORDER BY "name" ASC LIMIT 5) AS m_exists_reserved"""
@@ -1,3 +1,4 @@
+import datetime
 import inspect
 import unittest
 
@@ -71,6 +72,17 @@ class BaseTestCaseUpdateGrammar:
 
         self.assertEqual(to_sql, sql)
 
+    def test_can_compile_bulk_update(self):
+        to_sql = self.builder.bulk_update(
+            [{"id": 1, "name": "Joe", "age": 20}, {"id": 2, "name": "Bob", "age": 30}],
+            query=True,
+        ).to_sql()
+
+        sql = getattr(
+            self, inspect.currentframe().f_code.co_name.replace("test_", "")
+        )()
+        self.assertEqual(to_sql, sql)
+
 
 class TestPostgresUpdateGrammar(BaseTestCaseUpdateGrammar, unittest.TestCase):
 
@@ -117,3 +129,51 @@ class TestPostgresUpdateGrammar(BaseTestCaseUpdateGrammar, unittest.TestCase):
         builder.decrement('age', 20).to_sql()
         """
         return """UPDATE "users" SET "age" = "age" - '20'"""
+
+    def can_compile_bulk_update(self):
+        """
+        builder.bulk_update([
+            {'id': 1, 'name': 'Joe', 'age': 20},
+            {'id': 2, 'name': 'Bob', 'age': 30},
+        ]).to_sql()
+        """
+        return """UPDATE "users" SET "name" = "m_bulk_update"."name", "age" = "m_bulk_update"."age" FROM (VALUES ((NULL::"users")."id", (NULL::"users")."name", (NULL::"users")."age"), ('1', 'Joe', '20'), ('2', 'Bob', '30')) AS "m_bulk_update" ("id", "name", "age") WHERE "users"."id" = "m_bulk_update"."id\""""
+
+    def test_bulk_update_values_take_the_column_types(self):
+        builder = self.builder.bulk_update(
+            [
+                {
+                    "id": 1,
+                    "verified_at": datetime.datetime(2020, 1, 2, 3, 4, 5),
+                    "settings": '{"theme": "dark"}',
+                    "token": None,
+                },
+                {
+                    "id": 2,
+                    "verified_at": None,
+                    "settings": None,
+                    "token": None,
+                },
+            ],
+            query=True,
+        )
+
+        self.assertEqual(
+            builder.to_qmark(),
+            """UPDATE "users" SET "verified_at" = "m_bulk_update"."verified_at", "settings" = "m_bulk_update"."settings", "token" = "m_bulk_update"."token" """
+            """FROM (VALUES ((NULL::"users")."id", (NULL::"users")."verified_at", (NULL::"users")."settings", (NULL::"users")."token"), ('?', '?', '?', '?'), ('?', '?', '?', '?')) """
+            """AS "m_bulk_update" ("id", "verified_at", "settings", "token") WHERE "users"."id" = "m_bulk_update"."id\"""",
+        )
+        self.assertEqual(
+            builder._bindings,
+            [
+                1,
+                datetime.datetime(2020, 1, 2, 3, 4, 5),
+                '{"theme": "dark"}',
+                None,
+                2,
+                None,
+                None,
+                None,
+            ],
+        )
@@ -252,3 +252,30 @@ class TestPostgresSchemaBuilder(unittest.TestCase):
                 'ALTER TABLE "users" ENABLE TRIGGER ALL',
             ],
         )
+
+    def test_can_compile_estimated_count(self):
+        platform = PostgresPlatform()
+
+        self.assertEqual(
+            platform.compile_estimated_count("users"),
+            "SELECT reltuples::bigint AS estimate FROM pg_class WHERE oid = to_regclass('users')",
+        )
+        self.assertEqual(platform.process_estimated_count([{"estimate": 1200}]), 1200)
+        # Tables that were never analyzed report -1 rows
+        self.assertIsNone(platform.process_estimated_count([{"estimate": -1}]))
+        # Postgres 13 and older report 0 rows before the first ANALYZE
+        self.assertIsNone(platform.process_estimated_count([{"estimate": 0}]))
+
+    def test_can_process_explain_row_estimate(self):
+        platform = PostgresPlatform()
+
+        self.assertEqual(
+            platform.compile_explain('SELECT * FROM "users"'),
+            'EXPLAIN (FORMAT JSON) SELECT * FROM "users"',
+        )
+        self.assertEqual(
+            platform.process_explain(
+                [{"QUERY PLAN": [{"Plan": {"Node Type": "Seq Scan", "Plan Rows": 42}}]}]
+            ),
+            42,
+        )
@@ -0,0 +1,250 @@
+import asyncio
+import unittest
+
+from config.database import DATABASES
+from src.masoniteorm.collection import Collection
+from src.masoniteorm.connections import AsyncConnectionPool, ConnectionResolver
+from src.masoniteorm.models import Model
+from src.masoniteorm.query import AsyncQueryBuilder
+from tests.utils import SQLiteTestCase
+
+
+class User(Model):
+    __connection__ = "async_dev"
+    __table__ = "users"
+    __timestamps__ = False
+
+
+class SyncUser(Model):
+    __connection__ = "dev"
+    __table__ = "users"
+
+
+class TestSQLiteAsyncQueryBuilder(unittest.TestCase):
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+
+    def tearDown(self):
+        self.loop.close()
+
+    def run_async(self, coroutine):
+        return self.loop.run_until_complete(coroutine)
+
+    def get_builder(self, table="users"):
+        return AsyncQueryBuilder(
+            connection="async_dev", table=table, connection_details=DATABASES
+        )
+
+    def test_models_on_async_connections_use_async_builder(self):
+        self.assertIsInstance(User.where("id", 1), AsyncQueryBuilder)
+        self.assertNotIsInstance(SyncUser.where("id", 1), AsyncQueryBuilder)
+
+    def test_compiles_with_the_sync_grammar(self):
+        self.assertEqual(
+            User.where("name", "Joe").to_sql(),
+            SyncUser.where("name", "Joe").to_sql(),
+        )
+
+    def test_get(self):
+        users = self.run_async(User.where("id", ">", 0).limit(3).get())
+
+        self.assertIsInstance(users, Collection)
+        self.assertEqual(users.count(), 3)
+        for user in users:
+            self.assertIsInstance(user, User)
+
+    def test_first_and_find(self):
+        user = self.run_async(User.where("name", "Joe").first())
+        self.assertEqual(user.name, "Joe")
+
+        found = self.run_async(User.find(user.id))
+        self.assertEqual(found.id, user.id)
+
+    def test_count(self):
+        self.assertEqual(
+            self.run_async(self.get_builder().count()),
+            SyncUser.all().count(),
+        )
+
+    def test_cursor(self):
+        async def collect():
+            return [user async for user in User.order_by("id").cursor(2)]
+
+        users = self.run_async(collect())
+
+        self.assertEqual(len(users), SyncUser.all().count())
+        self.assertIsInstance(users[0], User)
+
+    def test_paginate(self):
+        paginator = self.run_async(User.paginate(2, 1))
+
+        self.assertEqual(paginator.count, 2)
+        self.assertTrue(paginator.total)
+
+    def test_paginate_with_window_count(self):
+        paginator = self.run_async(User.paginate(2, 1, window_count=True))
+        total = self.run_async(self.get_builder().count())
+
+        self.assertEqual(paginator.count, 2)
+        self.assertEqual(paginator.total, total)
+
+    def test_estimated_count_without_statistics(self):
+        estimate = self.run_async(self.get_builder().count(approximate=True))
+        total = self.run_async(self.get_builder().count())
+
+        self.assertEqual(estimate, total)
+
+    def test_raw_rows(self):
+        dicts = self.run_async(self.get_builder().order_by("id").get_dicts(["id"]))
+        tuples = self.run_async(self.get_builder().order_by("id").get_tuples(["id"]))
+        ids = self.run_async(self.get_builder().order_by("id").values("id"))
+
+        self.assertEqual([row["id"] for row in dicts], ids)
+        self.assertEqual([row[0] for row in tuples], ids)
+
+    def test_create_in_transaction(self):
+        async def create_and_rollback():
+            builder = self.get_builder()
+            await builder.begin()
+            await builder.create({"name": "async_user", "email": "async@email.com"})
+            created = await builder.where("name", "async_user").first()
+            await builder.rollback()
+            return created, await self.get_builder().where("name", "async_user").first()
+
+        created, after_rollback = self.run_async(create_and_rollback())
+
+        self.assertEqual(created["email"], "async@email.com")
+        self.assertIsNone(after_rollback)
+
+    def test_update_or_create(self):
+        async def update_or_create():
+            wheres = {"name": "async_update_or_create"}
+            try:
+                await User.update_or_create(wheres, {"email": "created@email.com"})
+                created = await User.where(wheres).first()
+                await User.update_or_create(wheres, {"email": "updated@email.com"})
+                updated = await User.where(wheres).get()
+            finally:
+                await User.where(wheres).delete()
+
+            return created, updated
+
+        created, updated = self.run_async(update_or_create())
+
+        self.assertEqual(created.email, "created@email.com")
+        self.assertEqual(updated.count(), 1)
+        self.assertEqual(updated.first().email, "updated@email.com")
+
+    def test_global_transactions_reject_async_connections(self):
+        resolver = ConnectionResolver().set_connection_details(DATABASES)
+
+        with self.assertRaises(TypeError):
+            resolver.begin_transaction("async_dev")
+
+        with self.assertRaises(TypeError):
+            with resolver.transaction("async_dev"):
+                pass
+
+        self.assertNotIn("async_dev", resolver.get_global_connections())
+
+    def test_bulk_load_is_not_supported(self):
+        with self.assertRaises(NotImplementedError):
+            self.get_builder().bulk_load([{"name": "Joe"}])
+
+    def test_pooled_connections(self):
+        details = dict(DATABASES)
+        details["async_pool"] = dict(DATABASES["async_dev"], pool={"max": 1})
+
+        async def run_queries():
+            builders = [
+                AsyncQueryBuilder(
+                    connection="async_pool", table="users", connection_details=details
+                )
+                for _ in range(3)
+            ]
+            counts = await asyncio.gather(*[builder.count() for builder in builders])
+            stats = AsyncConnectionPool.get_pool("async_pool").stats()
+            await AsyncConnectionPool.close_all()
+            return counts, stats
+
+        counts, stats = self.run_async(run_queries())
+
+        self.assertEqual(len(set(counts)), 1)
+        self.assertEqual(stats["size"], 1)
+        self.assertEqual(stats["checkouts"], 3)
+
+
+class TestSQLiteAsyncBulkWrites(SQLiteTestCase):
+    driver = "aiosqlite"
+    schema = (
+        "CREATE TABLE items (id INTEGER PRIMARY KEY AUTOINCREMENT, name TEXT UNIQUE, price INTEGER)",
+        "INSERT INTO items (name, price) VALUES ('pen', 2), ('book', 10)",
+    )
+
+    def setUp(self):
+        super().setUp()
+        self.loop = asyncio.new_event_loop()
+
+    def tearDown(self):
+        self.loop.close()
+        super().tearDown()
+
+    def run_async(self, coroutine):
+        return self.loop.run_until_complete(coroutine)
+
+    def get_builder(self):
+        return AsyncQueryBuilder(
+            connection=self.connection, table="items", connection_details=self.details
+        )
+
+    def fetch(self):
+        return super().fetch("SELECT name, price FROM items ORDER BY id")
+
+    def test_bulk_create_in_batches(self):
+        rows = self.run_async(
+            self.get_builder().bulk_create(
+                [{"name": f"item-{i}", "price": i} for i in range(5)], batch_size=2
+            )
+        )
+
+        self.assertEqual([row["id"] for row in rows], [3, 4, 5, 6, 7])
+        self.assertEqual(len(self.fetch()), 7)
+
+    def test_bulk_create_rolls_back_every_batch_on_failure(self):
+        rows = [{"name": "lamp", "price": 25}, {"name": "pen", "price": 3}]
+
+        with self.assertRaises(Exception):
+            self.run_async(self.get_builder().bulk_create(rows, batch_size=1))
+
+        self.assertEqual(self.fetch(), [("pen", 2), ("book", 10)])
+
+    def test_upsert(self):
+        count = self.run_async(
+            self.get_builder().upsert(
+                [{"name": "pen", "price": 3}, {"name": "lamp", "price": 25}],
+                unique_by="name",
+            )
+        )
+
+        self.assertEqual(count, 2)
+        self.assertEqual(self.fetch(), [("pen", 3), ("book", 10), ("lamp", 25)])
+
+    def test_upsert_rolls_back_every_batch_on_failure(self):
+        rows = [{"name": "pen", "price": 3}, {"name": "lamp", "missing": 25}]
+
+        with self.assertRaises(Exception):
+            self.run_async(
+                self.get_builder().upsert(rows, unique_by="name", batch_size=1)
+            )
+
+        self.assertEqual(self.fetch(), [("pen", 2), ("book", 10)])
+
+    def test_bulk_update(self):
+        count = self.run_async(
+            self.get_builder().bulk_update(
+                [{"id": 1, "price": 3}, {"id": 2, "price": 12}], batch_size=1
+            )
+        )
+
+        self.assertEqual(count, 2)
+        self.assertEqual(self.fetch(), [("pen", 3), ("book", 12)])
@@ -0,0 +1,153 @@
+import unittest
+from unittest import mock
+
+from src.masoniteorm.connections import (
+    MSSQLConnection,
+    MySQLConnection,
+    SQLiteConnection,
+)
+from src.masoniteorm.exceptions import QueryException
+from src.masoniteorm.query.processors import (
+    MySQLPostProcessor,
+    PostgresPostProcessor,
+)
+from tests.utils import SQLiteTestCase
+
+
+class TestSQLiteBuilderBulkCreate(SQLiteTestCase):
+    schema = (
+        "CREATE TABLE items (id INTEGER PRIMARY KEY AUTOINCREMENT, name TEXT NOT NULL, price REAL)",
+    )
+
+    def fetch(self):
+        return super().fetch("SELECT id, name FROM items ORDER BY id")
+
+    def test_returns_primary_keys_for_every_batch(self):
+        rows = [{"name": f"item-{i}", "price": i} for i in range(10)]
+
+        created = self.get_builder().bulk_create(rows, batch_size=3)
+
+        self.assertEqual([row["id"] for row in created], list(range(1, 11)))
+        self.assertEqual(self.fetch(), [(row["id"], row["name"]) for row in created])
+
+    def test_primary_keys_not_aliasing_the_rowid_are_not_set(self):
+        self.execute(
+            "CREATE TABLE counters (id BIGINT PRIMARY KEY, name TEXT)",
+            "CREATE TABLE tags (name TEXT PRIMARY KEY) WITHOUT ROWID",
+        )
+        # Moves lastrowid so a stale value would be used for the WITHOUT ROWID table
+        self.get_builder().bulk_create([{"name": "hammer"}])
+
+        counters = self.get_builder("counters").bulk_create([{"name": "a"}])
+        tags = self.get_builder("tags").bulk_create([{"name": "a"}], batch_size=1)
+
+        self.assertEqual(counters, [{"name": "a"}])
+        self.assertEqual(tags, [{"name": "a"}])
+
+    def test_does_not_modify_given_rows(self):
+        rows = [{"name": "hammer", "price": 1}]
+
+        self.get_builder().bulk_create(rows)
+
+        self.assertEqual(rows, [{"name": "hammer", "price": 1}])
+
+    def test_batches_run_in_one_transaction(self):
+        rows = [{"name": f"item-{i}", "price": i} for i in range(5)]
+        # The last batch violates the NOT NULL constraint
+        rows.append({"name": None, "price": 0})
+
+        with self.assertRaises(QueryException):
+            self.get_builder().bulk_create(rows, batch_size=2)
+
+        self.assertEqual(self.fetch(), [])
+
+    def test_splits_by_the_parameter_limit(self):
+        builder = self.get_builder()
+        rows = [{"name": "a", "price": 1}] * 1000
+
+        with mock.patch.object(
+            builder.connection_class, "get_max_parameters", return_value=999
+        ):
+            batches = builder.get_batches(rows, 2)
+
+        self.assertEqual([len(batch) for batch in batches], [499, 499, 2])
+
+    def test_batch_size_cannot_exceed_the_parameter_limit(self):
+        builder = self.get_builder()
+        rows = [{"name": "a", "price": 1}] * 1000
+
+        with mock.patch.object(
+            builder.connection_class, "get_max_parameters", return_value=999
+        ):
+            self.assertEqual(len(builder.get_batches(rows, 2, batch_size=100)), 10)
+            self.assertEqual(len(builder.get_batches(rows, 2, batch_size=900)), 3)
+
+    def test_splits_by_the_statement_size(self):
+        builder = self.get_builder()
+        rows = [{"name": "x" * 96}] * 10
+
+        with mock.patch.object(
+            builder.connection_class, "get_max_statement_size", return_value=250
+        ):
+            batches = builder.get_batches(rows, 1)
+
+        self.assertEqual([len(batch) for batch in batches], [2, 2, 2, 2, 2])
+
+    def test_connection_limits(self):
+        self.assertIn(SQLiteConnection.get_max_parameters(), (999, 32766))
+        self.assertEqual(MSSQLConnection.get_max_parameters(), 2000)
+        self.assertTrue(MySQLConnection.get_max_statement_size())
+
+    def test_dry_returns_rows_without_ids(self):
+        rows = [{"name": "hammer", "price": 1}]
+
+        builder = self.get_builder(dry=True)
+
+        self.assertEqual(builder.bulk_create(rows), rows)
+        self.assertEqual(self.fetch(), [])
+
+
+class TestBulkInsertGetIds(unittest.TestCase):
+    def mysql_builder(self, lastrowid, rowcount, increment=1):
+        builder = mock.Mock()
+        builder._connection.get_cursor.return_value = mock.Mock(
+            lastrowid=lastrowid, rowcount=rowcount
+        )
+        builder._connection.query.return_value = {"m_increment": increment}
+        return builder
+
+    def test_mysql_counts_up_from_the_first_id(self):
+        rows = [{"name": "a"}, {"name": "b"}, {"name": "c"}]
+
+        MySQLPostProcessor().process_bulk_insert_get_ids(
+            self.mysql_builder(41, 3), rows, (), "id"
+        )
+
+        self.assertEqual([row["id"] for row in rows], [41, 42, 43])
+
+    def test_mysql_counts_up_by_the_auto_increment_increment(self):
+        rows = [{"name": "a"}, {"name": "b"}, {"name": "c"}]
+
+        MySQLPostProcessor().process_bulk_insert_get_ids(
+            self.mysql_builder(41, 3, increment=2), rows, (), "id"
+        )
+
+        self.assertEqual([row["id"] for row in rows], [41, 43, 45])
+
+    def test_mysql_skips_ids_when_rows_were_not_inserted(self):
+        rows = [{"name": "a"}, {"name": "b"}, {"name": "c"}]
+
+        MySQLPostProcessor().process_bulk_insert_get_ids(
+            self.mysql_builder(41, 2), rows, (), "id"
+        )
+
+        self.assertEqual(rows, [{"name": "a"}, {"name": "b"}, {"name": "c"}])
+
+    def test_postgres_uses_the_returned_records(self):
+        rows = [{"name": "a"}, {"name": "b"}]
+
+        PostgresPostProcessor().process_bulk_insert_get_ids(
+            None, rows, [{"id": 7, "name": "a"}, {"id": 8, "name": "b"}], "id"
+        )
+
+        self.assertEqual([row["id"] for row in rows], [7, 8])
@@ -0,0 +1,80 @@
+from src.masoniteorm.exceptions import QueryException
+from src.masoniteorm.models import Model
+from tests.utils import SQLiteTestCase
+
+
+class Item(Model):
+    __table__ = "items"
+
+
+class TestSQLiteBuilderBulkUpdate(SQLiteTestCase):
+    schema = (
+        "CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT NOT NULL, price REAL)",
+    )
+
+    def setUp(self):
+        super().setUp()
+        self.insert(
+            "INSERT INTO items (id, name, price) VALUES (?, ?, ?)",
+            [(i, f"item-{i}", i) for i in range(1, 11)],
+        )
+
+    def fetch(self):
+        return super().fetch("SELECT id, name, price FROM items ORDER BY id")
+
+    def test_updates_each_row_with_its_own_values(self):
+        count = self.get_builder().bulk_update(
+            [
+                {"id": 2, "name": "Hammer", "price": 20},
+                {"id": 5, "name": "Saw", "price": 50},
+            ]
+        )
+
+        rows = self.fetch()
+        self.assertEqual(count, 2)
+        self.assertEqual(rows[1], (2, "Hammer", 20))
+        self.assertEqual(rows[4], (5, "Saw", 50))
+        self.assertEqual(rows[0], (1, "item-1", 1))
+
+    def test_only_updates_given_columns(self):
+        self.get_builder().bulk_update(
+            [{"id": 1, "name": "Hammer", "price": 20}], columns=["price"]
+        )
+
+        self.assertEqual(self.fetch()[0], (1, "item-1", 20))
+
+    def test_updates_in_batches(self):
+        self.get_builder().bulk_update(
+            [{"id": i, "price": i * 100} for i in range(1, 11)], batch_size=3
+        )
+
+        self.assertEqual(
+            [row[2] for row in self.fetch()], [i * 100 for i in range(1, 11)]
+        )
+
+    def test_batches_run_in_one_transaction(self):
+        records = [{"id": i, "name": f"new-{i}"} for i in range(1, 10)]
+        # The last batch violates the NOT NULL constraint
+        records.append({"id": 10, "name": None})
+
+        with self.assertRaises(QueryException):
+            self.get_builder().bulk_update(records, batch_size=3)
+
+        self.assertEqual(self.fetch()[0], (1, "item-1", 1))
+
+    def test_updates_dirty_attributes_of_models(self):
+        first = Item.hydrate({"id": 3, "name": "item-3", "price": 3})
+        second = Item.hydrate({"id": 4, "name": "item-4", "price": 4})
+        first.price = 30
+        second.name = "Chisel"
+
+        self.get_builder().bulk_update([first, second])
+
+        rows = self.fetch()
+        self.assertEqual(rows[2], (3, "item-3", 30))
+        self.assertEqual(rows[3], (4, "Chisel", 4))
+        self.assertEqual(second.get_original("name"), "Chisel")
+
+    def test_requires_the_key(self):
+        with self.assertRaises(ValueError):
+            self.get_builder().bulk_update([{"name": "Hammer"}], columns=["name"])
@@ -0,0 +1,73 @@
+import unittest
+
+from src.masoniteorm.connections import (
+    ConnectionFactory,
+    ConnectionResolver,
+    SQLiteConnection,
+)
+from src.masoniteorm.query import QueryBuilder
+from src.masoniteorm.query.grammars import SQLiteGrammar
+
+
+class TestSQLiteBuilderClone(unittest.TestCase):
+    def get_builder(self):
+        return QueryBuilder(SQLiteGrammar, table="users")
+
+    def test_clone_compiles_the_same_query(self):
+        builder = self.get_builder().select("name").where("age", ">", 18).limit(5)
+
+        self.assertEqual(builder.clone().to_sql(), builder.to_sql())
+
+    def test_clone_shares_expressions_until_changed(self):
+        builder = self.get_builder().where("age", ">", 18)
+        clone = builder.clone()
+
+        self.assertIs(clone._wheres, builder._wheres)
+
+        clone.where("name", "Joe").order_by("name")
+
+        self.assertEqual(len(builder._wheres), 1)
+        self.assertEqual(builder._order_by, ())
+        self.assertEqual(
+            builder.to_sql(), """SELECT * FROM "users" WHERE "users"."age" > '18'"""
+        )
+        self.assertEqual(
+            clone.to_sql(),
+            """SELECT * FROM "users" WHERE "users"."age" > '18' AND "users"."name" = 'Joe' ORDER BY "name" ASC""",
+        )
+
+    def test_clone_does_not_share_mutable_state(self):
+        builder = self.get_builder().with_("articles")
+        clone = builder.clone()
+
+        clone.with_("logo")
+        clone.macro("active", lambda model, builder: builder.where("active", 1))
+        clone.set_global_scope("scope", lambda builder: builder.where("id", 1))
+
+        self.assertEqual(builder._eager_relation.eagers, ["articles"])
+        self.assertEqual(clone._eager_relation.eagers, ["articles", "logo"])
+        self.assertEqual(builder._macros, {})
+        self.assertEqual(builder._global_scopes, {})
+        self.assertIs(clone.builder, clone)
+
+    def test_connection_classes_are_resolved_once(self):
+        factory = ConnectionFactory()
+
+        self.assertIs(factory.make("sqlite"), SQLiteConnection)
+        self.assertIs(
+            factory._resolved[(ConnectionFactory, "sqlite")], SQLiteConnection
+        )
+
+    def test_registering_clears_resolved_connections(self):
+        class CustomSQLiteConnection(SQLiteConnection):
+            pass
+
+        factory = ConnectionFactory()
+        factory.make("sqlite")
+        try:
+            ConnectionFactory.register("sqlite", CustomSQLiteConnection)
+            ConnectionResolver()
+
+            self.assertIs(factory.make("sqlite"), CustomSQLiteConnection)
+        finally:
+            ConnectionFactory.register("sqlite", SQLiteConnection)
@@ -0,0 +1,114 @@
+from src.masoniteorm.exceptions import InvalidCursor
+from src.masoniteorm.pagination import CursorPaginator
+from src.masoniteorm.query import QueryBuilder
+from src.masoniteorm.query.grammars import MSSQLGrammar, SQLiteGrammar
+from tests.utils import SQLiteTestCase
+
+
+class TestSQLiteBuilderCursorPagination(SQLiteTestCase):
+    schema = (
+        "CREATE TABLE items (id INTEGER PRIMARY KEY AUTOINCREMENT, name TEXT, price INTEGER)",
+    )
+
+    def setUp(self):
+        super().setUp()
+        # Prices repeat so the primary key has to break ties
+        self.insert(
+            "INSERT INTO items (name, price) VALUES (?, ?)",
+            [(f"item-{i}", i // 3) for i in range(1, 11)],
+        )
+
+    def ids(self, paginator):
+        return [row["id"] for row in paginator.result]
+
+    def walk(self, query, per_page):
+        pages = []
+        paginator = query(self.get_builder()).cursor_paginate(per_page)
+        pages.append(self.ids(paginator))
+        while paginator.next_cursor:
+            paginator = query(self.get_builder()).cursor_paginate(
+                per_page, paginator.next_cursor
+            )
+            pages.append(self.ids(paginator))
+
+        return pages, paginator
+
+    def test_pages_by_primary_key(self):
+        pages, last = self.walk(lambda builder: builder, 4)
+
+        self.assertEqual(pages, [[1, 2, 3, 4], [5, 6, 7, 8], [9, 10]])
+        self.assertIsNone(last.next_cursor)
+        self.assertTrue(last.previous_cursor)
+
+    def test_first_page_has_no_previous_cursor(self):
+        paginator = self.get_builder().cursor_paginate(4)
+
+        self.assertIsNone(paginator.previous_cursor)
+        self.assertTrue(paginator.has_more_pages())
+        self.assertEqual(paginator.serialize()["meta"]["count"], 4)
+
+    def test_pages_by_order_with_a_tiebreaker(self):
+        pages, last = self.walk(lambda builder: builder.order_by("price", "desc"), 4)
+
+        self.assertEqual(pages, [[10, 9, 8, 7], [6, 5, 4, 3], [2, 1]])
+
+    def test_pages_with_mixed_directions(self):
+        pages, last = self.walk(
+            lambda builder: builder.order_by("price", "desc").order_by("id", "asc"),
+            4,
+        )
+
+        self.assertEqual(pages, [[9, 10, 6, 7], [8, 3, 4, 5], [1, 2]])
+
+    def test_pages_with_wheres(self):
+        pages, last = self.walk(lambda builder: builder.where("price", ">", 1), 2)
+
+        self.assertEqual(pages, [[6, 7], [8, 9], [10]])
+
+    def test_previous_cursor_returns_the_previous_page(self):
+        first = self.get_builder().order_by("price").cursor_paginate(3)
+        second = (
+            self.get_builder().order_by("price").cursor_paginate(3, first.next_cursor)
+        )
+        previous = (
+            self.get_builder()
+            .order_by("price")
+            .cursor_paginate(3, second.previous_cursor)
+        )
+
+        self.assertEqual(self.ids(second), [4, 5, 6])
+        self.assertEqual(self.ids(previous), self.ids(first))
+        self.assertIsNone(previous.previous_cursor)
+        self.assertTrue(previous.next_cursor)
+
+    def test_invalid_cursors_raise(self):
+        with self.assertRaises(InvalidCursor):
+            self.get_builder().cursor_paginate(3, "not a cursor")
+
+        with self.assertRaises(InvalidCursor):
+            self.get_builder().order_by("price").cursor_paginate(
+                3, CursorPaginator.encode_cursor([1])
+            )
+
+    def test_compiles_row_values(self):
+        sql, bindings = (
+            QueryBuilder(SQLiteGrammar, table="items")
+            .get_grammar()
+            .compile_cursor_where([("price", "<"), ("items.id", "<")], [2, 7])
+        )
+
+        self.assertEqual(sql, """("items"."price", "items"."id") < ('?', '?')""")
+        self.assertEqual(bindings, [2, 7])
+
+    def test_compiles_without_row_values(self):
+        sql, bindings = (
+            QueryBuilder(MSSQLGrammar, table="items")
+            .get_grammar()
+            .compile_cursor_where([("price", "<"), ("id", ">")], [2, 7])
+        )
+
+        self.assertEqual(
+            sql,
+            "(([items].[price] < '?') OR ([items].[price] = '?' AND [items].[id] > '?'))",
+        )
+        self.assertEqual(bindings, [2, 2, 7])
@@ -0,0 +1,52 @@
+from src.masoniteorm.schema.platforms import SQLitePlatform
+from tests.utils import SQLiteTestCase
+
+
+class TestSQLiteBuilderEstimatedCount(SQLiteTestCase):
+    schema = (
+        "CREATE TABLE items (id INTEGER PRIMARY KEY AUTOINCREMENT, name TEXT, price INTEGER)",
+        "CREATE INDEX items_price_index ON items (price)",
+    )
+
+    def setUp(self):
+        super().setUp()
+        self.insert_items(10)
+
+    def insert_items(self, amount):
+        self.insert(
+            "INSERT INTO items (name, price) VALUES (?, ?)",
+            [(f"item-{i}", i) for i in range(1, amount + 1)],
+        )
+
+    def test_estimate_reads_analyze_statistics(self):
+        self.execute("ANALYZE")
+        # Rows added after ANALYZE are not in the statistics yet
+        self.insert_items(5)
+
+        self.assertEqual(self.get_builder().count(approximate=True), 10)
+        self.assertEqual(self.get_builder().estimated_count(), 10)
+        self.assertEqual(self.get_builder().count(), 15)
+
+    def test_estimate_without_statistics_counts_rows(self):
+        self.assertEqual(self.get_builder().count(approximate=True), 10)
+
+    def test_filtered_estimate_counts_rows(self):
+        self.execute("ANALYZE")
+
+        self.assertEqual(
+            self.get_builder().where("price", ">", 7).count(approximate=True), 3
+        )
+
+    def test_estimate_is_ignored_for_columns(self):
+        builder = self.get_builder()
+        self.assertIs(builder.count("price", approximate=True), builder)
+
+    def test_process_estimated_count(self):
+        platform = SQLitePlatform()
+
+        self.assertEqual(
+            platform.process_estimated_count([{"stat": "120 1"}, {"stat": "120"}]),
+            120,
+        )
+        self.assertIsNone(platform.process_estimated_count([]))
+        self.assertIsNone(platform.process_estimated_count(None))
@@ -0,0 +1,58 @@
+from unittest import mock
+
+from src.masoniteorm.models import Model
+from src.masoniteorm.scopes import SoftDeleteScope
+from tests.utils import SQLiteTestCase
+
+
+class Item(Model):
+    __table__ = "items"
+    __timestamps__ = False
+
+
+class TestSQLiteBuilderExists(SQLiteTestCase):
+    schema = (
+        "CREATE TABLE items (id INTEGER PRIMARY KEY AUTOINCREMENT, name TEXT, deleted_at TEXT)",
+    )
+
+    def setUp(self):
+        super().setUp()
+        self.insert(
+            "INSERT INTO items (name, deleted_at) VALUES (?, ?)",
+            [("kept", None), ("trashed", "2020-01-01 00:00:00")],
+        )
+
+    def test_exists(self):
+        self.assertIs(self.get_builder().where("name", "kept").exists(), True)
+        self.assertIs(self.get_builder().where("name", "missing").exists(), False)
+
+    def test_doesnt_exist(self):
+        self.assertIs(self.get_builder().where("name", "missing").doesnt_exist(), True)
+        self.assertIs(self.get_builder().where("name", "kept").doesnt_exist(), False)
+
+    def test_exists_respects_global_scopes(self):
+        builder = self.get_builder().set_global_scope(SoftDeleteScope())
+        self.assertFalse(builder.where("name", "trashed").exists())
+
+        builder = self.get_builder().set_global_scope(SoftDeleteScope())
+        self.assertTrue(builder.with_trashed().where("name", "trashed").exists())
+
+    def test_exists_does_not_hydrate_models(self):
+        with mock.patch.object(Item, "hydrate") as hydrate:
+            self.assertTrue(self.get_builder(model=Item()).exists())
+
+        hydrate.assert_not_called()
+
+    def test_exists_compiles_select_exists(self):
+        self.assertEqual(
+            self.get_builder().where("name", "kept").order_by("id").exists(query=True),
+            """SELECT EXISTS(SELECT 1 FROM "items" WHERE "items"."name" = 'kept') AS m_exists_reserved""",
+        )
+
+    def test_builder_is_unchanged_after_exists(self):
+        builder = self.get_builder().select("name").where("id", ">", 0).order_by("id")
+        sql = builder.to_sql()
+
+        self.assertTrue(builder.exists())
+        self.assertEqual(builder.to_sql(), sql)
+        self.assertEqual([row["name"] for row in builder.get()], ["kept", "trashed"])
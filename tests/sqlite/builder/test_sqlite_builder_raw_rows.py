@@ -0,0 +1,68 @@
+from unittest import mock
+
+from src.masoniteorm.collection import Collection
+from src.masoniteorm.models import Model
+from src.masoniteorm.scopes import SoftDeleteScope
+from tests.utils import SQLiteTestCase
+
+
+class Item(Model):
+    __table__ = "items"
+    __timestamps__ = False
+
+
+class TestSQLiteBuilderRawRows(SQLiteTestCase):
+    schema = (
+        "CREATE TABLE items (id INTEGER PRIMARY KEY AUTOINCREMENT, name TEXT, price INTEGER, deleted_at TEXT)",
+    )
+
+    def setUp(self):
+        super().setUp()
+        self.insert(
+            "INSERT INTO items (name, price, deleted_at) VALUES (?, ?, ?)",
+            [("pen", 2, None), ("book", 10, None), ("lamp", 25, "2020-01-01")],
+        )
+
+    def test_get_dicts_does_not_hydrate(self):
+        with mock.patch.object(Item, "hydrate") as hydrate:
+            rows = (
+                self.get_builder(model=Item()).order_by("id").get_dicts(["id", "name"])
+            )
+
+        hydrate.assert_not_called()
+        self.assertEqual(
+            rows,
+            [
+                {"id": 1, "name": "pen"},
+                {"id": 2, "name": "book"},
+                {"id": 3, "name": "lamp"},
+            ],
+        )
+
+    def test_get_tuples(self):
+        rows = (
+            self.get_builder()
+            .where("price", ">", 5)
+            .order_by("id")
+            .get_tuples(["name", "price"])
+        )
+
+        self.assertEqual(rows, [("book", 10), ("lamp", 25)])
+
+    def test_values_selects_only_the_column(self):
+        builder = self.get_builder().select("id", "price").order_by("id")
+
+        self.assertEqual(builder.values("name"), ["pen", "book", "lamp"])
+
+    def test_values_respect_global_scopes(self):
+        builder = self.get_builder().set_global_scope(SoftDeleteScope())
+
+        self.assertEqual(builder.order_by("id").values("name"), ["pen", "book"])
+
+    def test_pluck(self):
+        names = self.get_builder().order_by("id").pluck("name")
+        prices = self.get_builder().pluck("price", "name")
+
+        self.assertIsInstance(names, Collection)
+        self.assertEqual(names.all(), ["pen", "book", "lamp"])
+        self.assertEqual(prices.all(), {"pen": 2, "book": 10, "lamp": 25})
@@ -0,0 +1,61 @@
+import unittest
+
+from config.database import DATABASES
+from src.masoniteorm.collection import Collection
+from src.masoniteorm.models import Model
+from src.masoniteorm.query import QueryBuilder
+from src.masoniteorm.query.grammars import SQLiteGrammar
+
+
+class User(Model):
+    __connection__ = "dev"
+    __timestamps__ = False
+
+
+class TestSQLiteBuilderStreaming(unittest.TestCase):
+    def get_builder(self, table="users", model=User):
+        return QueryBuilder(
+            grammar=SQLiteGrammar,
+            connection="dev",
+            table=table,
+            model=model,
+            connection_details=DATABASES,
+        ).on("dev")
+
+    def test_chunk_uses_bindings(self):
+        chunks = list(self.get_builder().where("name", "Joe").chunk(2))
+
+        self.assertTrue(chunks)
+        for users in chunks:
+            self.assertIsInstance(users, Collection)
+            self.assertLessEqual(users.count(), 2)
+            for user in users:
+                self.assertEqual(user.name, "Joe")
+
+    def test_chunk_sizes(self):
+        total = self.get_builder().count()
+        chunks = list(self.get_builder().chunk(5))
+
+        self.assertEqual(sum(chunk.count() for chunk in chunks), total)
+        self.assertTrue(all(chunk.count() == 5 for chunk in chunks[:-1]))
+
+    def test_cursor_yields_models(self):
+        users = list(self.get_builder().order_by("id").cursor(chunk_size=3))
+
+        self.assertEqual(len(users), self.get_builder().count())
+        self.assertIsInstance(users[0], User)
+        self.assertEqual(
+            [user.id for user in users],
+            [user.id for user in self.get_builder().order_by("id").get()],
+        )
+
+    def test_cursor_without_model_yields_dictionaries(self):
+        row = next(self.get_builder(model=None).select("id").cursor())
+
+        self.assertEqual(list(row.keys()), ["id"])
+
+    def test_model_cursor(self):
+        user = next(User.where("name", "Joe").cursor())
+
+        self.assertIsInstance(user, User)
+        self.assertEqual(user.name, "Joe")
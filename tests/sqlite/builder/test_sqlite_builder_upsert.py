@@ -0,0 +1,54 @@
+from src.masoniteorm.exceptions import QueryException
+from tests.utils import SQLiteTestCase
+
+
+class TestSQLiteBuilderUpsert(SQLiteTestCase):
+    table = "products"
+    schema = (
+        "CREATE TABLE products (sku TEXT PRIMARY KEY, name TEXT, price REAL)",
+        "INSERT INTO products (sku, name, price) VALUES ('a', 'Hammer', 5)",
+    )
+
+    def fetch(self):
+        return super().fetch("SELECT sku, name, price FROM products ORDER BY sku")
+
+    def test_inserts_and_updates(self):
+        count = self.get_builder().upsert(
+            [
+                {"sku": "a", "name": "Claw Hammer", "price": 7},
+                {"sku": "b", "name": "Saw", "price": 12},
+            ],
+            unique_by=["sku"],
+        )
+
+        self.assertEqual(count, 2)
+        self.assertEqual(self.fetch(), [("a", "Claw Hammer", 7), ("b", "Saw", 12)])
+
+    def test_only_updates_given_columns(self):
+        self.get_builder().upsert(
+            [{"sku": "a", "name": "Claw Hammer", "price": 7}],
+            unique_by="sku",
+            update=["price"],
+        )
+
+        self.assertEqual(self.fetch(), [("a", "Hammer", 7)])
+
+    def test_splits_rows_into_batches(self):
+        rows = [{"sku": f"sku-{i:04}", "name": "Nail", "price": i} for i in range(2500)]
+        builder = self.get_builder()
+
+        self.assertEqual(len(builder.get_batches(rows, 3, batch_size=1000)), 3)
+        self.assertEqual(builder.upsert(rows, unique_by=["sku"], batch_size=1000), 2500)
+        self.assertEqual(len(self.fetch()), 2501)
+
+    def test_batches_run_in_one_transaction(self):
+        rows = [
+            {"sku": "c", "name": "Drill", "price": 40},
+            # The second batch fails on a column that does not exist
+            {"sku": "d", "name": "Level", "missing_column": 1},
+        ]
+
+        with self.assertRaises(QueryException):
+            self.get_builder().upsert(rows, unique_by=["sku"], batch_size=1)
+
+        self.assertEqual(self.fetch(), [("a", "Hammer", 5)])
@@ -0,0 +1,96 @@
+from unittest import mock
+
+from src.masoniteorm.pagination import TotalsCache
+from src.masoniteorm.query import QueryBuilder
+from tests.utils import SQLiteTestCase
+
+
+class TestSQLiteBuilderWindowPagination(SQLiteTestCase):
+    schema = (
+        "CREATE TABLE items (id INTEGER PRIMARY KEY AUTOINCREMENT, name TEXT, price INTEGER)",
+    )
+
+    def setUp(self):
+        super().setUp()
+        self.insert(
+            "INSERT INTO items (name, price) VALUES (?, ?)",
+            [(f"item-{i}", i) for i in range(1, 11)],
+        )
+
+        QueryBuilder.totals_cache, self.previous = (
+            TotalsCache(),
+            QueryBuilder.totals_cache,
+        )
+
+    def tearDown(self):
+        QueryBuilder.totals_cache = self.previous
+        super().tearDown()
+
+    def test_window_count_runs_one_query(self):
+        with mock.patch.object(QueryBuilder, "count") as count:
+            paginator = (
+                self.get_builder()
+                .where("price", ">", 3)
+                .paginate(3, 2, window_count=True)
+            )
+
+        count.assert_not_called()
+        self.assertEqual(paginator.total, 7)
+        self.assertEqual(paginator.last_page, 3)
+        self.assertEqual([row["id"] for row in paginator.result], [7, 8, 9])
+        self.assertNotIn("m_total_reserved", paginator.result[0])
+        self.assertEqual(paginator.result[0]["name"], "item-7")
+
+    def test_window_count_keeps_selected_columns(self):
+        paginator = self.get_builder().select("name").paginate(4, window_count=True)
+
+        self.assertEqual(paginator.total, 10)
+        self.assertEqual(paginator.result[0], {"name": "item-1"})
+
+    def test_window_count_counts_when_the_page_is_empty(self):
+        paginator = self.get_builder().paginate(5, 4, window_count=True)
+
+        self.assertEqual(paginator.total, 10)
+        self.assertEqual(paginator.count, 0)
+
+    def test_cached_totals_skip_the_count(self):
+        first = self.get_builder().where("price", ">", 3).paginate(3, cache_total=60)
+
+        with mock.patch.object(QueryBuilder, "count") as count:
+            second = (
+                self.get_builder().where("price", ">", 3).paginate(3, 2, cache_total=60)
+            )
+
+        count.assert_not_called()
+        self.assertEqual(first.total, 7)
+        self.assertEqual(second.total, 7)
+        self.assertEqual([row["id"] for row in second.result], [7, 8, 9])
+
+    def test_totals_are_cached_by_filter(self):
+        self.get_builder().where("price", ">", 3).paginate(3, cache_total=60)
+        paginator = (
+            self.get_builder().where("price", ">", 8).paginate(3, cache_total=60)
+        )
+
+        self.assertEqual(paginator.total, 2)
+
+    def test_window_totals_are_cached(self):
+        self.get_builder().paginate(3, window_count=True, cache_total=60)
+
+        with mock.patch.object(QueryBuilder, "count") as count:
+            paginator = self.get_builder().paginate(
+                3, 2, window_count=True, cache_total=60
+            )
+
+        count.assert_not_called()
+        self.assertEqual(paginator.total, 10)
+        self.assertNotIn("m_total_reserved", paginator.result[0])
+
+    def test_totals_expire(self):
+        cache = TotalsCache()
+        with mock.patch.object(TotalsCache, "_now", return_value=100):
+            cache.set("key", 10, 30)
+            self.assertEqual(cache.get("key"), 10)
+
+        with mock.patch.object(TotalsCache, "_now", return_value=130):
+            self.assertIsNone(cache.get("key"))
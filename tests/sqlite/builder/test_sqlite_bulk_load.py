@@ -0,0 +1,46 @@
+from src.masoniteorm.exceptions import QueryException
+from tests.utils import SQLiteTestCase
+
+
+class TestSQLiteBulkLoad(SQLiteTestCase):
+    schema = (
+        "CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT UNIQUE, price REAL)",
+    )
+
+    def test_loads_dictionaries_from_a_generator(self):
+        rows = ({"name": f"item {i}", "price": i * 1.5} for i in range(2500))
+
+        count = self.get_builder().bulk_load(rows, batch_size=1000)
+
+        self.assertEqual(count, 2500)
+        self.assertEqual(self.fetch("SELECT COUNT(*) FROM items"), [(2500,)])
+        self.assertEqual(
+            self.fetch("SELECT name, price FROM items WHERE name = 'item 2'"),
+            [("item 2", 3.0)],
+        )
+
+    def test_loads_tuples_with_columns(self):
+        count = self.get_builder().bulk_load(
+            [("hammer", None), ("saw", 9.99)], columns=["name", "price"]
+        )
+
+        self.assertEqual(count, 2)
+        self.assertEqual(
+            self.fetch("SELECT name, price FROM items ORDER BY id"),
+            [("hammer", None), ("saw", 9.99)],
+        )
+
+    def test_tuples_require_columns(self):
+        with self.assertRaises(ValueError):
+            self.get_builder().bulk_load([("hammer", 1)])
+
+    def test_empty_iterable(self):
+        self.assertEqual(self.get_builder().bulk_load([]), 0)
+
+    def test_failed_load_is_rolled_back(self):
+        rows = [("hammer", 1), ("saw", 2), ("hammer", 3)]
+
+        with self.assertRaises(QueryException):
+            self.get_builder().bulk_load(rows, columns=["name", "price"], batch_size=2)
+
+        self.assertEqual(self.fetch("SELECT COUNT(*) FROM items"), [(0,)])
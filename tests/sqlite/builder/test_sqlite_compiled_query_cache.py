@@ -0,0 +1,103 @@
+import unittest
+
+from src.masoniteorm.query import CompiledQueryCache, QueryBuilder
+from src.masoniteorm.query.grammars import MySQLGrammar, SQLiteGrammar
+
+
+class TestCompiledQueryCache(unittest.TestCase):
+    def setUp(self):
+        self.cache = CompiledQueryCache(maxsize=8)
+        QueryBuilder.compiled_cache, self.previous = (
+            self.cache,
+            QueryBuilder.compiled_cache,
+        )
+
+    def tearDown(self):
+        QueryBuilder.compiled_cache = self.previous
+
+    def get_builder(self, grammar=SQLiteGrammar):
+        return QueryBuilder(grammar, table="users")
+
+    def compile(self, query, cache=True):
+        QueryBuilder.compiled_cache = self.cache if cache else CompiledQueryCache(0)
+        builder = query(self.get_builder())
+        sql = builder.to_qmark()
+        QueryBuilder.compiled_cache = self.cache
+        return sql, list(builder._bindings)
+
+    def assertCompilesLikeTheGrammar(self, query):
+        self.assertEqual(self.compile(query), self.compile(query, cache=False))
+
+    def test_hits_return_the_same_sql_with_new_bindings(self):
+        first = self.compile(lambda b: b.where("name", "Joe").where("age", ">", 20))
+        second = self.compile(lambda b: b.where("name", "Bob").where("age", ">", 30))
+
+        self.assertEqual(first[0], second[0])
+        self.assertEqual(second[1], ["Bob", 30])
+        self.assertEqual(self.cache.stats()["hits"], 1)
+        self.assertEqual(self.cache.stats()["misses"], 1)
+
+    def test_matches_the_grammar(self):
+        queries = [
+            lambda b: b.select("id", "name as username").where("id", 1),
+            lambda b: b.where("name", "like", "J%").or_where("age", "<", 3),
+            lambda b: b.where_in("id", [1, 2, 3]).where_not_in("age", [4]),
+            lambda b: b.where_null("email").where_not_null("name"),
+            lambda b: b.where_raw("age > ? AND age < ?", [1]).where("id", 2),
+            lambda b: b.where_column("name", "email").where("id", True),
+            lambda b: b.between("age", 1, 5).where("id", 3),
+            lambda b: b.join("posts", "users.id", "=", "posts.user_id")
+            .order_by("id", "desc")
+            .group_by("name")
+            .limit(10)
+            .offset(5),
+            lambda b: b.order_by_raw("FIELD(id, ?)", [7]).where("id", 4),
+            lambda b: b.where(lambda q: q.where("age", 2).or_where("age", 3)),
+            lambda b: b.select_raw("COUNT(*) AS total").where("id", 5),
+            lambda b: b.where_in("id", lambda q: q.select("id").table("posts")),
+        ]
+
+        for query in queries:
+            self.assertCompilesLikeTheGrammar(query)
+            # Second time round comes from the cache
+            self.assertCompilesLikeTheGrammar(query)
+
+    def test_in_list_arity_is_part_of_the_shape(self):
+        two = self.compile(lambda b: b.where_in("id", [1, 2]))
+        three = self.compile(lambda b: b.where_in("id", [1, 2, 3]))
+
+        self.assertNotEqual(two[0], three[0])
+        self.assertEqual(three[1], ["1", "2", "3"])
+        self.assertEqual(self.cache.stats()["misses"], 2)
+
+    def test_value_types_are_part_of_the_shape(self):
+        for value in (1, 1.0, True):
+            self.assertCompilesLikeTheGrammar(
+                lambda b: b.group_by("name").having("total", ">", value)
+            )
+
+        self.assertEqual(self.cache.stats()["misses"], 3)
+
+    def test_grammar_is_part_of_the_shape(self):
+        self.compile(lambda b: b.where("id", 1))
+        QueryBuilder(MySQLGrammar, table="users").where("id", 1).to_qmark()
+
+        self.assertEqual(self.cache.stats()["misses"], 2)
+
+    def test_subqueries_are_not_cached(self):
+        self.compile(
+            lambda b: b.where_in("id", lambda q: q.select("id").table("posts"))
+        )
+
+        # Only the subquery compiled on its own is cached
+        self.assertEqual(self.cache.stats()["size"], 1)
+        self.assertEqual(self.cache.stats()["uncacheable"], 1)
+
+    def test_least_recently_used_shapes_are_evicted(self):
+        for amount in range(1, 11):
+            self.compile(lambda b: b.where_in("id", list(range(amount))))
+
+        self.assertEqual(self.cache.stats()["size"], 8)
+
+        self.compile(lambda b: b.where_in("id", [1]))
+        self.assertEqual(self.cache.stats()["hits"], 0)
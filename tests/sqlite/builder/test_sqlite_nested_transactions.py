@@ -0,0 +1,86 @@
+from config.database import DB
+from src.masoniteorm.connections import SQLiteConnection
+from src.masoniteorm.query import QueryBuilder
+from tests.utils import SQLiteTestCase
+
+
+class TestSQLiteNestedTransactions(SQLiteTestCase):
+    schema = ("CREATE TABLE items (name TEXT)",)
+
+    def setUp(self):
+        super().setUp()
+        self.builder = self.get_builder()
+
+    def fetch(self):
+        return [row[0] for row in super().fetch("SELECT name FROM items ORDER BY name")]
+
+    def test_rolling_back_an_inner_transaction_keeps_the_outer_changes(self):
+        self.builder.begin()
+        self.builder.create({"name": "outer"})
+
+        self.builder.begin()
+        self.builder.create({"name": "inner"})
+        self.builder.rollback()
+
+        self.builder.create({"name": "retried"})
+        self.builder.commit()
+
+        self.assertEqual(self.fetch(), ["outer", "retried"])
+
+    def test_committed_inner_transactions_are_undone_by_the_outer_rollback(self):
+        self.builder.begin()
+        self.builder.begin()
+        self.builder.create({"name": "inner"})
+        self.builder.commit()
+        self.builder.rollback()
+
+        self.assertEqual(self.fetch(), [])
+
+    def test_savepoint_as_the_first_statement(self):
+        self.builder.begin()
+        self.builder.begin()
+        self.builder.create({"name": "inner"})
+        self.builder.commit()
+        self.builder.commit()
+
+        self.assertEqual(self.fetch(), ["inner"])
+
+    def test_nested_global_transactions(self):
+        users = lambda: QueryBuilder(connection="dev", table="users")
+        total = users().count()
+
+        with DB.transaction("dev"):
+            users().create({"name": "outer", "email": "outer"})
+            try:
+                with DB.transaction("dev"):
+                    users().create({"name": "inner", "email": "inner"})
+                    raise ValueError()
+            except ValueError:
+                pass
+
+            self.assertEqual(users().count(), total + 1)
+            # Undo the outer transaction and leave an empty one for the block to commit
+            DB.rollback("dev")
+            DB.begin_transaction("dev")
+
+        self.assertEqual(users().count(), total)
+
+    def test_connections_opened_in_a_global_transaction_join_it(self):
+        users = lambda: QueryBuilder(connection="dev", table="users")
+        total = users().count()
+        connection = SQLiteConnection(
+            **DB.get_connection_information("dev"), name="dev"
+        )
+
+        DB.begin_transaction("dev")
+        try:
+            connection.query(
+                "INSERT INTO users (name, email) VALUES ('?', '?')",
+                ("joined", "joined"),
+            )
+            self.assertEqual(users().count(), total + 1)
+        finally:
+            DB.rollback("dev")
+
+        self.assertEqual(users().count(), total)
+        self.assertEqual(connection.open, 0)
@@ -1,4 +1,6 @@
+import asyncio
 import inspect
+import threading
 import unittest
 
 from config.database import DATABASES
@@ -51,3 +53,33 @@ class BaseTestQueryRelationships(unittest.TestCase):
     def test_chunking(self):
         for users in self.get_builder().chunk(10):
             self.assertIsInstance(users, Collection)
+
+    def test_global_transactions_are_local_to_the_thread(self):
+        DB.begin_transaction("dev")
+        seen = []
+
+        thread = threading.Thread(
+            target=lambda: seen.append(self.get_builder().in_transaction())
+        )
+        thread.start()
+        thread.join()
+
+        self.assertTrue(self.get_builder().in_transaction())
+        DB.rollback("dev")
+        self.assertEqual(seen, [False])
+        self.assertFalse(self.get_builder().in_transaction())
+
+    def test_global_transactions_are_local_to_the_asyncio_task(self):
+        async def in_transaction(begin):
+            if begin:
+                DB.begin_transaction("dev")
+            await asyncio.sleep(0)
+            result = self.get_builder().in_transaction()
+            if begin:
+                DB.rollback("dev")
+            return result
+
+        async def run():
+            return await asyncio.gather(in_transaction(True), in_transaction(False))
+
+        self.assertEqual(asyncio.run(run()), [True, False])
@@ -0,0 +1,95 @@
+import os
+import tempfile
+import threading
+import unittest
+
+from src.masoniteorm.connections import SQLiteConnection
+
+
+class TestSQLiteConnection(unittest.TestCase):
+    def tearDown(self):
+        SQLiteConnection.close_thread_connections()
+
+    def get_connection(self, database=":memory:", **options):
+        options.setdefault("persistent", True)
+        return SQLiteConnection(database=database, name="test", options=options)
+
+    def test_memory_database_persists_between_queries(self):
+        connection = self.get_connection()
+        connection.query("CREATE TABLE items (name TEXT)")
+        connection.query("INSERT INTO items (name) VALUES (?)", ("hammer",))
+
+        result = self.get_connection().query("SELECT name FROM items")
+
+        self.assertEqual(result, [{"name": "hammer"}])
+
+    def test_connection_is_reused_in_the_same_thread(self):
+        first = self.get_connection().make_connection()._connection
+        second = self.get_connection().make_connection()._connection
+
+        self.assertIs(first, second)
+
+    def test_each_thread_gets_its_own_connection(self):
+        main = self.get_connection().make_connection()._connection
+        connections = []
+
+        def connect():
+            connections.append(self.get_connection().make_connection()._connection)
+            SQLiteConnection.close_thread_connections()
+
+        thread = threading.Thread(target=connect)
+        thread.start()
+        thread.join()
+
+        self.assertIsNot(connections[0], main)
+
+    def test_connections_are_closed_when_the_thread_exits(self):
+        connections = []
+
+        def connect():
+            connections.append(self.get_connection().make_connection()._connection)
+
+        thread = threading.Thread(target=connect)
+        thread.start()
+        thread.join()
+
+        with self.assertRaises(Exception):
+            connections[0].total_changes
+
+    def test_pragmas_are_applied_on_open(self):
+        directory = tempfile.mkdtemp()
+        database = os.path.join(directory, "pragmas.sqlite3")
+        connection = self.get_connection(
+            database,
+            cached_statements=512,
+            pragmas={
+                "journal_mode": "WAL",
+                "synchronous": "NORMAL",
+                "cache_size": -8000,
+                "temp_store": "MEMORY",
+            },
+        )
+
+        self.assertEqual(
+            connection.query("PRAGMA journal_mode", results=1)["journal_mode"], "wal"
+        )
+        self.assertEqual(
+            connection.query("PRAGMA synchronous", results=1)["synchronous"], 1
+        )
+        self.assertEqual(
+            connection.query("PRAGMA cache_size", results=1)["cache_size"], -8000
+        )
+        self.assertEqual(
+            connection.query("PRAGMA temp_store", results=1)["temp_store"], 2
+        )
+
+    def test_connections_are_not_persistent_by_default(self):
+        connection = SQLiteConnection(database=":memory:", name="test")
+        connection.query("CREATE TABLE items (name TEXT)")
+
+        self.assertEqual(connection.open, 0)
+        self.assertEqual(SQLiteConnection.get_thread_connections(), {})
+        with self.assertRaises(Exception):
+            SQLiteConnection(database=":memory:", name="test").query(
+                "SELECT name FROM items"
+            )
@@ -60,6 +60,27 @@ class BaseInsertGrammarTest:
         )()
         self.assertEqual(to_sql, sql)
 
+    def test_can_compile_bulk_load(self):
+        self.builder.dry = True
+        to_sql = self.builder.bulk_load([{"name": "Joe", "email": "joe@email.com"}])
+
+        sql = getattr(
+            self, inspect.currentframe().f_code.co_name.replace("test_", "")
+        )()
+        self.assertEqual(to_sql, sql)
+
+    def test_can_compile_upsert(self):
+        to_sql = self.builder.upsert(
+            [{"email": "joe@email.com", "name": "Joe"}],
+            unique_by=["email"],
+            query=True,
+        ).to_sql()
+
+        sql = getattr(
+            self, inspect.currentframe().f_code.co_name.replace("test_", "")
+        )()
+        self.assertEqual(to_sql, sql)
+
 
 class TestSqliteUpdateGrammar(BaseInsertGrammarTest, unittest.TestCase):
 
@@ -96,3 +117,15 @@ class TestSqliteUpdateGrammar(BaseInsertGrammarTest, unittest.TestCase):
         self.builder.create(name="Joe").to_sql()
         """
         return """INSERT INTO "users" ("name") VALUES ('?'), ('?'), ('?')"""
+
+    def can_compile_bulk_load(self):
+        """
+        self.builder.bulk_load([{"name": "Joe", "email": "joe@email.com"}])
+        """
+        return """INSERT INTO "users" ("name", "email") VALUES ('?', '?')"""
+
+    def can_compile_upsert(self):
+        """
+        self.builder.upsert([{"email": "joe@email.com", "name": "Joe"}], unique_by=["email"])
+        """
+        return """INSERT INTO "users" ("email", "name") VALUES ('joe@email.com', 'Joe') ON CONFLICT ("email") DO UPDATE SET "name" = EXCLUDED.\"name\""""
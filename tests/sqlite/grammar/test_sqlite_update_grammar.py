@@ -68,6 +68,17 @@ class BaseTestCaseUpdateGrammar:
 
         self.assertEqual(to_sql, sql)
 
+    def test_can_compile_bulk_update(self):
+        to_sql = self.builder.bulk_update(
+            [{"id": 1, "name": "Joe", "age": 20}, {"id": 2, "name": "Bob", "age": 30}],
+            query=True,
+        ).to_sql()
+
+        sql = getattr(
+            self, inspect.currentframe().f_code.co_name.replace("test_", "")
+        )()
+        self.assertEqual(to_sql, sql)
+
 
 class TestSqliteUpdateGrammar(BaseTestCaseUpdateGrammar, unittest.TestCase):
 
@@ -114,3 +125,12 @@ class TestSqliteUpdateGrammar(BaseTestCaseUpdateGrammar, unittest.TestCase):
         builder.decrement('age', 20).to_sql()
         """
         return """UPDATE "users" SET "age" = "age" - '20'"""
+
+    def can_compile_bulk_update(self):
+        """
+        builder.bulk_update([
+            {'id': 1, 'name': 'Joe', 'age': 20},
+            {'id': 2, 'name': 'Bob', 'age': 30},
+        ]).to_sql()
+        """
+        return """UPDATE "users" SET "name" = CASE "id" WHEN '1' THEN 'Joe' WHEN '2' THEN 'Bob' END, "age" = CASE "id" WHEN '1' THEN '20' WHEN '2' THEN '30' END WHERE "id" IN ('1', '2')"""
@@ -1,8 +1,14 @@
+import os
+import shutil
+import sqlite3
+import tempfile
+import unittest
 from unittest import mock
 
 from src.masoniteorm.connections.ConnectionFactory import ConnectionFactory
 from src.masoniteorm.connections.MySQLConnection import MySQLConnection
 from src.masoniteorm.connections.SQLiteConnection import SQLiteConnection
+from src.masoniteorm.query import QueryBuilder
 from src.masoniteorm.schema.platforms import MySQLPlatform
 
 
@@ -55,3 +61,58 @@ class MockConnectionFactory(ConnectionFactory):
         "sqlite": MockSQLiteConnection,
         "oracle": "",
     }
+
+
+class SQLiteTestCase(unittest.TestCase):
+    """Runs every test on a new SQLite database built from the 'schema' statements."""
+
+    connection = "sqlite_test"
+    driver = "sqlite"
+    table = "items"
+    schema = ()
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.database = os.path.join(self.directory, "database.sqlite3")
+        self.details = {
+            "default": self.connection,
+            self.connection: {"driver": self.driver, "database": self.database},
+        }
+        self.execute(*self.schema)
+
+    def tearDown(self):
+        SQLiteConnection.close_thread_connections()
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def get_builder(self, table=None, model=None, **kwargs):
+        return QueryBuilder(
+            connection=self.connection,
+            table=table or self.table,
+            model=model,
+            connection_details=self.details,
+            **kwargs
+        )
+
+    def execute(self, *statements):
+        connection = sqlite3.connect(self.database)
+        try:
+            for statement in statements:
+                connection.execute(statement)
+            connection.commit()
+        finally:
+            connection.close()
+
+    def insert(self, statement, rows):
+        connection = sqlite3.connect(self.database)
+        try:
+            connection.executemany(statement, rows)
+            connection.commit()
+        finally:
+            connection.close()
+
+    def fetch(self, query):
+        connection = sqlite3.connect(self.database)
+        try:
+            return connection.execute(query).fetchall()
+        finally:
+            connection.close()